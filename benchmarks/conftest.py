@@ -0,0 +1,105 @@
+"""Fixtures for Xantech performance benchmarks.
+
+Benchmarks run the real coordinator and entities against the TCP amplifier
+emulator with serial line timing, and are not part of the default test run::
+
+    pytest benchmarks --benchmark-output=benchmark-results.json
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+import platform
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pyxantech import async_get_amp_controller
+
+from custom_components.xantech.coordinator import XantechCoordinator
+from tests.emulator import AmpEmulator
+
+DEFAULT_OUTPUT = 'benchmark-results.json'
+
+# simulated serial line speed used by every benchmark
+BENCHMARK_BAUD = 9600
+
+type CoordinatorFactory = Callable[..., Awaitable[XantechCoordinator]]
+
+_results: list[dict[str, Any]] = []
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the benchmark result file option."""
+    parser.addoption(
+        '--benchmark-output',
+        default=DEFAULT_OUTPUT,
+        help='JSON file benchmark results are written to',
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Write all recorded benchmark results to the output file."""
+    if not _results:
+        return
+    output = Path(session.config.getoption('--benchmark-output'))
+    report = {
+        'created': datetime.now(UTC).isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'baud': BENCHMARK_BAUD,
+        'results': _results,
+    }
+    output.write_text(json.dumps(report, indent=2) + '\n')
+
+
+@pytest.fixture
+def record_benchmark() -> Callable[..., None]:
+    """Return a function recording one named benchmark result."""
+
+    def _record(name: str, **metrics: Any) -> None:
+        _results.append({'name': name, **metrics})
+
+    return _record
+
+
+@pytest.fixture
+async def emulated_coordinator(
+    hass: HomeAssistant, socket_enabled: None
+) -> AsyncGenerator[CoordinatorFactory]:
+    """Return a factory building coordinators polling an emulated amp."""
+    emulators: list[AmpEmulator] = []
+    amps: list[Any] = []
+
+    async def _create(
+        amp_type: str,
+        units: int = 1,
+        zones: int | None = None,
+        **kwargs: Any,
+    ) -> XantechCoordinator:
+        emulator = AmpEmulator(amp_type, units=units, baud=BENCHMARK_BAUD)
+        await emulator.start()
+        emulators.append(emulator)
+
+        amp = await async_get_amp_controller(amp_type, emulator.url, hass.loop)
+        amps.append(amp)
+
+        zone_ids = sorted(emulator.zones)[:zones]
+        return XantechCoordinator(
+            hass,
+            amp,
+            f'{amp_type}_{len(emulators)}',
+            zone_ids,
+            amp_type=amp_type,
+            **kwargs,
+        )
+
+    yield _create
+
+    for amp in amps:
+        amp._protocol._transport.close()
+    for emulator in emulators:
+        await emulator.stop()
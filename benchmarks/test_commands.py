@@ -0,0 +1,154 @@
+"""Benchmark command to confirmed state latency against the emulated amp."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import contextlib
+import statistics
+import time
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.xantech.coordinator import plan_writes
+
+from .conftest import CoordinatorFactory
+
+COMMANDS = 10
+
+
+def _summary(latencies: list[float]) -> dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        'p50_ms': round(statistics.median(ordered) * 1000, 1),
+        'p95_ms': round(ordered[int(len(ordered) * 0.95) - 1] * 1000, 1),
+        'max_ms': round(ordered[-1] * 1000, 1),
+    }
+
+
+@pytest.mark.parametrize('confirm_writes', [False, True])
+@pytest.mark.parametrize('during_poll', [False, True])
+async def test_command_latency(
+    emulated_coordinator: CoordinatorFactory,
+    record_benchmark: Callable[..., None],
+    confirm_writes: bool,
+    during_poll: bool,
+) -> None:
+    """Measure time from a volume command until the cache shows the new value.
+
+    With during_poll, every command is issued while a full poll of 16 zones is
+    queued on the bus.
+    """
+    coordinator = await emulated_coordinator(
+        'xantech8', units=2, confirm_writes=confirm_writes
+    )
+    await coordinator.async_refresh()
+    zone_id = coordinator.zone_ids[0]
+
+    latencies: list[float] = []
+    for step in range(COMMANDS):
+        volume = 10 + step
+        poll = None
+        if during_poll:
+            poll = asyncio.create_task(coordinator.async_refresh())
+            await asyncio.sleep(0)
+
+        started = time.perf_counter()
+        await coordinator.async_set_zone_volume(zone_id, volume)
+        latencies.append(time.perf_counter() - started)
+        assert coordinator.data[zone_id]['volume'] == volume
+
+        if poll is not None:
+            await poll
+
+    record_benchmark(
+        'command_latency',
+        confirm_writes=confirm_writes,
+        during_poll=during_poll,
+        commands=COMMANDS,
+        **_summary(latencies),
+    )
+
+
+@pytest.mark.parametrize('batched', [False, True])
+@pytest.mark.parametrize('amp_type', ['monoprice6', 'xantech8'])
+async def test_scene_latency(
+    emulated_coordinator: CoordinatorFactory,
+    record_benchmark: Callable[..., None],
+    amp_type: str,
+    batched: bool,
+) -> None:
+    """Measure applying power, source and volume to six zones at once.
+
+    Batched writes are pipelined on monoprice6 and framed on xantech8;
+    otherwise every change is its own pyxantech round trip.
+    """
+    coordinator = await emulated_coordinator(amp_type, zones=6)
+    await coordinator.async_refresh()
+    scene = {
+        zone_id: {'power': True, 'source': 2, 'volume': 15}
+        for zone_id in coordinator.zone_ids
+    }
+
+    with contextlib.ExitStack() as stack:
+        if not batched:
+            for name in ('supports_pipelining', 'supports_framing'):
+                stack.enter_context(
+                    patch(
+                        f'custom_components.xantech.coordinator.{name}',
+                        return_value=False,
+                    )
+                )
+        started = time.perf_counter()
+        await coordinator.async_apply_changes(scene)
+        elapsed = time.perf_counter() - started
+
+    assert all(coordinator.data[zone_id]['volume'] == 15 for zone_id in scene)
+    record_benchmark(
+        'scene_latency',
+        amp_type=amp_type,
+        batched=batched,
+        commands=3 * len(scene),
+        elapsed_ms=round(elapsed * 1000, 1),
+    )
+
+
+@pytest.mark.parametrize('amp_type', ['monoprice6', 'xantech8'])
+async def test_announcement_cycle(
+    emulated_coordinator: CoordinatorFactory,
+    record_benchmark: Callable[..., None],
+    amp_type: str,
+) -> None:
+    """Measure snapshot, announcement and restore across every zone.
+
+    The snapshot is read from the cache and the restore diffed against it,
+    so only the announcement changes are written back.
+    """
+    coordinator = await emulated_coordinator(amp_type, units=2)
+    await coordinator.async_refresh()
+    announcement = {
+        zone_id: {'power': True, 'source': 4, 'volume': 25}
+        for zone_id in coordinator.zone_ids
+    }
+
+    started = time.perf_counter()
+    snapshot = coordinator.snapshot_zones(coordinator.zone_ids)
+    snapshot_elapsed = time.perf_counter() - started
+    await coordinator.async_apply_changes(announcement)
+    restore_started = time.perf_counter()
+    operations = await coordinator.async_write_batch(
+        plan_writes(coordinator.data, snapshot)
+    )
+    elapsed = time.perf_counter() - started
+
+    assert coordinator.snapshot_zones(coordinator.zone_ids) == snapshot
+    record_benchmark(
+        'announcement_cycle',
+        amp_type=amp_type,
+        zones=len(snapshot),
+        snapshot_ms=round(snapshot_elapsed * 1000, 2),
+        restore_ms=round((time.perf_counter() - restore_started) * 1000, 1),
+        restore_bus_operations=operations,
+        elapsed_ms=round(elapsed * 1000, 1),
+    )
@@ -0,0 +1,133 @@
+"""Benchmark entity state cost: CPU per state write and memory per zone."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import gc
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockEntityPlatform
+
+from custom_components.xantech.coordinator import XantechCoordinator
+from custom_components.xantech.media_player import ZoneMediaPlayer
+from custom_components.xantech.number import (
+    ZoneBalanceNumber,
+    ZoneBassNumber,
+    ZoneTrebleNumber,
+)
+
+WRITES = 2000
+SOURCES = {source: f'Source {source}' for source in range(1, 9)}
+
+
+def _zone_status(zone_id: int) -> dict[str, Any]:
+    return {
+        'zone': zone_id,
+        'power': True,
+        'source': 1,
+        'volume': 20,
+        'mute': False,
+        'treble': 7,
+        'bass': 7,
+        'balance': 32,
+        'linked': False,
+        'paged': False,
+    }
+
+
+def _build_zones(
+    hass: HomeAssistant, zones: int
+) -> tuple[XantechCoordinator, list[Any]]:
+    """Create a coordinator with cached data and every entity of each zone."""
+    zone_ids = [unit * 10 + zone for unit in range(1, 7) for zone in range(1, 9)]
+    zone_ids = zone_ids[:zones]
+    coordinator = XantechCoordinator(hass, MagicMock(), 'bench', zone_ids)
+    coordinator.data = {zone_id: _zone_status(zone_id) for zone_id in zone_ids}
+
+    entry = MagicMock()
+    entities: list[Any] = []
+    for zone_id in zone_ids:
+        name = f'Zone {zone_id}'
+        entities.append(ZoneMediaPlayer(coordinator, entry, zone_id, name, SOURCES))
+        entities.extend(
+            number_cls(
+                coordinator=coordinator,
+                entry=entry,
+                zone_id=zone_id,
+                zone_name=name,
+                max_value=14,
+            )
+            for number_cls in (ZoneBassNumber, ZoneTrebleNumber, ZoneBalanceNumber)
+        )
+    return coordinator, entities
+
+
+@pytest.mark.parametrize('entity_type', ['media_player', 'number'])
+async def test_state_write_cpu(
+    hass: HomeAssistant,
+    record_benchmark: Callable[..., None],
+    entity_type: str,
+) -> None:
+    """Measure CPU time of one entity state write, including _zone_status."""
+    coordinator, entities = _build_zones(hass, 1)
+    entity = entities[0] if entity_type == 'media_player' else entities[1]
+    entity.hass = hass
+    entity.platform = MockEntityPlatform(hass)
+    entity.entity_id = f'{entity_type}.bench_zone'
+
+    started = time.process_time()
+    for step in range(WRITES):
+        # alternate the value so every write is a real state change
+        coordinator.data[11]['volume'] = 20 + step % 2
+        coordinator.data[11]['bass'] = 7 + step % 2
+        entity.async_write_ha_state()
+    write_cpu = (time.process_time() - started) / WRITES
+
+    started = time.process_time()
+    for _ in range(WRITES):
+        entity._zone_status  # noqa: B018
+    status_cpu = (time.process_time() - started) / WRITES
+
+    record_benchmark(
+        'state_write_cpu',
+        entity_type=entity_type,
+        writes=WRITES,
+        cpu_us_per_write=round(write_cpu * 1e6, 1),
+        cpu_us_per_zone_status=round(status_cpu * 1e6, 2),
+    )
+
+
+@pytest.mark.parametrize('zones', [6, 8, 16, 48])
+async def test_memory_per_zone(
+    hass: HomeAssistant,
+    record_benchmark: Callable[..., None],
+    zones: int,
+) -> None:
+    """Measure memory held by cached zone state and entities per zone."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    coordinator, entities = _build_zones(hass, zones)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(
+        stat.size_diff
+        for stat in after.compare_to(before, 'filename')
+        if stat.size_diff
+    )
+    assert len(coordinator.data) == zones
+    assert len(entities) == zones * 4
+
+    record_benchmark(
+        'memory_per_zone',
+        zones=zones,
+        entities_per_zone=4,
+        bytes_total=allocated,
+        bytes_per_zone=allocated // zones,
+    )
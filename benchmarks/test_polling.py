@@ -0,0 +1,69 @@
+"""Benchmark poll cycle wall time against the emulated amp."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import statistics
+import time
+from typing import Any
+
+import pytest
+
+from .conftest import CoordinatorFactory
+
+CYCLES = 3
+
+
+@pytest.mark.parametrize(
+    ('zones', 'amp_type', 'amps', 'units', 'unit_status'),
+    [
+        (6, 'monoprice6', 1, 1, False),
+        (6, 'monoprice6', 1, 1, True),
+        (8, 'xantech8', 1, 1, False),
+        (16, 'xantech8', 1, 2, False),
+        # 48 zones: two amps with three units each, each amp on its own bus
+        (48, 'xantech8', 2, 3, False),
+    ],
+)
+async def test_poll_cycle(
+    emulated_coordinator: CoordinatorFactory,
+    record_benchmark: Callable[..., None],
+    zones: int,
+    amp_type: str,
+    amps: int,
+    units: int,
+    unit_status: bool,
+) -> None:
+    """Measure the wall time of a full refresh of every zone."""
+    coordinators = [
+        await emulated_coordinator(amp_type, units=units) for _ in range(amps)
+    ]
+    if not unit_status:
+        # force per-zone queries even where unit inquiries are supported
+        for coordinator in coordinators:
+            coordinator.amp_type = None
+    assert sum(len(c.zone_ids) for c in coordinators) == zones
+
+    durations: list[float] = []
+    for _ in range(CYCLES):
+        started = time.perf_counter()
+        await asyncio.gather(*(c.async_refresh() for c in coordinators))
+        durations.append(time.perf_counter() - started)
+
+        for coordinator in coordinators:
+            assert coordinator.last_update_success
+            assert len(coordinator.data) == len(coordinator.zone_ids)
+
+    result: dict[str, Any] = {
+        'zones': zones,
+        'amp_type': amp_type,
+        'amps': amps,
+        'strategy': 'unit_status' if unit_status else 'per_zone',
+        'cycles': CYCLES,
+        'mean_ms': round(statistics.mean(durations) * 1000, 1),
+        'min_ms': round(min(durations) * 1000, 1),
+        'max_ms': round(max(durations) * 1000, 1),
+        'per_zone_ms': round(statistics.mean(durations) * 1000 / zones, 1),
+    }
+    record_benchmark('poll_cycle', **result)
@@ -3,31 +3,65 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, SupportsResponse
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.typing import ConfigType
 from pyxantech import async_get_amp_controller
 from serial import SerialException
 
 from .const import (
     CONF_AMP_TYPE,
+    CONF_CONFIRM_WRITES,
     CONF_ENABLE_AUDIO_CONTROLS,
+    CONF_IDLE_DECAY,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_POLL_BUDGET,
+    CONF_POLLING_MODE,
     CONF_PORT,
+    CONF_PUSH_UPDATES,
     CONF_SCAN_INTERVAL,
     CONF_SOURCES,
+    CONF_TARGET_UTILIZATION,
     CONF_ZONES,
+    DEFAULT_IDLE_DECAY,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_POLL_BUDGET,
+    DEFAULT_POLLING_MODE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TARGET_UTILIZATION,
     DOMAIN,
     PLATFORMS,
+    POLLING_MODE_ADAPTIVE,
+    POLLING_MODE_AUTO,
+    SERVICE_APPLY_PRESET,
+    SERVICE_BULK_SET,
+    SERVICE_DELETE_PRESET,
     SERVICE_RESTORE,
+    SERVICE_SAVE_PRESET,
     SERVICE_SNAPSHOT,
 )
 from .coordinator import XantechCoordinator
+from .orchestrator import async_get_orchestrator
+from .polling import AdaptivePollInterval, AutoPollInterval
+from .services import (
+    BULK_SET_SCHEMA,
+    PRESET_SCHEMA,
+    SAVE_PRESET_SCHEMA,
+    ZONES_SCHEMA,
+    async_apply_preset,
+    async_bulk_set,
+    async_delete_preset,
+    async_restore,
+    async_save_preset,
+    async_snapshot,
+)
+from .storage import PresetStore, SnapshotStore, ZoneStateStore
 
 if TYPE_CHECKING:
     from pyxantech import AmpControlBase
@@ -36,6 +70,15 @@ LOG = logging.getLogger(__name__)
 
 type XantechConfigEntry = ConfigEntry[XantechData]
 
+SERVICES = (
+    SERVICE_SNAPSHOT,
+    SERVICE_RESTORE,
+    SERVICE_BULK_SET,
+    SERVICE_SAVE_PRESET,
+    SERVICE_APPLY_PRESET,
+    SERVICE_DELETE_PRESET,
+)
+
 
 class XantechData:
     """Runtime data for Xantech integration."""
@@ -47,6 +90,8 @@ class XantechData:
         amp_type: str,
         sources: dict[int, str],
         enable_audio_controls: bool = False,
+        presets: PresetStore | None = None,
+        snapshots: SnapshotStore | None = None,
     ) -> None:
         """Initialize runtime data."""
         self.coordinator = coordinator
@@ -54,6 +99,8 @@ class XantechData:
         self.amp_type = amp_type
         self.sources = sources
         self.enable_audio_controls = enable_audio_controls
+        self.presets = presets
+        self.snapshots = snapshots
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -79,6 +126,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: XantechConfigEntry) -> b
     # get scan interval from options, with fallback to default
     scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
 
+    # adaptive polling speeds up after activity and backs off when idle; auto
+    # polling picks the shortest interval the measured link can sustain
+    poll_policy: AdaptivePollInterval | AutoPollInterval | None = None
+    polling_mode = entry.options.get(CONF_POLLING_MODE, DEFAULT_POLLING_MODE)
+    if polling_mode == POLLING_MODE_ADAPTIVE:
+        poll_policy = AdaptivePollInterval(
+            idle_interval=scan_interval,
+            min_interval=entry.options.get(
+                CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+            ),
+            max_interval=entry.options.get(
+                CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+            ),
+            decay=entry.options.get(CONF_IDLE_DECAY, DEFAULT_IDLE_DECAY),
+        )
+    elif polling_mode == POLLING_MODE_AUTO:
+        poll_policy = AutoPollInterval(
+            initial_interval=scan_interval,
+            min_interval=entry.options.get(
+                CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+            ),
+            max_interval=entry.options.get(
+                CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+            ),
+            target=entry.options.get(
+                CONF_TARGET_UTILIZATION, DEFAULT_TARGET_UTILIZATION
+            )
+            / 100,
+        )
+
     try:
         amp = await async_get_amp_controller(amp_type, port, hass.loop)
         if not amp:
@@ -93,7 +170,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: XantechConfigEntry) -> b
 
     LOG.info('Connected to %s amplifier at %s', amp_type, port)
 
+    # tone controls are only polled when their entities exist
+    enable_audio_controls = entry.data.get(CONF_ENABLE_AUDIO_CONTROLS, False)
+
     # create coordinator
+    store = ZoneStateStore(hass, entry.entry_id)
     amp_name = f'{amp_type}_{port}'.replace('/', '_')
     coordinator = XantechCoordinator(
         hass,
@@ -101,13 +182,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: XantechConfigEntry) -> b
         amp_name,
         zone_ids,
         scan_interval,
+        amp_type=amp_type,
+        poll_policy=poll_policy,
+        confirm_writes=entry.options.get(CONF_CONFIRM_WRITES, False),
+        store=store,
+        connect=partial(async_get_amp_controller, amp_type, port, hass.loop),
+        orchestrator=async_get_orchestrator(hass),
+        poll_tones=enable_audio_controls,
+        poll_budget=entry.options.get(CONF_POLL_BUDGET, DEFAULT_POLL_BUDGET) or None,
     )
-
-    # fetch initial data
-    await coordinator.async_config_entry_first_refresh()
-
-    # get feature settings
-    enable_audio_controls = entry.data.get(CONF_ENABLE_AUDIO_CONTROLS, False)
+    entry.async_on_unload(coordinator.orchestrator.async_register(coordinator))
+
+    # start from the last known zone states and reconcile in the background;
+    # without a cache, wait for the amp as before
+    if cached := await store.async_load():
+        coordinator.async_restore_cached_data(cached)
+        entry.async_create_background_task(
+            hass,
+            _async_start_coordinator(entry, coordinator),
+            f'{DOMAIN}_{amp_name}_first_refresh',
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+        await _async_start_coordinator(entry, coordinator)
+
+    presets = PresetStore(hass, entry.entry_id)
+    await presets.async_load()
+    snapshots = SnapshotStore(hass, entry.entry_id)
+    await snapshots.async_load()
 
     # store runtime data
     entry.runtime_data = XantechData(
@@ -116,6 +218,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: XantechConfigEntry) -> b
         amp_type=amp_type,
         sources=sources,
         enable_audio_controls=enable_audio_controls,
+        presets=presets,
+        snapshots=snapshots,
     )
 
     # register services
@@ -136,12 +240,32 @@ async def async_unload_entry(hass: HomeAssistant, entry: XantechConfigEntry) ->
 
     if unload_ok and not hass.config_entries.async_entries(DOMAIN):
         # cleanup services if no more entries
-        for service in (SERVICE_SNAPSHOT, SERVICE_RESTORE):
+        for service in SERVICES:
             hass.services.async_remove(DOMAIN, service)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: XantechConfigEntry) -> None:
+    """Remove the cached zone states, presets and snapshots of a deleted entry."""
+    await ZoneStateStore(hass, entry.entry_id).async_remove()
+    await PresetStore(hass, entry.entry_id).async_remove()
+    await SnapshotStore(hass, entry.entry_id).async_remove()
+
+
+async def _async_start_coordinator(
+    entry: XantechConfigEntry, coordinator: XantechCoordinator
+) -> None:
+    """Refresh from the amp (if still needed) and enable push updates."""
+    if coordinator.stale_zones:
+        await coordinator.async_refresh()
+
+    # let the amp report keypad and zone changes instead of waiting for a poll
+    if entry.options.get(CONF_PUSH_UPDATES, False):
+        await coordinator.async_start_push_updates()
+        entry.async_on_unload(coordinator.async_stop_push_updates)
+
+
 async def async_update_options(hass: HomeAssistant, entry: XantechConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -152,36 +276,39 @@ async def _async_register_services(hass: HomeAssistant) -> None:
     if hass.services.has_service(DOMAIN, SERVICE_SNAPSHOT):
         return  # services already registered
 
-    async def async_snapshot_service(call: ServiceCall) -> None:
-        """Handle snapshot service call."""
-        entity_ids = call.data.get(ATTR_ENTITY_ID, [])
-        if isinstance(entity_ids, str):
-            entity_ids = [entity_ids]
-
-        entity_registry = er.async_get(hass)
-
-        for entity_id in entity_ids:
-            if hass.states.get(entity_id) and entity_registry.async_get(entity_id):
-                LOG.debug('Snapshot requested for %s', entity_id)
-                # dispatch to entity's snapshot method via event
-                hass.bus.async_fire(
-                    f'{DOMAIN}_snapshot',
-                    {'entity_id': entity_id},
-                )
-
-    async def async_restore_service(call: ServiceCall) -> None:
-        """Handle restore service call."""
-        entity_ids = call.data.get(ATTR_ENTITY_ID, [])
-        if isinstance(entity_ids, str):
-            entity_ids = [entity_ids]
-
-        for entity_id in entity_ids:
-            if hass.states.get(entity_id):
-                LOG.debug('Restore requested for %s', entity_id)
-                hass.bus.async_fire(
-                    f'{DOMAIN}_restore',
-                    {'entity_id': entity_id},
-                )
-
-    hass.services.async_register(DOMAIN, SERVICE_SNAPSHOT, async_snapshot_service)
-    hass.services.async_register(DOMAIN, SERVICE_RESTORE, async_restore_service)
+    hass.services.async_register(
+        DOMAIN, SERVICE_SNAPSHOT, partial(async_snapshot, hass), schema=ZONES_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE,
+        partial(async_restore, hass),
+        schema=ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_SET,
+        partial(async_bulk_set, hass),
+        schema=BULK_SET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SAVE_PRESET,
+        partial(async_save_preset, hass),
+        schema=SAVE_PRESET_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PRESET,
+        partial(async_apply_preset, hass),
+        schema=PRESET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_PRESET,
+        partial(async_delete_preset, hass),
+        schema=PRESET_SCHEMA,
+    )
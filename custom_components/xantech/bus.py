@@ -0,0 +1,179 @@
+"""Prioritized access to the amplifier serial bus."""
+
+from __future__ import annotations
+
+import logging
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from typing import TYPE_CHECKING, Any
+
+from .stats import TransportStats
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from .orchestrator import IOBudget
+
+LOG = logging.getLogger(__name__)
+
+# lower values run first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 10
+
+PRIORITY_NAMES = {PRIORITY_COMMAND: 'command', PRIORITY_POLL: 'poll'}
+
+
+class WaitStats:
+    """Running statistics of how long operations waited for the bus."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, wait: float) -> None:
+        """Record the wait time of one operation."""
+        self.count += 1
+        self.total += wait
+        self.max = max(self.max, wait)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        avg = self.total / self.count if self.count else 0.0
+        return {
+            'count': self.count,
+            'avg_wait_ms': round(avg * 1000, 1),
+            'max_wait_ms': round(self.max * 1000, 1),
+        }
+
+
+class BusScheduler:
+    """Run amplifier I/O one operation at a time, highest priority first.
+
+    Polls are scheduled one zone (or unit) query at a time at poll priority,
+    so a user command arriving mid-poll waits for at most one query instead of
+    the rest of the poll cycle.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        stats: TransportStats | None = None,
+        budget: IOBudget | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            name: Name used in log messages (usually the amp name)
+            stats: Statistics round-trip times and failures are recorded in
+            budget: Cap on operations in flight shared with the other amps
+        """
+        self.name = name
+        self.stats = stats if stats is not None else TransportStats()
+        self.budget = budget
+        self._busy = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self.wait_stats: dict[int, WaitStats] = {
+            priority: WaitStats() for priority in PRIORITY_NAMES
+        }
+        # seconds the amp spent on operations of each priority
+        self.busy_time: dict[int, float] = dict.fromkeys(PRIORITY_NAMES, 0.0)
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of operations waiting for the bus."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def async_run[T](
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        priority: int = PRIORITY_POLL,
+    ) -> T:
+        """Run an amplifier operation once the bus is free.
+
+        Args:
+            func: Coroutine function performing the I/O
+            args: Arguments passed to func
+            priority: PRIORITY_COMMAND or PRIORITY_POLL
+
+        Returns:
+            The result of func
+        """
+        enqueued = time.monotonic()
+        await self._async_acquire(priority)
+        wait = time.monotonic() - enqueued
+        self.wait_stats.setdefault(priority, WaitStats()).record(wait)
+        if wait > 1.0:
+            LOG.debug(
+                '%s waited %.2fs for the %s bus',
+                PRIORITY_NAMES.get(priority),
+                wait,
+                self.name,
+            )
+        operation = getattr(func, '__name__', 'unknown').removeprefix('async_')
+        kind = PRIORITY_NAMES.get(priority, str(priority))
+        try:
+            async with self.budget or contextlib.nullcontext():
+                started = time.monotonic()
+                try:
+                    return await func(*args)
+                except TimeoutError:
+                    self.stats.record_timeout()
+                    raise
+                except Exception:
+                    self.stats.record_error()
+                    raise
+                finally:
+                    elapsed = time.monotonic() - started
+                    self.stats.record(operation, kind, elapsed)
+                    self.busy_time[priority] = (
+                        self.busy_time.get(priority, 0.0) + elapsed
+                    )
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int) -> None:
+        """Wait until this caller owns the bus."""
+        if not self._busy and not self._waiters:
+            self._busy = True
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # ownership was handed over just before cancellation
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the bus to the highest priority waiter, if any."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return queue statistics for diagnostics."""
+        return {
+            'queue_depth': self.queue_depth,
+            'busy': self._busy,
+            'busy_seconds': {
+                PRIORITY_NAMES.get(priority, str(priority)): round(busy, 3)
+                for priority, busy in self.busy_time.items()
+            },
+            'wait': {
+                PRIORITY_NAMES.get(priority, str(priority)): stats.as_dict()
+                for priority, stats in self.wait_stats.items()
+            },
+        }
@@ -29,16 +29,35 @@ from serial import SerialException
 import voluptuous as vol
 
 from .const import (
+    CHAINABLE_AMP_TYPES,
     CONF_AMP_TYPE,
+    CONF_CONFIRM_WRITES,
     CONF_ENABLE_AUDIO_CONTROLS,
+    CONF_IDLE_DECAY,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_POLL_BUDGET,
+    CONF_POLLING_MODE,
     CONF_PORT,
+    CONF_PUSH_UPDATES,
     CONF_SCAN_INTERVAL,
     CONF_SOURCES,
+    CONF_TARGET_UTILIZATION,
+    CONF_UNITS,
     CONF_ZONES,
     DEFAULT_AMP_TYPE,
+    DEFAULT_IDLE_DECAY,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_NAME,
+    DEFAULT_POLL_BUDGET,
+    DEFAULT_POLLING_MODE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TARGET_UTILIZATION,
+    DEFAULT_UNITS,
     DOMAIN,
+    MAX_UNITS,
+    POLLING_MODES,
     SUPPORTED_AMP_TYPES,
 )
 
@@ -64,7 +83,13 @@ class XantechConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             port = user_input[CONF_PORT]
             amp_type = user_input[CONF_AMP_TYPE]
+            user_input[CONF_UNITS] = int(user_input.get(CONF_UNITS, DEFAULT_UNITS))
 
+            # all units chained on a port share one entry, transport and bus
+            if user_input[CONF_UNITS] > 1 and amp_type not in CHAINABLE_AMP_TYPES:
+                errors['base'] = 'units_not_supported'
+
+        if user_input is not None and not errors:
             # test connection to amplifier
             try:
                 amp = await async_get_amp_controller(amp_type, port, self.hass.loop)
@@ -100,6 +125,14 @@ class XantechConfigFlow(ConfigFlow, domain=DOMAIN):
                             translation_key='amp_type',
                         )
                     ),
+                    vol.Optional(CONF_UNITS, default=DEFAULT_UNITS): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=MAX_UNITS,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
                 }
             ),
             errors=errors,
@@ -128,7 +161,8 @@ class XantechConfigFlow(ConfigFlow, domain=DOMAIN):
 
         # default zone config for the amp type
         default_zones = self._get_default_zones_text(
-            self._data.get(CONF_AMP_TYPE, DEFAULT_AMP_TYPE)
+            self._data.get(CONF_AMP_TYPE, DEFAULT_AMP_TYPE),
+            self._data.get(CONF_UNITS, DEFAULT_UNITS),
         )
 
         return self.async_show_form(
@@ -233,23 +267,35 @@ class XantechConfigFlow(ConfigFlow, domain=DOMAIN):
                 continue
         return sources
 
-    def _get_default_zones_text(self, amp_type: str) -> str:
-        """Get default zones text for an amplifier type."""
+    def _get_default_zones_text(self, amp_type: str, units: int = 1) -> str:
+        """Get default zones text for an amplifier type and number of units."""
         if amp_type == 'monoprice6':
-            return (
+            text = (
                 '11: Living Room\n12: Kitchen\n13: Master Bedroom\n'
                 '14: Office\n15: Patio\n16: Dining Room'
             )
-        if amp_type == 'dax88':
-            return (
+            zones_per_unit = 6
+        elif amp_type == 'dax88':
+            text = (
                 '11: Living Room\n12: Kitchen\n13: Master Bedroom\n'
                 '14: Office\n15: Patio\n16: Dining Room\n17: Garage\n18: Basement'
             )
-        # default to xantech8
-        return (
-            '11: Living Room\n12: Kitchen\n13: Master Bedroom\n'
-            '14: Office\n15: Patio\n16: Dining Room'
-        )
+            zones_per_unit = 8
+        else:
+            # default to xantech8
+            text = (
+                '11: Living Room\n12: Kitchen\n13: Master Bedroom\n'
+                '14: Office\n15: Patio\n16: Dining Room'
+            )
+            zones_per_unit = 8
+
+        # daisy-chained units continue at 21 and 31
+        for unit in range(2, units + 1):
+            text += ''.join(
+                f'\n{unit}{zone}: Zone {unit}{zone}'
+                for zone in range(1, zones_per_unit + 1)
+            )
+        return text
 
     def _get_default_sources_text(self, amp_type: str) -> str:
         """Get default sources text for an amplifier type."""
@@ -323,21 +369,31 @@ class XantechOptionsFlow(OptionsFlow):
         self,
         user_input: dict[str, Any] | None = None,
     ) -> ConfigFlowResult:
-        """Configure polling interval."""
+        """Configure polling interval and adaptive polling."""
         if user_input is not None:
-            return self.async_create_entry(title='', data=user_input)
+            return self.async_create_entry(
+                title='', data={**self.config_entry.options, **user_input}
+            )
 
-        current_scan_interval = self.config_entry.options.get(
-            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-        )
+        options = self.config_entry.options
 
         return self.async_show_form(
             step_id='polling',
             data_schema=vol.Schema(
                 {
+                    vol.Optional(
+                        CONF_POLLING_MODE,
+                        default=options.get(CONF_POLLING_MODE, DEFAULT_POLLING_MODE),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=POLLING_MODES,
+                            mode=SelectSelectorMode.LIST,
+                            translation_key='polling_mode',
+                        )
+                    ),
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
-                        default=current_scan_interval,
+                        default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
                     ): NumberSelector(
                         NumberSelectorConfig(
                             min=5,
@@ -347,6 +403,79 @@ class XantechOptionsFlow(OptionsFlow):
                             unit_of_measurement='seconds',
                         )
                     ),
+                    vol.Optional(
+                        CONF_MIN_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=60,
+                            step=1,
+                            mode=NumberSelectorMode.SLIDER,
+                            unit_of_measurement='seconds',
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=30,
+                            max=900,
+                            step=30,
+                            mode=NumberSelectorMode.SLIDER,
+                            unit_of_measurement='seconds',
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_IDLE_DECAY,
+                        default=options.get(CONF_IDLE_DECAY, DEFAULT_IDLE_DECAY),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1.1,
+                            max=4.0,
+                            step=0.1,
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_TARGET_UTILIZATION,
+                        default=options.get(
+                            CONF_TARGET_UTILIZATION, DEFAULT_TARGET_UTILIZATION
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=5,
+                            max=90,
+                            step=5,
+                            mode=NumberSelectorMode.SLIDER,
+                            unit_of_measurement='%',
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_POLL_BUDGET,
+                        default=options.get(CONF_POLL_BUDGET, DEFAULT_POLL_BUDGET),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=30,
+                            step=0.5,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement='seconds',
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_CONFIRM_WRITES,
+                        default=options.get(CONF_CONFIRM_WRITES, False),
+                    ): BooleanSelector(),
+                    vol.Optional(
+                        CONF_PUSH_UPDATES,
+                        default=options.get(CONF_PUSH_UPDATES, False),
+                    ): BooleanSelector(),
                 }
             ),
         )
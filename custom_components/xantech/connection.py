@@ -0,0 +1,128 @@
+"""Connection supervision for Xantech Multi-Zone Amplifier."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+from .protocol import amp_transport
+
+if TYPE_CHECKING:
+    from pyxantech import AmpControlBase
+
+LOG = logging.getLogger(__name__)
+
+# seconds between reconnect attempts: doubles per failure up to the maximum
+DEFAULT_MIN_BACKOFF: Final = 5.0
+DEFAULT_MAX_BACKOFF: Final = 300.0
+
+# +/- fraction of randomness added to each backoff delay
+BACKOFF_JITTER: Final = 0.2
+
+# errors meaning the amp or the link to it is gone (SerialException is an OSError)
+TRANSPORT_ERRORS: Final = (TimeoutError, OSError)
+
+
+def is_transport_error(err: BaseException) -> bool:
+    """Return True if the error means the amp could not be reached."""
+    return isinstance(err, TRANSPORT_ERRORS)
+
+
+def transport_closed(amp: AmpControlBase) -> bool:
+    """Return True if the serial or socket transport of the amp is closed."""
+    transport = amp_transport(amp)
+    return transport is None or transport.is_closing()
+
+
+class ConnectionSupervisor:
+    """Track whether the amp is reachable and pace attempts to reach it again.
+
+    Only transitions are logged: one warning when the link is lost and one
+    message when it is restored, however many attempts happen in between.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_backoff: float = DEFAULT_MIN_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+    ) -> None:
+        """Initialize the supervisor.
+
+        Args:
+            name: Name used in log messages (usually the amp name)
+            min_backoff: Delay before the first reconnect attempt, in seconds
+            max_backoff: Longest delay between reconnect attempts, in seconds
+        """
+        self.name = name
+        self.min_backoff = min_backoff
+        self.max_backoff = max(max_backoff, min_backoff)
+        self.online = True
+        self.failures = 0
+        self.reconnects = 0
+        self.last_error: str | None = None
+        self._offline_since: float | None = None
+
+    def next_delay(self) -> float:
+        """Return the jittered backoff delay after the current failure count."""
+        exponent = max(self.failures - 1, 0)
+        delay = min(self.min_backoff * 2**exponent, self.max_backoff)
+        delay *= random.uniform(1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER)
+        return min(delay, self.max_backoff)
+
+    def record_failure(self, err: BaseException) -> float:
+        """Record a failed attempt to reach the amp.
+
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        self.failures += 1
+        self.last_error = str(err) or type(err).__name__
+        delay = self.next_delay()
+        if self.online:
+            self.online = False
+            self._offline_since = time.monotonic()
+            LOG.warning(
+                'Lost connection to %s (%s), retrying with backoff',
+                self.name,
+                self.last_error,
+            )
+        else:
+            LOG.debug(
+                '%s still unreachable after %d attempts, next in %.0fs',
+                self.name,
+                self.failures,
+                delay,
+            )
+        return delay
+
+    def record_success(self) -> bool:
+        """Record that the amp answered.
+
+        Returns:
+            True if this restored a lost connection
+        """
+        if self.online:
+            return False
+        offline_for = time.monotonic() - (self._offline_since or time.monotonic())
+        LOG.info(
+            'Connection to %s restored after %.0fs (%d failed attempts)',
+            self.name,
+            offline_for,
+            self.failures,
+        )
+        self.online = True
+        self.failures = 0
+        self._offline_since = None
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the connection state for diagnostics."""
+        return {
+            'online': self.online,
+            'failures': self.failures,
+            'reconnects': self.reconnects,
+            'last_error': self.last_error,
+        }
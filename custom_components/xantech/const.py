@@ -14,15 +14,49 @@ CONF_SOURCES: Final = 'sources'
 CONF_SERIAL_CONFIG: Final = 'rs232'
 CONF_ZONE_NAME: Final = 'name'
 CONF_DEFAULT_SOURCE: Final = 'default_source'
+CONF_UNITS: Final = 'units'
 
 # Options
 CONF_SCAN_INTERVAL: Final = 'scan_interval'
+CONF_POLLING_MODE: Final = 'polling_mode'
+CONF_MIN_SCAN_INTERVAL: Final = 'min_scan_interval'
+CONF_MAX_SCAN_INTERVAL: Final = 'max_scan_interval'
+CONF_IDLE_DECAY: Final = 'idle_decay'
+CONF_TARGET_UTILIZATION: Final = 'target_utilization'
+CONF_CONFIRM_WRITES: Final = 'confirm_writes'
+CONF_PUSH_UPDATES: Final = 'push_updates'
+CONF_POLL_BUDGET: Final = 'poll_budget'
 CONF_ENABLE_AUDIO_CONTROLS: Final = 'enable_audio_controls'
 
 # Defaults
 DEFAULT_NAME: Final = 'Xantech Multi-Zone Audio'
 DEFAULT_AMP_TYPE: Final = 'xantech8'
 DEFAULT_SCAN_INTERVAL: Final = 30
+DEFAULT_UNITS: Final = 1
+DEFAULT_MIN_SCAN_INTERVAL: Final = 5
+DEFAULT_MAX_SCAN_INTERVAL: Final = 300
+DEFAULT_IDLE_DECAY: Final = 1.5
+# percent of the time auto polling may keep the amp bus busy
+DEFAULT_TARGET_UTILIZATION: Final = 25
+# consistency poll interval while the amp pushes zone changes
+DEFAULT_PUSH_SCAN_INTERVAL: Final = 300
+# seconds between polls of the tone controls (bass, treble, balance)
+DEFAULT_TONE_SCAN_INTERVAL: Final = 300
+# seconds between power checks of zones that are off
+DEFAULT_OFF_SCAN_INTERVAL: Final = 120
+# seconds a poll cycle may spend reading zones (0 reads every zone each cycle)
+DEFAULT_POLL_BUDGET: Final = 0
+
+# Polling modes
+POLLING_MODE_FIXED: Final = 'fixed'
+POLLING_MODE_ADAPTIVE: Final = 'adaptive'
+POLLING_MODE_AUTO: Final = 'auto'
+POLLING_MODES: Final[list[str]] = [
+    POLLING_MODE_FIXED,
+    POLLING_MODE_ADAPTIVE,
+    POLLING_MODE_AUTO,
+]
+DEFAULT_POLLING_MODE: Final = POLLING_MODE_FIXED
 
 # Amplifier types supported by pyxantech
 # xantech8: MX88, MX88ai, MRC88, MRC88m, MRAUDIO8X8, MRAUDIO8X8m
@@ -44,6 +78,11 @@ SUPPORTED_AMP_TYPES: Final[list[str]] = [
     AMP_TYPE_SONANCE6,
 ]
 
+# amp types whose units can be daisy-chained on one serial port, with zones
+# 11-18 on the first unit, 21-28 on the second and 31-38 on the third
+CHAINABLE_AMP_TYPES: Final[list[str]] = [AMP_TYPE_XANTECH8, AMP_TYPE_MONOPRICE6]
+MAX_UNITS: Final = 3
+
 # Max volume level for amps
 MAX_VOLUME: Final = 38
 
@@ -55,10 +94,21 @@ DEFAULT_MAX_BALANCE: Final = 20
 # Service names
 SERVICE_SNAPSHOT: Final = 'snapshot'
 SERVICE_RESTORE: Final = 'restore'
+SERVICE_BULK_SET: Final = 'bulk_set'
+SERVICE_SAVE_PRESET: Final = 'save_preset'
+SERVICE_APPLY_PRESET: Final = 'apply_preset'
+SERVICE_DELETE_PRESET: Final = 'delete_preset'
 
 # Attributes
 ATTR_ZONE_ID: Final = 'zone_id'
 ATTR_SOURCE_ID: Final = 'source_id'
+ATTR_POWER: Final = 'power'
+ATTR_SOURCE: Final = 'source'
+ATTR_VOLUME_LEVEL: Final = 'volume_level'
+ATTR_MUTE: Final = 'mute'
+ATTR_BASS: Final = 'bass'
+ATTR_TREBLE: Final = 'treble'
+ATTR_BALANCE: Final = 'balance'
 
 # Platforms
-PLATFORMS: Final[list[str]] = ['media_player', 'number']
+PLATFORMS: Final[list[str]] = ['media_player', 'number', 'sensor']
@@ -3,22 +3,134 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+import asyncio
+import contextlib
+from datetime import datetime, timedelta
+import time
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_at
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .bus import PRIORITY_COMMAND, PRIORITY_POLL, BusScheduler
+from .connection import ConnectionSupervisor, is_transport_error, transport_closed
+from .const import (
+    DEFAULT_OFF_SCAN_INTERVAL,
+    DEFAULT_PUSH_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TONE_SCAN_INTERVAL,
+    DOMAIN,
+)
+from .polling import AdaptivePollInterval, AutoPollInterval
+from .protocol import (
+    COMMAND_ATTRIBUTES,
+    CORE_ATTRIBUTES,
+    TONE_ATTRIBUTES,
+    PipelineTimeout,
+    PushUpdateListener,
+    async_enable_push_updates,
+    async_pipeline,
+    async_query_frame,
+    async_send_frame,
+    async_unit_status,
+    attribute_query_frames,
+    close_transport,
+    pack_frames,
+    supports_attribute_queries,
+    supports_framing,
+    supports_pipelining,
+    supports_push_updates,
+    supports_unit_status,
+    zone_command,
+    zone_unit,
+)
+from .stats import TransportStats
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from pyxantech import AmpControlBase
 
+    from .orchestrator import PollOrchestrator
+    from .storage import ZoneStateStore
+
 LOG = logging.getLogger(__name__)
 
+# level attributes where only the newest requested value is worth sending
+COALESCED_ATTRIBUTES = ('volume', 'bass', 'treble', 'balance')
+
+
+def changed_attributes(
+    previous: dict[int, dict[str, Any]],
+    current: dict[int, dict[str, Any]],
+) -> dict[int, set[str]]:
+    """Return the attributes that differ between two sets of zone statuses.
+
+    Args:
+        previous: Zone statuses listeners were last notified about
+        current: New zone statuses
+
+    Returns:
+        Dictionary mapping zone_id to the names of its changed attributes
+    """
+    changes: dict[int, set[str]] = {}
+    for zone_id in previous.keys() | current.keys():
+        old = previous.get(zone_id, {})
+        new = current.get(zone_id, {})
+        if old == new:
+            continue
+        changes[zone_id] = {
+            key for key in old.keys() | new.keys() if old.get(key) != new.get(key)
+        }
+    return changes
+
+
+def plan_writes(
+    current: dict[int, dict[str, Any]],
+    desired: dict[int, dict[str, Any]],
+) -> list[tuple[int, str, Any]]:
+    """Return the writes needed to move zones from current to desired state.
+
+    Attributes already at the desired value are skipped. Zones are powered on
+    first so later changes apply to a live zone, then sources, volumes, mutes
+    and tone follow, and zones are powered off last.
+
+    Args:
+        current: Cached zone statuses
+        desired: Mapping of zone_id to {attribute: value} from COMMAND_ATTRIBUTES
+
+    Returns:
+        Ordered list of (zone_id, attribute, value) writes
+    """
+    power_on: list[tuple[int, str, Any]] = []
+    settings: list[tuple[int, str, Any]] = []
+    power_off: list[tuple[int, str, Any]] = []
+    for attribute in COMMAND_ATTRIBUTES:
+        for zone_id, state in desired.items():
+            if attribute not in state:
+                continue
+            value = state[attribute]
+            if current.get(zone_id, {}).get(attribute) == value:
+                continue
+            if attribute != 'power':
+                settings.append((zone_id, attribute, value))
+            elif value:
+                power_on.append((zone_id, attribute, value))
+            else:
+                power_off.append((zone_id, attribute, value))
+    return [*power_on, *settings, *power_off]
+
 
 class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
-    """Coordinator to manage fetching zone statuses from the amplifier."""
+    """Coordinator to manage fetching zone statuses from the amplifier.
+
+    Entities subscribe with a context naming what they display: a zone_id for
+    a whole zone, or a (zone_id, attribute) tuple for a single attribute. Only
+    listeners whose zone or attribute changed are notified, except when
+    availability changes, which notifies everyone.
+    """
 
     def __init__(
         self,
@@ -27,6 +139,16 @@ class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
         amp_name: str,
         zone_ids: list[int],
         scan_interval: int = DEFAULT_SCAN_INTERVAL,
+        amp_type: str | None = None,
+        poll_policy: AdaptivePollInterval | AutoPollInterval | None = None,
+        confirm_writes: bool = False,
+        store: ZoneStateStore | None = None,
+        connect: Callable[[], Awaitable[AmpControlBase | None]] | None = None,
+        orchestrator: PollOrchestrator | None = None,
+        poll_tones: bool = True,
+        tone_interval: float = DEFAULT_TONE_SCAN_INTERVAL,
+        off_interval: float = DEFAULT_OFF_SCAN_INTERVAL,
+        poll_budget: float | None = None,
     ) -> None:
         """Initialize the coordinator.
 
@@ -36,19 +158,86 @@ class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
             amp_name: Friendly name of the amplifier
             zone_ids: List of zone IDs to poll
             scan_interval: Polling interval in seconds
+            amp_type: pyxantech amplifier type, enables protocol specific polling
+            poll_policy: Adaptive or auto interval policy; None polls at
+                scan_interval
+            confirm_writes: Read back the changed zone after each command
+            store: Persistent cache the latest zone states are saved to
+            connect: Creates a new controller when the transport must be reopened
+            orchestrator: Staggers polls and caps bus I/O across all amps
+            poll_tones: Poll bass, treble and balance (off drops them entirely)
+            tone_interval: Seconds between polls of the tone controls
+            off_interval: Seconds between power checks of zones that are off
+            poll_budget: Seconds a cycle may spend reading zones before it
+                publishes what it has and resumes with the next zone on the
+                following cycle; None reads every zone each cycle
         """
         super().__init__(
             hass,
             LOG,
             name=f'{DOMAIN}_{amp_name}',
             update_interval=timedelta(seconds=scan_interval),
+            # polls returning identical data notify nobody
+            always_update=False,
         )
         self.amp = amp
         self.amp_name = amp_name
         self.zone_ids = zone_ids
+        self.amp_type = amp_type
+        self.poll_policy = poll_policy
+        self.confirm_writes = confirm_writes
+        self.stats = TransportStats()
+        self.orchestrator = orchestrator
+        self.poll_tones = poll_tones
+        self.tone_interval = tone_interval
+        self._next_tone_poll = 0.0
+        self.off_interval = off_interval
+        # next power check (monotonic time) of zones last seen off
+        self._off_checks: dict[int, float] = {}
+        self.poll_budget = poll_budget
+        # zones read so far in the current round-robin pass, the cycles the
+        # pass has taken, and the cycles the last complete pass took
+        self._round_polled: set[int] = set()
+        self._round_cycle = 0
+        self.round_cycles: int | None = None
+        # monotonic time each zone was last read live
+        self._zone_read_at: dict[int, float] = {}
+        # zones the current cycle tried to read
+        self._zones_attempted: set[int] = set()
+        self.bus = BusScheduler(
+            amp_name,
+            self.stats,
+            orchestrator.budget if orchestrator is not None else None,
+        )
+        self.store = store
+        self.supervisor = ConnectionSupervisor(amp_name)
+        self._connect = connect
+        self._push_listener: PushUpdateListener | None = None
+        # pending poll in this amp's orchestrator slot
+        self._unsub_slot: CALLBACK_TYPE | None = None
+        self._resume_push = False
+        self._online_interval = self.update_interval
         self._consecutive_errors = 0
         self._max_consecutive_errors = 5
 
+        # update callbacks by the context they subscribed with
+        self._context_listeners: dict[Any, list[CALLBACK_TYPE]] = {}
+
+        # state listeners were last notified about, to diff against
+        self._notified_data: dict[int, dict[str, Any]] | None = None
+        self._notified_success = True
+
+        # zones showing cached state that no live read has confirmed yet
+        self.stale_zones: set[int] = set()
+        self._confirmed_zones: set[int] = set()
+
+        # latest requested value and in-flight write per (zone_id, attribute)
+        self._write_targets: dict[tuple[int, str], Any] = {}
+        self._write_inflight: dict[tuple[int, str], asyncio.Future[None]] = {}
+
+        if poll_policy is not None:
+            self.update_interval = timedelta(seconds=poll_policy.interval)
+
     async def _async_update_data(self) -> dict[int, dict[str, Any]]:
         """Fetch data from the amplifier for all zones.
 
@@ -56,30 +245,98 @@ class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
             Dictionary mapping zone_id to zone status dict
         """
         zone_statuses: dict[int, dict[str, Any]] = {}
+        started = time.monotonic()
+        poll_busy = self.bus.busy_time[PRIORITY_POLL]
+        self._zones_attempted = set()
 
         try:
-            for zone_id in self.zone_ids:
-                try:
-                    status = await self.amp.zone_status(zone_id)
-                    if status:
-                        zone_statuses[zone_id] = status
-                    else:
-                        LOG.debug('No status returned for zone %d', zone_id)
-                except Exception:
-                    LOG.warning(
-                        'Failed to get status for zone %d', zone_id, exc_info=True
-                    )
-                    # continue with other zones even if one fails
+            # while unreachable, one cheap query decides whether to poll at all
+            if not self.supervisor.online:
+                await self._async_probe()
+
+            tones_due = self.poll_tones and started >= self._next_tone_poll
+            data = self.data or {}
+
+            # only zones with enabled entities are polled, and zones known to
+            # be off are left alone until their next power check
+            idle_zones = self.idle_zones(started)
+            zone_ids = [
+                zone_id for zone_id in self.polled_zones if zone_id not in idle_zones
+            ]
+
+            if self.poll_budget:
+                zone_statuses, pass_complete = await self._async_poll_round_robin(
+                    zone_ids, tones_due, data, started
+                )
+            else:
+                zone_statuses = await self._async_poll_zones(zone_ids, tones_due, data)
+                pass_complete = True
+
+            if not self.poll_tones:
+                zone_statuses = {
+                    zone_id: {
+                        key: value
+                        for key, value in status.items()
+                        if key not in TONE_ATTRIBUTES
+                    }
+                    for zone_id, status in zone_statuses.items()
+                }
+            elif tones_due and pass_complete:
+                self._next_tone_poll = started + self.tone_interval
+
+            for zone_id in zone_statuses:
+                self._zone_read_at[zone_id] = started
+            if isinstance(self.poll_policy, AutoPollInterval):
+                # unit inquiries also report zones nobody asked for: they
+                # share the cost, but only zones asked for can fail
+                self.poll_policy.record_cycle(
+                    zones=len(self._zones_attempted | zone_statuses.keys()),
+                    failures=len(self._zones_attempted - zone_statuses.keys()),
+                    poll_time=self.bus.busy_time[PRIORITY_POLL] - poll_busy,
+                    now=time.monotonic(),
+                    bus_time=sum(self.bus.busy_time.values()),
+                )
 
+            # zones read off are checked again after off_interval
+            for zone_id, status in zone_statuses.items():
+                if status.get('power') is False:
+                    if zone_id not in idle_zones:
+                        self._off_checks[zone_id] = started + self.off_interval
+                else:
+                    self._off_checks.pop(zone_id, None)
             # reset error counter on success
             self._consecutive_errors = 0
+            if self.supervisor.record_success():
+                self.update_interval = self._online_interval
+                if self._resume_push:
+                    self._resume_push = False
+                    await self.async_start_push_updates()
+
+            # cached zones read live are no longer stale; the rest keep their
+            # cached state until they answer
+            self._confirmed_zones |= self.stale_zones & zone_statuses.keys()
+            self.stale_zones -= zone_statuses.keys()
+            for zone_id in self.stale_zones:
+                if self.data and zone_id in self.data:
+                    zone_statuses[zone_id] = self.data[zone_id]
+
+            # zones not polled this cycle keep their cached state too
+            for zone_id in self.zone_ids:
+                if zone_id not in zone_statuses and zone_id in data:
+                    zone_statuses[zone_id] = data[zone_id]
+
+            if self.poll_policy is not None:
+                self._update_poll_interval(zone_statuses)
 
+            self.stats.poll_cycle.record(time.monotonic() - started)
             LOG.debug('Updated %d zones for %s', len(zone_statuses), self.amp_name)
             return zone_statuses
 
         except Exception as err:
             self._consecutive_errors += 1
-            if self._consecutive_errors >= self._max_consecutive_errors:
+            if is_transport_error(err):
+                self._async_link_failed(err)
+            elif self._consecutive_errors == self._max_consecutive_errors:
                 LOG.error(
                     'Failed to update %s after %d attempts',
                     self.amp_name,
@@ -90,11 +347,699 @@ class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
                 f'Error communicating with {self.amp_name}: {err}'
             ) from err
 
+    async def _async_poll_round_robin(
+        self,
+        zone_ids: list[int],
+        tones_due: bool,
+        data: dict[int, dict[str, Any]],
+        started: float,
+    ) -> tuple[dict[int, dict[str, Any]], bool]:
+        """Read zones in turn until the poll budget of this cycle is spent.
+
+        Zones are read in batches (a unit, a frame, or a single zone) in zone
+        order, skipping zones already read in the current pass. At least one
+        batch is read every cycle, so a pass always makes progress; the pass
+        is complete once every zone has been read.
+
+        Returns:
+            The zone statuses read this cycle, and whether the pass completed
+        """
+        assert self.poll_budget is not None
+        deadline = started + self.poll_budget
+        self._round_cycle += 1
+        zone_statuses: dict[int, dict[str, Any]] = {}
+        batches = self._poll_batches(
+            [zone_id for zone_id in zone_ids if zone_id not in self._round_polled]
+        )
+        for index, batch in enumerate(batches):
+            if index and time.monotonic() >= deadline:
+                break
+            try:
+                zone_statuses.update(
+                    await self._async_poll_zones(batch, tones_due, data)
+                )
+            except Exception as err:
+                if not zone_statuses or not is_transport_error(err):
+                    raise
+                # publish what answered before the link went away
+                break
+            self._round_polled.update(batch)
+        else:
+            LOG.debug(
+                'Polled all zones of %s in %d cycles',
+                self.amp_name,
+                self._round_cycle,
+            )
+            self.round_cycles = self._round_cycle
+            self._round_cycle = 0
+            self._round_polled.clear()
+            return zone_statuses, True
+        return zone_statuses, False
+
+    def _poll_batches(self, zone_ids: list[int]) -> list[list[int]]:
+        """Split zones into the smallest groups read by one exchange."""
+        if supports_unit_status(self.amp_type):
+            units: dict[int, list[int]] = {}
+            for zone_id in zone_ids:
+                units.setdefault(zone_unit(zone_id), []).append(zone_id)
+            return list(units.values())
+        size = 1
+        if zone_ids and supports_attribute_queries(self.amp_type):
+            frame = attribute_query_frames(self.amp_type, zone_ids, CORE_ATTRIBUTES)[0]
+            size = max(len(frame) // len(CORE_ATTRIBUTES), 1)
+        return [zone_ids[i : i + size] for i in range(0, len(zone_ids), size)]
+
+    @property
+    def staleness_bound(self) -> float | None:
+        """Return the longest a polled zone can go without a live read.
+
+        With a poll budget, each cycle reads at least one batch, so a pass
+        takes at most one cycle per batch. A zone read early in one pass and
+        late in the next waits at most two passes less one cycle, plus the
+        budget of the cycle reading it. Zones that are off are excluded: they
+        are checked every off_interval instead.
+
+        Returns:
+            Seconds, or None when the poll interval is not known
+        """
+        if self.update_interval is None:
+            return None
+        interval = self.update_interval.total_seconds()
+        if not self.poll_budget:
+            return interval
+        batches = max(len(self._poll_batches(self.polled_zones)), 1)
+        return (2 * batches - 1) * interval + self.poll_budget
+
+    def max_staleness(self, now: float) -> float | None:
+        """Return the age in seconds of the oldest live read of a polled zone."""
+        ages = [
+            now - self._zone_read_at[zone_id]
+            for zone_id in self.polled_zones
+            if zone_id in self._zone_read_at
+        ]
+        return round(max(ages), 1) if ages else None
+
+    async def _async_poll_zones(
+        self,
+        zone_ids: list[int],
+        tones_due: bool,
+        data: dict[int, dict[str, Any]],
+    ) -> dict[int, dict[str, Any]]:
+        """Read the given zones with the cheapest queries the protocol allows.
+
+        Args:
+            zone_ids: Zones to read
+            tones_due: Read the tone controls too
+            data: Cached zone statuses
+
+        Returns:
+            Dictionary mapping zone_id to zone status dict, for zones that answered
+        """
+        zone_statuses: dict[int, dict[str, Any]] = {}
+        self._zones_attempted.update(zone_ids)
+
+        # one inquiry per unit where the protocol supports it
+        if supports_unit_status(self.amp_type):
+            zone_statuses = await self._async_poll_units(zone_ids)
+
+        if supports_attribute_queries(self.amp_type):
+            # zones that were off only need their power checked; zones
+            # found on again are read like any other zone below
+            off_zones = [
+                zone_id
+                for zone_id in zone_ids
+                if zone_id not in zone_statuses
+                and data.get(zone_id, {}).get('power') is False
+            ]
+            zone_statuses.update(
+                (zone_id, status)
+                for zone_id, status in (
+                    await self._async_poll_attributes(off_zones, ('power',))
+                ).items()
+                if not status['power']
+            )
+
+            # between tone polls, query just the core attributes; zones
+            # never read in full still need a full read
+            if not tones_due:
+                zone_statuses.update(
+                    await self._async_poll_attributes(
+                        [
+                            zone_id
+                            for zone_id in zone_ids
+                            if zone_id not in zone_statuses
+                            and (not self.poll_tones or zone_id in data)
+                        ],
+                        CORE_ATTRIBUTES,
+                    )
+                )
+
+        # per-zone queries for everything not covered so far
+        for zone_id in zone_ids:
+            if zone_id in zone_statuses:
+                continue
+            try:
+                status = await self.bus.async_run(self.amp.zone_status, zone_id)
+                if status and self._is_reply(zone_id, status):
+                    zone_statuses[zone_id] = status
+                elif not status:
+                    # pyxantech returns None when the amp does not answer
+                    self.stats.record_timeout()
+                    LOG.debug('No status returned for zone %d', zone_id)
+            except Exception as err:
+                if is_transport_error(err) and not zone_statuses:
+                    # nothing answered this cycle: the link is down, so
+                    # skip the remaining zones
+                    raise
+                LOG.warning('Failed to get status for zone %d', zone_id, exc_info=True)
+                # continue with other zones even if one fails
+        return zone_statuses
+
+    @callback
+    def _is_reply(self, zone_id: int, status: dict[str, Any]) -> bool:
+        """Return True if a status read for zone_id really reports that zone.
+
+        pyxantech returns the first line it receives, which with push updates
+        on can be a frame the amp pushed for another zone. Such a frame is
+        applied like any pushed frame and the queried zone counts as
+        unanswered.
+        """
+        if status.get('zone', zone_id) == zone_id:
+            return True
+        LOG.debug(
+            'Status read for zone %d reported zone %s', zone_id, status.get('zone')
+        )
+        self._async_handle_push_status(status)
+        return False
+
+    async def _async_probe(self) -> None:
+        """Check an unreachable amp with the cheapest query it understands.
+
+        The transport is reopened first if it was closed, or if the amp kept
+        timing out (e.g. a half-open IP232 connection). A unit inquiry or a
+        frame of power queries covers several zones in one go; otherwise
+        zones are queried one at a time. The next query is only tried while
+        the previous one went unanswered, e.g. for a zone that is not wired.
+        """
+        if not self.zone_ids:
+            return
+        if self._connect is not None and (
+            transport_closed(self.amp) or self.supervisor.failures >= 2
+        ):
+            await self._async_reconnect()
+
+        for query, *args in self._probe_queries():
+            if await self.bus.async_run(query, *args):
+                return
+        raise TimeoutError(f'No response to heartbeat from {self.amp_name}')
+
+    def _probe_queries(self) -> list[tuple[Any, ...]]:
+        """Return the heartbeat queries to try, as (function, *args) tuples."""
+        if supports_unit_status(self.amp_type):
+            return [
+                (async_unit_status, self.amp, self.amp_type, unit)
+                for unit in self.units
+            ]
+        if supports_attribute_queries(self.amp_type):
+            assert self.amp_type is not None
+            frames = attribute_query_frames(self.amp_type, self.zone_ids, ('power',))
+            return [
+                (async_query_frame, self.amp, self.amp_type, frame) for frame in frames
+            ]
+        return [(self.amp.zone_status, zone_id) for zone_id in self.zone_ids]
+
+    async def _async_reconnect(self) -> None:
+        """Replace the amp controller with a freshly connected one."""
+        assert self._connect is not None
+        amp = await self._connect()
+        if not amp:
+            raise ConnectionError(f'Failed to reconnect to {self.amp_name}')
+
+        if self._push_listener is not None:
+            self.async_stop_push_updates()
+            self._resume_push = True
+        with contextlib.suppress(Exception):
+            close_transport(self.amp)
+
+        self.amp = amp
+        self.supervisor.reconnects += 1
+        LOG.debug('Reopened connection to %s', self.amp_name)
+
+    @callback
+    def _async_link_failed(self, err: BaseException) -> None:
+        """Back off polling after the amp could not be reached."""
+        if self.supervisor.online:
+            self._online_interval = self.update_interval
+        delay = self.supervisor.record_failure(err)
+        self.update_interval = timedelta(seconds=delay)
+
+    @property
+    def polled_zones(self) -> list[int]:
+        """Return the zones some entity listens to, which are the ones polled.
+
+        Disabled entities never subscribe, so their zones are skipped as soon
+        as the last enabled entity of a zone goes away. Without zone listeners
+        (e.g. the first refresh during setup) every zone is polled.
+        """
+        zones = {
+            context[0] if isinstance(context, tuple) else context
+            for context in self.async_contexts()
+        }
+        if not zones:
+            return list(self.zone_ids)
+        return [zone_id for zone_id in self.zone_ids if zone_id in zones]
+
+    def idle_zones(self, now: float) -> set[int]:
+        """Return the zones that are off and not due for a power check."""
+        data = self.data or {}
+        return {
+            zone_id
+            for zone_id, due in self._off_checks.items()
+            if now < due and data.get(zone_id, {}).get('power') is False
+        }
+
+    @callback
+    def async_restore_cached_data(self, cached: dict[int, dict[str, Any]]) -> None:
+        """Seed the coordinator with zone states saved by a previous run.
+
+        Restored zones are reported as stale until a live read confirms them.
+        """
+        data = {
+            zone_id: status
+            for zone_id, status in cached.items()
+            if zone_id in self.zone_ids
+        }
+        self.data = data
+        self._notified_data = data
+        self.stale_zones = set(data)
+
+    @property
+    def units(self) -> list[int]:
+        """Return the daisy-chained controller units that have zones configured."""
+        return sorted({zone_unit(zone_id) for zone_id in self.zone_ids})
+
+    def device_info(self, zone_id: int | None = None) -> DeviceInfo:
+        """Return the device an entity of a zone (or of the bus) belongs to.
+
+        The first unit keeps the original amp-wide device so existing
+        installations are unaffected; further units on the same port get a
+        device of their own linked to it.
+        """
+        primary = self.units[0] if self.zone_ids else None
+        unit = zone_unit(zone_id) if zone_id is not None else primary
+        if unit == primary:
+            return DeviceInfo(
+                identifiers={(DOMAIN, self.amp_name)},
+                name=f'Xantech {self.amp_name}',
+                manufacturer='Xantech',
+                model='Multi-Zone Amplifier',
+            )
+        return DeviceInfo(
+            identifiers={(DOMAIN, f'{self.amp_name}_unit_{unit}')},
+            name=f'Xantech {self.amp_name} Unit {unit}',
+            manufacturer='Xantech',
+            model='Multi-Zone Amplifier',
+            via_device=(DOMAIN, self.amp_name),
+        )
+
+    @property
+    def push_active(self) -> bool:
+        """Return True while the amp is pushing zone changes."""
+        return self._push_listener is not None
+
+    async def async_start_push_updates(self) -> bool:
+        """Have the amp report zone changes as they happen.
+
+        While push updates are active, polling only runs as a slow consistency
+        check at DEFAULT_PUSH_SCAN_INTERVAL (or scan_interval, if longer).
+
+        Returns:
+            True if push updates were enabled
+        """
+        if self._push_listener is not None:
+            return True
+        if not supports_push_updates(self.amp_type):
+            LOG.warning('Push updates are not supported by %s', self.amp_type)
+            return False
+
+        assert self.amp_type is not None
+        listener = PushUpdateListener(
+            self.amp, self.amp_type, self._async_handle_push_status
+        )
+        if not listener.start():
+            return False
+        try:
+            await self._async_command(
+                async_enable_push_updates, self.amp, self.amp_type
+            )
+        except Exception:
+            listener.stop()
+            LOG.warning(
+                'Failed to enable push updates for %s, polling instead',
+                self.amp_name,
+                exc_info=True,
+            )
+            return False
+
+        self._push_listener = listener
+        # pushed changes replace adaptive polling; keep only the slow check
+        self.poll_policy = None
+        interval = self.update_interval or timedelta(0)
+        self.update_interval = max(
+            interval, timedelta(seconds=DEFAULT_PUSH_SCAN_INTERVAL)
+        )
+        LOG.info('Push updates enabled for %s', self.amp_name)
+        return True
+
+    @callback
+    def async_stop_push_updates(self) -> None:
+        """Stop parsing pushed zone changes."""
+        if self._push_listener is not None:
+            self._push_listener.stop()
+            self._push_listener = None
+
+    @callback
+    def _async_handle_push_status(self, status: dict[str, Any]) -> None:
+        """Apply a zone status frame the amp sent on its own."""
+        zone_id = status.get('zone')
+        if zone_id not in self.zone_ids:
+            return
+        # activity on a zone that was off: poll it fully from now on
+        self._off_checks.pop(zone_id, None)
+        current = (self.data or {}).get(zone_id, {})
+        if {**current, **status} == current:
+            return
+        LOG.debug('Pushed status for zone %d: %s', zone_id, status)
+        self._async_apply_zone_update(zone_id, status)
+
+    def _update_poll_interval(self, zone_statuses: dict[int, dict[str, Any]]) -> None:
+        """Pick the next poll interval from the activity seen in this poll."""
+        assert self.poll_policy is not None
+        changed = self.data is not None and zone_statuses != self.data
+        any_zone_on = any(status.get('power') for status in zone_statuses.values())
+        interval = self.poll_policy.next_interval(changed, any_zone_on)
+        self.update_interval = timedelta(seconds=interval)
+
+    @callback
+    def _async_mark_activity(self) -> None:
+        """Shorten the poll interval after a user command."""
+        if self.poll_policy is not None:
+            interval = self.poll_policy.mark_activity()
+            self.update_interval = timedelta(seconds=interval)
+            if self._context_listeners:
+                self._schedule_refresh()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners whose zone or attribute changed since last time."""
+        data = self.data or {}
+        previous = self._notified_data
+        availability_changed = self.last_update_success != self._notified_success
+        self._notified_data = data
+        self._notified_success = self.last_update_success
+
+        if previous is None or availability_changed:
+            self._confirmed_zones.clear()
+            if self.store is not None and data:
+                self.store.async_save(data)
+            super().async_update_listeners()
+            return
+
+        changes = changed_attributes(previous, data)
+        if changes and self.store is not None:
+            self.store.async_save(data)
+
+        # confirmed zones may be unchanged, but their stale flag is not
+        for zone_id in self._confirmed_zones:
+            changes.setdefault(zone_id, set()).update(data.get(zone_id, {}))
+        self._confirmed_zones.clear()
+        if not changes:
+            return
+
+        changed = {
+            context
+            for context in self.async_contexts()
+            if (
+                context[1] in changes.get(context[0], ())
+                if isinstance(context, tuple)
+                else context in changes
+            )
+        }
+        # listeners without a context follow every change
+        for context in (None, *changed):
+            for update_callback in list(self._context_listeners.get(context, ())):
+                update_callback()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, notified when the context's data changes."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._context_listeners.setdefault(context, []).append(update_callback)
+
+        @callback
+        def remove() -> None:
+            callbacks = self._context_listeners[context]
+            callbacks.remove(update_callback)
+            if not callbacks:
+                del self._context_listeners[context]
+            remove_listener()
+
+        return remove
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll in this amp's slot of the orchestrator.
+
+        This is the only DataUpdateCoordinator internal the coordinator
+        overrides. Orchestrated slots are tracked in _unsub_slot, which is
+        cancelled on every reschedule and by async_shutdown (run when the
+        config entry unloads); everything else is left to the base class.
+        """
+        self._async_cancel_slot()
+        if (
+            self.orchestrator is None
+            or not self.update_interval
+            or (self.config_entry and self.config_entry.pref_disable_polling)
+        ):
+            super()._schedule_refresh()
+            return
+
+        slot = self.orchestrator.next_poll(
+            self, self.hass.loop.time(), self.update_interval.total_seconds()
+        )
+        self._unsub_slot = async_call_at(self.hass, self._async_poll_slot, slot)
+
+    @callback
+    def _async_cancel_slot(self) -> None:
+        """Cancel the pending orchestrated poll, if any."""
+        if self._unsub_slot is not None:
+            self._unsub_slot()
+            self._unsub_slot = None
+
+    @callback
+    def _async_poll_slot(self, _now: datetime) -> None:
+        """Poll when this amp's slot comes up."""
+        self._unsub_slot = None
+        if self.hass.is_stopping:
+            return
+        name = f'{self.name} - refresh'
+        if self.config_entry is not None:
+            # tied to the entry, so an unload or reload cancels it
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_refresh(), name
+            )
+        else:
+            self.hass.async_create_background_task(
+                self.async_refresh(), name=name, eager_start=True
+            )
+
+    async def async_shutdown(self) -> None:
+        """Cancel the pending orchestrated poll along with the base schedule."""
+        self._async_cancel_slot()
+        await super().async_shutdown()
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Notify zones confirmed by this refresh even if nothing changed."""
+        if self._confirmed_zones:
+            self.async_update_listeners()
+
+    @callback
+    def _async_apply_zone_update(self, zone_id: int, changes: dict[str, Any]) -> None:
+        """Merge changes into the cached zone state and notify listeners."""
+        data = dict(self.data or {})
+        data[zone_id] = {**data.get(zone_id, {}), **changes}
+        self.data = data
+        self.async_update_listeners()
+
+    async def _async_write_through(self, zone_id: int, **changes: Any) -> None:
+        """Apply a successful command to the cache instead of re-polling.
+
+        When confirm_writes is enabled, only the changed zone is read back.
+        """
+        self._async_apply_zone_update(zone_id, changes)
+        if self.confirm_writes:
+            await self._async_confirm_zones([zone_id])
+
+    async def _async_confirm_zones(self, zone_ids: list[int]) -> None:
+        """Read back the state of changed zones in a single bus operation."""
+
+        async def confirm_zones() -> dict[int, dict[str, Any]]:
+            statuses: dict[int, dict[str, Any]] = {}
+            for zone_id in zone_ids:
+                status = await self.amp.zone_status(zone_id)
+                if status and self._is_reply(zone_id, status):
+                    statuses[zone_id] = status
+            return statuses
+
+        try:
+            statuses = await self.bus.async_run(
+                confirm_zones, priority=PRIORITY_COMMAND
+            )
+        except Exception:
+            LOG.warning('Failed to confirm state of zones %s', zone_ids, exc_info=True)
+            return
+        for zone_id, status in statuses.items():
+            self._async_apply_zone_update(zone_id, status)
+
+    async def _async_poll_units(self, zone_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """Fetch zones with a single status inquiry per amplifier unit.
+
+        Every configured zone of a unit with any of zone_ids is returned,
+        since the inquiry reports the whole unit anyway.
+
+        Returns:
+            Dictionary mapping zone_id to zone status dict for configured zones
+        """
+        polled_units = {zone_unit(zone_id) for zone_id in zone_ids}
+        units: dict[int, list[int]] = {}
+        for zone_id in self.zone_ids:
+            if zone_unit(zone_id) in polled_units:
+                units.setdefault(zone_unit(zone_id), []).append(zone_id)
+
+        zone_statuses: dict[int, dict[str, Any]] = {}
+        for unit, unit_zone_ids in units.items():
+            try:
+                statuses = await self.bus.async_run(
+                    async_unit_status, self.amp, self.amp_type, unit
+                )
+                if not statuses and not zone_statuses:
+                    raise TimeoutError(f'No response from unit {unit}')
+            except Exception as err:
+                if is_transport_error(err) and not zone_statuses:
+                    raise
+                LOG.warning('Failed to get status for unit %d', unit, exc_info=True)
+                continue
+            if not statuses.keys() >= set(unit_zone_ids):
+                # the inquiry stopped waiting before every zone answered
+                self.stats.record_timeout()
+            for zone_id in unit_zone_ids:
+                if zone_id in statuses:
+                    zone_statuses[zone_id] = statuses[zone_id]
+        return zone_statuses
+
+    async def _async_poll_attributes(
+        self, zone_ids: list[int], attributes: tuple[str, ...]
+    ) -> dict[int, dict[str, Any]]:
+        """Read only some attributes of zones with framed queries.
+
+        All other fields keep their cached values. Zones that did not answer
+        every query are left out.
+
+        Returns:
+            Dictionary mapping zone_id to zone status dict
+        """
+        assert self.amp_type is not None
+        answered: dict[int, dict[str, Any]] = {}
+        for frame in attribute_query_frames(self.amp_type, zone_ids, attributes):
+            try:
+                statuses = await self.bus.async_run(
+                    async_query_frame, self.amp, self.amp_type, frame
+                )
+            except Exception as err:
+                if is_transport_error(err) and not answered:
+                    raise
+                LOG.warning('Failed to query zones %s', zone_ids, exc_info=True)
+                continue
+            for zone_id, status in statuses.items():
+                answered.setdefault(zone_id, {}).update(status)
+
+        data = self.data or {}
+        return {
+            zone_id: {**data.get(zone_id, {}), **answered[zone_id]}
+            for zone_id in zone_ids
+            if answered.get(zone_id, {}).keys() >= set(attributes)
+        }
+
+    async def _async_command[T](
+        self, func: Callable[..., Awaitable[T]], *args: Any
+    ) -> T:
+        """Run a user command on the bus ahead of any queued poll queries."""
+        if not self.supervisor.online:
+            # fail fast instead of waiting for a timeout from an absent amp
+            raise ConnectionError(f'{self.amp_name} is unreachable')
+        return await self.bus.async_run(func, *args, priority=PRIORITY_COMMAND)
+
+    def zone_target(self, zone_id: int, attribute: str) -> Any:
+        """Return the pending target for an attribute, else its cached value.
+
+        Relative adjustments (e.g. volume up) build on this so quick repeated
+        steps accumulate instead of starting over from the last poll.
+        """
+        if (zone_id, attribute) in self._write_targets:
+            return self._write_targets[(zone_id, attribute)]
+        if self.data and zone_id in self.data:
+            return self.data[zone_id].get(attribute)
+        return None
+
+    async def _async_coalesced_write(
+        self, zone_id: int, attribute: str, value: Any
+    ) -> None:
+        """Write a level attribute, keeping only the newest value while busy.
+
+        While a write for the same zone and attribute is in flight, newer
+        requests only replace the pending target; the in-flight writer sends
+        the latest target once its current write completes.  Superseded callers
+        wait until the newest value has been written.
+        """
+        key = (zone_id, attribute)
+        self._write_targets[key] = value
+
+        if (inflight := self._write_inflight.get(key)) is not None:
+            await asyncio.shield(inflight)
+            return
+
+        inflight = self._write_inflight[key] = self.hass.loop.create_future()
+        setter = getattr(self.amp, f'set_{attribute}')
+        try:
+            while True:
+                target = self._write_targets[key]
+                await self._async_command(setter, zone_id, target)
+                await self._async_write_through(zone_id, **{attribute: target})
+                if self._write_targets[key] == target:
+                    break
+        except Exception as err:
+            inflight.set_exception(err)
+            # mark retrieved: this writer re-raises the error itself
+            inflight.exception()
+            raise
+        else:
+            inflight.set_result(None)
+        finally:
+            # a cancelled writer must not leave superseded callers waiting
+            if not inflight.done():
+                inflight.cancel()
+            del self._write_inflight[key]
+            del self._write_targets[key]
+
     async def async_set_zone_power(self, zone_id: int, power: bool) -> None:
         """Set power state for a zone."""
         try:
-            await self.amp.set_power(zone_id, power)
-            await self.async_request_refresh()
+            self._async_mark_activity()
+            await self._async_command(self.amp.set_power, zone_id, power)
+            await self._async_write_through(zone_id, power=power)
         except Exception:
             LOG.exception('Failed to set power for zone %d', zone_id)
             raise
@@ -102,8 +1047,9 @@ class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
     async def async_set_zone_source(self, zone_id: int, source_id: int) -> None:
         """Set source for a zone."""
         try:
-            await self.amp.set_source(zone_id, source_id)
-            await self.async_request_refresh()
+            self._async_mark_activity()
+            await self._async_command(self.amp.set_source, zone_id, source_id)
+            await self._async_write_through(zone_id, source=source_id)
         except Exception:
             LOG.exception('Failed to set source for zone %d', zone_id)
             raise
@@ -111,8 +1057,8 @@ class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
     async def async_set_zone_volume(self, zone_id: int, volume: int) -> None:
         """Set volume for a zone (0-38 scale)."""
         try:
-            await self.amp.set_volume(zone_id, volume)
-            await self.async_request_refresh()
+            self._async_mark_activity()
+            await self._async_coalesced_write(zone_id, 'volume', volume)
         except Exception:
             LOG.exception('Failed to set volume for zone %d', zone_id)
             raise
@@ -120,8 +1066,9 @@ class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
     async def async_set_zone_mute(self, zone_id: int, mute: bool) -> None:
         """Set mute state for a zone."""
         try:
-            await self.amp.set_mute(zone_id, mute)
-            await self.async_request_refresh()
+            self._async_mark_activity()
+            await self._async_command(self.amp.set_mute, zone_id, mute)
+            await self._async_write_through(zone_id, mute=mute)
         except Exception:
             LOG.exception('Failed to set mute for zone %d', zone_id)
             raise
@@ -129,8 +1076,8 @@ class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
     async def async_set_zone_bass(self, zone_id: int, bass: int) -> None:
         """Set bass level for a zone (0-14, where 7 is neutral)."""
         try:
-            await self.amp.set_bass(zone_id, bass)
-            await self.async_request_refresh()
+            self._async_mark_activity()
+            await self._async_coalesced_write(zone_id, 'bass', bass)
         except Exception:
             LOG.exception('Failed to set bass for zone %d', zone_id)
             raise
@@ -138,8 +1085,8 @@ class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
     async def async_set_zone_treble(self, zone_id: int, treble: int) -> None:
         """Set treble level for a zone (0-14, where 7 is neutral)."""
         try:
-            await self.amp.set_treble(zone_id, treble)
-            await self.async_request_refresh()
+            self._async_mark_activity()
+            await self._async_coalesced_write(zone_id, 'treble', treble)
         except Exception:
             LOG.exception('Failed to set treble for zone %d', zone_id)
             raise
@@ -147,25 +1094,170 @@ class XantechCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
     async def async_set_zone_balance(self, zone_id: int, balance: int) -> None:
         """Set balance for a zone (0-20, where 10 is center)."""
         try:
-            await self.amp.set_balance(zone_id, balance)
-            await self.async_request_refresh()
+            self._async_mark_activity()
+            await self._async_coalesced_write(zone_id, 'balance', balance)
         except Exception:
             LOG.exception('Failed to set balance for zone %d', zone_id)
             raise
 
-    async def async_get_zone_snapshot(self, zone_id: int) -> dict[str, Any] | None:
-        """Get a snapshot of zone status for later restoration."""
+    async def async_apply_changes(self, changes: dict[int, dict[str, Any]]) -> None:
+        """Apply attribute changes to several zones at once.
+
+        Args:
+            changes: Mapping of zone_id to {attribute: value} with attributes
+                from COMMAND_ATTRIBUTES
+        """
+        await self.async_write_batch(
+            [
+                (zone_id, attribute, zone_changes[attribute])
+                for zone_id, zone_changes in changes.items()
+                for attribute in COMMAND_ATTRIBUTES
+                if attribute in zone_changes
+            ]
+        )
+
+    async def async_write_batch(self, writes: list[tuple[int, str, Any]]) -> int:
+        """Write (zone_id, attribute, value) changes in as few exchanges as possible.
+
+        Amps that echo zone-tagged replies get the commands pipelined in one
+        bus operation, amps accepting multi-command frames get them packed into
+        as few frames as fit, and other amps get one command after another.
+        With confirm_writes, every changed zone is read back in one operation.
+
+        Returns:
+            Number of bus operations the writes took
+        """
+        if not writes:
+            return 0
+
+        self._async_mark_activity()
+        applied: list[tuple[int, str, Any]] = []
+        by_zone: dict[int, dict[str, Any]] = {}
         try:
-            return await self.amp.zone_status(zone_id)
+            if supports_pipelining(self.amp_type):
+                await self._async_pipeline_writes(writes, applied)
+                operations = 1
+            elif supports_framing(self.amp_type):
+                operations = await self._async_framed_writes(writes, applied)
+            else:
+                operations = len(writes)
+                for zone_id, attribute, value in writes:
+                    setter = getattr(self.amp, f'set_{attribute}')
+                    await self._async_command(setter, zone_id, value)
+                    applied.append((zone_id, attribute, value))
         except Exception:
-            LOG.exception('Failed to snapshot zone %d', zone_id)
+            LOG.exception(
+                'Failed to write %d changes to zones %s',
+                len(writes),
+                sorted({zone_id for zone_id, _, _ in writes}),
+            )
             raise
+        finally:
+            # writes the amp accepted are cached even when a later one failed
+            for zone_id, attribute, value in applied:
+                by_zone.setdefault(zone_id, {})[attribute] = value
+            for zone_id, zone_changes in by_zone.items():
+                self._async_apply_zone_update(zone_id, zone_changes)
+
+        if self.confirm_writes and by_zone:
+            await self._async_confirm_zones(list(by_zone))
+        return operations
+
+    def _accepted_writes(
+        self,
+        writes: list[tuple[int, str, Any]],
+        commands: list[bytes],
+        rejected: list[bytes],
+    ) -> list[tuple[int, str, Any]]:
+        """Return the writes whose commands the amp did not reject."""
+        if rejected:
+            LOG.warning(
+                '%s rejected %d of %d commands: %s',
+                self.amp_name,
+                len(rejected),
+                len(commands),
+                rejected,
+            )
+        return [
+            write
+            for write, command in zip(writes, commands, strict=True)
+            if command not in rejected
+        ]
+
+    async def _async_framed_writes(
+        self,
+        writes: list[tuple[int, str, Any]],
+        applied: list[tuple[int, str, Any]],
+    ) -> int:
+        """Send writes packed into multi-command frames.
 
-    async def async_restore_zone(self, snapshot: dict[str, Any]) -> None:
-        """Restore a zone from a snapshot."""
+        Args:
+            writes: Writes to send
+            applied: Receives the writes the amp accepted, frame by frame
+
+        Returns:
+            The number of frames sent
+        """
+        assert self.amp_type is not None
+        commands = [
+            zone_command(self.amp_type, zone_id, attribute, value)
+            for zone_id, attribute, value in writes
+        ]
+        frames = pack_frames(self.amp_type, commands)
+        sent = 0
+        for frame in frames:
+            rejected = await self._async_command(
+                async_send_frame, self.amp, self.amp_type, frame
+            )
+            applied += self._accepted_writes(
+                writes[sent : sent + len(frame)], frame, rejected
+            )
+            sent += len(frame)
+        return len(frames)
+
+    async def _async_pipeline_writes(
+        self,
+        writes: list[tuple[int, str, Any]],
+        applied: list[tuple[int, str, Any]],
+    ) -> None:
+        """Send writes as one pipelined bus operation.
+
+        Args:
+            writes: Writes to send
+            applied: Receives the writes the amp accepted, including those
+                echoed before the amp stopped answering
+        """
+        assert self.amp_type is not None
+        commands = [
+            zone_command(self.amp_type, zone_id, attribute, value)
+            for zone_id, attribute, value in writes
+        ]
         try:
-            await self.amp.restore_zone(snapshot)
-            await self.async_request_refresh()
-        except Exception:
-            LOG.exception('Failed to restore zone')
+            rejected = await self._async_command(
+                async_pipeline, self.amp, self.amp_type, commands
+            )
+        except PipelineTimeout as err:
+            applied += [
+                write
+                for write, command in zip(writes, commands, strict=True)
+                if command in err.echoed
+            ]
             raise
+        applied += self._accepted_writes(writes, commands, rejected)
+
+    def snapshot_zones(self, zone_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """Return the restorable state of zones from the cache, without bus I/O.
+
+        All zones are read in one step, so the snapshot reflects a single
+        instant even across many zones. Zones with no known state are left out.
+        """
+        data = self.data or {}
+        return {
+            zone_id: {
+                attribute: data[zone_id][attribute]
+                for attribute in COMMAND_ATTRIBUTES
+                if attribute in data[zone_id]
+            }
+            for zone_id in zone_ids
+            if data.get(zone_id)
+        }
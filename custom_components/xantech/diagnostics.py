@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -64,7 +65,40 @@ async def async_get_config_entry_diagnostics(
             ),
             'last_update_success': coordinator.last_update_success,
             'zone_ids': coordinator.zone_ids,
+            'units': coordinator.units,
+            'push_active': coordinator.push_active,
+            'stale_zones': sorted(coordinator.stale_zones),
+            'poll_tones': coordinator.poll_tones,
+            'tone_interval_seconds': coordinator.tone_interval,
+            'polled_zones': coordinator.polled_zones,
+            'off_interval_seconds': coordinator.off_interval,
+            'idle_zones': sorted(coordinator.idle_zones(time.monotonic())),
+            'poll_policy': (
+                coordinator.poll_policy.as_dict()
+                if coordinator.poll_policy is not None
+                else None
+            ),
+            'poll_budget_seconds': coordinator.poll_budget,
+            'staleness_bound_seconds': coordinator.staleness_bound,
+            'max_staleness_seconds': coordinator.max_staleness(time.monotonic()),
+            'round_cycles': coordinator.round_cycles,
         },
+        'bus': coordinator.bus.as_dict(),
+        'connection': coordinator.supervisor.as_dict(),
+        'transport': coordinator.stats.as_dict(),
+        'orchestrator': (
+            coordinator.orchestrator.as_dict() if coordinator.orchestrator else None
+        ),
+        'presets': (
+            sorted(entry.runtime_data.presets.presets)
+            if entry.runtime_data.presets
+            else []
+        ),
+        'snapshot_zones': (
+            sorted(entry.runtime_data.snapshots.snapshots)
+            if entry.runtime_data.snapshots
+            else []
+        ),
         'zone_names': zone_names,
         'source_names': source_names,
         'zone_statuses': zone_data,
@@ -10,10 +10,10 @@ from homeassistant.components.media_player import (
     MediaPlayerEntityFeature,
     MediaPlayerState,
 )
-from homeassistant.core import Event, HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util.hass_dict import HassKey
 
 from .const import (
     CONF_ZONES,
@@ -27,6 +27,12 @@ if TYPE_CHECKING:
 
 LOG = logging.getLogger(__name__)
 
+# entity_id of every added zone media player -> (config entry, zone_id), so
+# services resolve their targets without scanning entities or the registry
+DATA_ZONE_INDEX: HassKey[dict[str, tuple[XantechConfigEntry, int]]] = HassKey(
+    f'{DOMAIN}_zone_index'
+)
+
 SUPPORTED_ZONE_FEATURES = (
     MediaPlayerEntityFeature.VOLUME_MUTE
     | MediaPlayerEntityFeature.VOLUME_SET
@@ -69,6 +75,11 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+def zone_unique_id(amp_name: str, zone_id: int) -> str:
+    """Return the unique ID of a zone media player."""
+    return f'{DOMAIN}_{amp_name}_zone_{zone_id}'.lower().replace(' ', '_')
+
+
 class ZoneMediaPlayer(CoordinatorEntity[XantechCoordinator], MediaPlayerEntity):
     """Representation of a matrix amplifier zone."""
 
@@ -84,7 +95,7 @@ class ZoneMediaPlayer(CoordinatorEntity[XantechCoordinator], MediaPlayerEntity):
         sources: dict[int, str],
     ) -> None:
         """Initialize the zone media player."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=zone_id)
 
         self._zone_id = zone_id
         self._zone_name = zone_name
@@ -97,29 +108,33 @@ class ZoneMediaPlayer(CoordinatorEntity[XantechCoordinator], MediaPlayerEntity):
             key=lambda v: self._source_name_to_id[v],
         )
 
-        # snapshot storage
-        self._status_snapshot: dict[str, Any] | None = None
-
         # optimistic state tracking for instant UI feedback
         self._optimistic_state: dict[str, Any] = {}
         self._pending_commands: int = 0
 
         # entity attributes - preserve existing unique_id format for migration
-        self._attr_unique_id = (
-            f'{DOMAIN}_{coordinator.amp_name}_zone_{zone_id}'.lower().replace(' ', '_')
-        )
+        self._attr_unique_id = zone_unique_id(coordinator.amp_name, zone_id)
         self._attr_name = zone_name
 
-        # device info
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f'{coordinator.amp_name}')},
-            name=f'Xantech {coordinator.amp_name}',
-            manufacturer='Xantech',
-            model='Multi-Zone Amplifier',
-        )
+        # device info - one device per daisy-chained unit
+        self._attr_device_info = coordinator.device_info(zone_id)
 
         self._entry = entry
 
+    async def async_added_to_hass(self) -> None:
+        """Add the zone to the entity_id index used by the services."""
+        await super().async_added_to_hass()
+
+        index = self.hass.data.setdefault(DATA_ZONE_INDEX, {})
+        entity_id = self.entity_id
+        index[entity_id] = (self._entry, self._zone_id)
+
+        @callback
+        def _remove_from_index() -> None:
+            index.pop(entity_id, None)
+
+        self.async_on_remove(_remove_from_index)
+
     @property
     def _zone_status(self) -> dict[str, Any]:
         """Get current zone status, preferring optimistic state for instant UI.
@@ -144,14 +159,26 @@ class ZoneMediaPlayer(CoordinatorEntity[XantechCoordinator], MediaPlayerEntity):
         self.async_write_ha_state()
 
     def _command_complete(self) -> None:
-        """Mark a command as complete."""
+        """Mark a command as complete.
+
+        The coordinator only notifies entities whose zone changed, so fall back
+        to the cached state here in case the command changed nothing.
+        """
         self._pending_commands = max(0, self._pending_commands - 1)
+        if self._pending_commands == 0:
+            self._clear_optimistic()
+            self.async_write_ha_state()
 
     def _clear_optimistic(self) -> None:
         """Clear optimistic state only when no commands are pending."""
         if self._pending_commands == 0:
             self._optimistic_state.clear()
 
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while the zone shows cached state not yet read live."""
+        return self._zone_id in self.coordinator.stale_zones
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -247,7 +274,8 @@ class ZoneMediaPlayer(CoordinatorEntity[XantechCoordinator], MediaPlayerEntity):
 
     async def async_volume_up(self) -> None:
         """Volume up the media player."""
-        volume = self._zone_status.get('volume')
+        # step from any pending target so rapid presses accumulate
+        volume = self.coordinator.zone_target(self._zone_id, 'volume')
         if volume is None:
             return
         new_volume = min(volume + 1, MAX_VOLUME)
@@ -259,7 +287,8 @@ class ZoneMediaPlayer(CoordinatorEntity[XantechCoordinator], MediaPlayerEntity):
 
     async def async_volume_down(self) -> None:
         """Volume down media player."""
-        volume = self._zone_status.get('volume')
+        # step from any pending target so rapid presses accumulate
+        volume = self.coordinator.zone_target(self._zone_id, 'volume')
         if volume is None:
             return
         new_volume = max(volume - 1, 0)
@@ -289,50 +318,3 @@ class ZoneMediaPlayer(CoordinatorEntity[XantechCoordinator], MediaPlayerEntity):
             await self.coordinator.async_set_zone_source(self._zone_id, source_id)
         finally:
             self._command_complete()
-
-    async def async_snapshot(self) -> None:
-        """Save zone's current state."""
-        self._status_snapshot = await self.coordinator.async_get_zone_snapshot(
-            self._zone_id
-        )
-        LOG.info('Saved state snapshot for zone %d', self._zone_id)
-
-    async def async_restore(self) -> None:
-        """Restore saved state."""
-        if self._status_snapshot:
-            await self.coordinator.async_restore_zone(self._status_snapshot)
-            LOG.info('Restored previous state for zone %d', self._zone_id)
-        else:
-            LOG.warning(
-                'Restore called for zone %d, but no snapshot saved', self._zone_id
-            )
-
-    async def async_added_to_hass(self) -> None:
-        """Register event listeners when entity is added."""
-        await super().async_added_to_hass()
-
-        # listen for snapshot/restore events
-        self.async_on_remove(
-            self.hass.bus.async_listen(
-                f'{DOMAIN}_snapshot',
-                self._handle_snapshot_event,
-            )
-        )
-        self.async_on_remove(
-            self.hass.bus.async_listen(
-                f'{DOMAIN}_restore',
-                self._handle_restore_event,
-            )
-        )
-
-    @callback
-    def _handle_snapshot_event(self, event: Event[dict[str, Any]]) -> None:
-        """Handle snapshot event."""
-        if event.data.get('entity_id') == self.entity_id:
-            self.hass.async_create_task(self.async_snapshot())
-
-    @callback
-    def _handle_restore_event(self, event: Event[dict[str, Any]]) -> None:
-        """Handle restore event."""
-        if event.data.get('entity_id') == self.entity_id:
-            self.hass.async_create_task(self.async_restore())
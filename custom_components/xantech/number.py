@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from pyxantech import get_device_config
@@ -139,7 +138,7 @@ class ZoneAudioControlNumber(CoordinatorEntity[XantechCoordinator], NumberEntity
         max_value: int,
     ) -> None:
         """Initialize the audio control number entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(zone_id, control_key))
 
         self._zone_id = zone_id
         self._zone_name = zone_name
@@ -162,9 +161,7 @@ class ZoneAudioControlNumber(CoordinatorEntity[XantechCoordinator], NumberEntity
         self._attr_translation_key = control_key
 
         # device info - link to same device as media player
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f'{coordinator.amp_name}')},
-        )
+        self._attr_device_info = coordinator.device_info(zone_id)
 
     @property
     def _zone_status(self) -> dict[str, Any]:
@@ -180,14 +177,26 @@ class ZoneAudioControlNumber(CoordinatorEntity[XantechCoordinator], NumberEntity
         self.async_write_ha_state()
 
     def _command_complete(self) -> None:
-        """Mark a command as complete."""
+        """Mark a command as complete.
+
+        The coordinator only notifies entities whose attribute changed, so fall back
+        to the cached state here in case the command changed nothing.
+        """
         self._pending_commands = max(0, self._pending_commands - 1)
+        if self._pending_commands == 0:
+            self._clear_optimistic()
+            self.async_write_ha_state()
 
     def _clear_optimistic(self) -> None:
         """Clear optimistic state only when no commands are pending."""
         if self._pending_commands == 0:
             self._optimistic_value = None
 
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while the zone shows cached state not yet read live."""
+        return self._zone_id in self.coordinator.stale_zones
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
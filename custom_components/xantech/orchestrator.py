@@ -0,0 +1,174 @@
+"""Coordination of polling across all configured Xantech amplifiers."""
+
+from __future__ import annotations
+
+import logging
+import asyncio
+import math
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .coordinator import XantechCoordinator
+
+LOG = logging.getLogger(__name__)
+
+# bus operations allowed in flight at once across all amps
+DEFAULT_IO_BUDGET: Final = 4
+
+DATA_ORCHESTRATOR: HassKey[PollOrchestrator] = HassKey(f'{DOMAIN}_orchestrator')
+
+
+class IOBudget:
+    """Global cap on amplifier bus operations running at the same time.
+
+    Each amp already runs one operation at a time on its own bus; the budget
+    bounds how many amps may be talking at once so many ports polling
+    together do not flood the event loop.
+    """
+
+    def __init__(self, limit: int = DEFAULT_IO_BUDGET) -> None:
+        """Initialize the budget.
+
+        Args:
+            limit: Maximum number of bus operations in flight across all amps
+        """
+        self.limit = limit
+        self.in_flight = 0
+        self.peak = 0
+        self.operations = 0
+        self.waits = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def __aenter__(self) -> None:
+        """Wait for a free slot."""
+        if self._semaphore.locked():
+            self.waits += 1
+        await self._semaphore.acquire()
+        self.in_flight += 1
+        self.operations += 1
+        self.peak = max(self.peak, self.in_flight)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Release the slot."""
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return budget usage for diagnostics."""
+        return {
+            'limit': self.limit,
+            'in_flight': self.in_flight,
+            'peak_in_flight': self.peak,
+            'operations': self.operations,
+            'waits': self.waits,
+        }
+
+
+class PollOrchestrator:
+    """Stagger the poll timers of all amps and share one I/O budget.
+
+    Every registered coordinator gets an evenly spaced phase within its poll
+    interval, so amps on separate ports poll in parallel but do not all wake
+    in the same instant.
+    """
+
+    def __init__(self, io_budget: int = DEFAULT_IO_BUDGET) -> None:
+        """Initialize the orchestrator.
+
+        Args:
+            io_budget: Maximum number of bus operations in flight across all amps
+        """
+        self.budget = IOBudget(io_budget)
+        self._coordinators: list[XantechCoordinator] = []
+
+    @property
+    def coordinators(self) -> list[XantechCoordinator]:
+        """Return the registered coordinators in slot order."""
+        return list(self._coordinators)
+
+    @callback
+    def async_register(self, coordinator: XantechCoordinator) -> Callable[[], None]:
+        """Add a coordinator to the poll rotation.
+
+        Returns:
+            Callback removing the coordinator again
+        """
+        self._coordinators.append(coordinator)
+        LOG.debug(
+            'Registered %s for polling in slot %d',
+            coordinator.amp_name,
+            len(self._coordinators) - 1,
+        )
+
+        @callback
+        def _unregister() -> None:
+            if coordinator in self._coordinators:
+                self._coordinators.remove(coordinator)
+
+        return _unregister
+
+    def phase(self, coordinator: XantechCoordinator, interval: float) -> float:
+        """Return the offset of a coordinator's poll slot within an interval."""
+        try:
+            slot = self._coordinators.index(coordinator)
+        except ValueError:
+            return 0.0
+        return interval * slot / len(self._coordinators)
+
+    def next_poll(
+        self, coordinator: XantechCoordinator, now: float, interval: float
+    ) -> float:
+        """Return the loop time of the coordinator's next poll slot.
+
+        Slots repeat every interval at the coordinator's phase; the nearest
+        slot at least half an interval away is chosen, so a poll is never
+        more than half an interval early or late.
+        """
+        phase = self.phase(coordinator, interval)
+        cycles = math.ceil((now + interval / 2 - phase) / interval)
+        return phase + cycles * interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregate polling load of all amps for diagnostics."""
+        intervals = {
+            coordinator.amp_name: coordinator.update_interval.total_seconds()
+            for coordinator in self._coordinators
+            if coordinator.update_interval
+        }
+        # fraction of wall time spent polling, summed over all buses
+        duty_cycle = sum(
+            (coordinator.stats.poll_cycle.last_ms or 0) / 1000 / interval
+            for coordinator in self._coordinators
+            if (interval := intervals.get(coordinator.amp_name))
+        )
+        return {
+            'amps': len(self._coordinators),
+            'zones': sum(len(c.polled_zones) for c in self._coordinators),
+            'polls_per_minute': round(
+                sum(60 / interval for interval in intervals.values()), 1
+            ),
+            'duty_cycle': round(duty_cycle, 3),
+            'slots': {
+                coordinator.amp_name: round(
+                    self.phase(coordinator, intervals.get(coordinator.amp_name, 0)),
+                    1,
+                )
+                for coordinator in self._coordinators
+            },
+            'io_budget': self.budget.as_dict(),
+        }
+
+
+@callback
+def async_get_orchestrator(hass: HomeAssistant) -> PollOrchestrator:
+    """Return the orchestrator shared by all Xantech config entries."""
+    if (orchestrator := hass.data.get(DATA_ORCHESTRATOR)) is None:
+        orchestrator = hass.data[DATA_ORCHESTRATOR] = PollOrchestrator()
+    return orchestrator
@@ -0,0 +1,209 @@
+"""Polling interval policies for Xantech Multi-Zone Amplifier."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Final
+
+from .const import (
+    DEFAULT_IDLE_DECAY,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_TARGET_UTILIZATION,
+    POLLING_MODE_ADAPTIVE,
+    POLLING_MODE_AUTO,
+)
+
+LOG = logging.getLogger(__name__)
+
+# weight of the newest cycle in the moving averages of auto polling
+AUTO_SMOOTHING: Final = 0.3
+
+# factor auto polling stretches the interval by when every read fails
+MAX_ERROR_BACKOFF: Final = 4.0
+
+
+class AdaptivePollInterval:
+    """Choose the next poll interval from recent zone activity.
+
+    Polling drops to the minimum interval after a command or a detected change,
+    then grows by the decay factor every quiet cycle: up to the normal interval
+    while any zone is on, and up to the maximum interval once all zones are off.
+    """
+
+    def __init__(
+        self,
+        idle_interval: float,
+        min_interval: float = DEFAULT_MIN_SCAN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_SCAN_INTERVAL,
+        decay: float = DEFAULT_IDLE_DECAY,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            idle_interval: Interval to settle at while any zone is powered on
+            min_interval: Interval used right after activity
+            max_interval: Interval to settle at when every zone is off
+            decay: Factor the interval grows by after each quiet cycle
+        """
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.idle_interval = min(max(idle_interval, min_interval), self.max_interval)
+        self.decay = max(decay, 1.0)
+        self.interval = self.idle_interval
+
+    def mark_activity(self) -> float:
+        """Record activity (command or change) and return the shortened interval."""
+        self.interval = self.min_interval
+        return self.interval
+
+    def next_interval(self, changed: bool, any_zone_on: bool) -> float:
+        """Return the interval to wait before the next poll.
+
+        Args:
+            changed: Whether the last poll detected a change in any zone
+            any_zone_on: Whether any zone is currently powered on
+        """
+        if changed:
+            return self.mark_activity()
+
+        ceiling = self.idle_interval if any_zone_on else self.max_interval
+        self.interval = min(self.interval * self.decay, ceiling)
+        return self.interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the policy state for diagnostics."""
+        return {
+            'mode': POLLING_MODE_ADAPTIVE,
+            'interval_seconds': round(self.interval, 1),
+        }
+
+
+class AutoPollInterval:
+    """Poll as often as the link allows while keeping the bus mostly free.
+
+    Every poll cycle records how long the bus took per zone read, timeouts
+    included, and how many reads failed; both are kept as moving averages.
+    The interval is the shortest at which reading every polled zone keeps the
+    bus busy for at most the target share of the time, after leaving room for
+    commands. More zones or slower reads lengthen it at once, and failing
+    reads stretch it further so a struggling link is not pushed harder.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float,
+        min_interval: float = DEFAULT_MIN_SCAN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_SCAN_INTERVAL,
+        target: float = DEFAULT_TARGET_UTILIZATION / 100,
+        smoothing: float = AUTO_SMOOTHING,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            initial_interval: Interval used until the first cycle is measured
+            min_interval: Shortest interval ever chosen
+            max_interval: Longest interval ever chosen
+            target: Share of the time (0-1) the bus may be busy
+            smoothing: Weight of the newest cycle in the moving averages
+        """
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.target = min(max(target, 0.01), 1.0)
+        self.smoothing = smoothing
+        self.interval = min(max(initial_interval, min_interval), self.max_interval)
+        self.zones = 0
+        self.zone_rtt: float | None = None
+        self.error_rate = 0.0
+        # measured share of the time the bus was busy, and the part of it
+        # taken by anything but polling (commands, confirmations)
+        self.utilization: float | None = None
+        self.other_load = 0.0
+        self._last_cycle: tuple[float, float] | None = None
+
+    def _average(self, current: float | None, sample: float) -> float:
+        if current is None:
+            return sample
+        return current + self.smoothing * (sample - current)
+
+    def record_cycle(
+        self,
+        zones: int,
+        failures: int,
+        poll_time: float,
+        now: float,
+        bus_time: float,
+    ) -> None:
+        """Record the cost of one poll cycle.
+
+        Args:
+            zones: Zones the cycle tried to read
+            failures: Zones that did not answer
+            poll_time: Seconds the bus spent on the reads of this cycle
+            now: Monotonic time at the end of the cycle
+            bus_time: Seconds the bus has been busy in total, commands included
+        """
+        self.zones = zones
+        # the first sample seeds each average instead of blending with zero
+        if zones:
+            measured = self.zone_rtt is not None
+            self.zone_rtt = self._average(self.zone_rtt, poll_time / zones)
+            self.error_rate = self._average(
+                self.error_rate if measured else None,
+                min(max(failures / zones, 0.0), 1.0),
+            )
+        if self._last_cycle is not None and now > self._last_cycle[0]:
+            last_now, last_bus_time = self._last_cycle
+            busy = bus_time - last_bus_time
+            self.other_load = self._average(
+                self.other_load if self.utilization is not None else None,
+                max(busy - poll_time, 0.0) / (now - last_now),
+            )
+            self.utilization = self._average(self.utilization, busy / (now - last_now))
+        self._last_cycle = (now, bus_time)
+
+    def mark_activity(self) -> float:
+        """Return the current interval, which is already as short as allowed."""
+        return self.interval
+
+    def next_interval(self, changed: bool, any_zone_on: bool) -> float:
+        """Return the shortest interval keeping the bus under its target load.
+
+        Args:
+            changed: Unused; auto polling does not follow zone activity
+            any_zone_on: Unused; auto polling does not follow zone activity
+        """
+        if self.zone_rtt is None or not self.zones:
+            return self.interval
+        # polling always gets at least a quarter of the target
+        available = max(self.target - self.other_load, self.target / 4)
+        interval = self.zone_rtt * self.zones / available
+        interval *= 1 + (MAX_ERROR_BACKOFF - 1) * self.error_rate
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        if abs(interval - self.interval) >= 1:
+            LOG.debug(
+                'Auto polling every %.1fs (%d zones, %.0fms per zone, %.0f%% errors)',
+                interval,
+                self.zones,
+                self.zone_rtt * 1000,
+                self.error_rate * 100,
+            )
+        self.interval = interval
+        return self.interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the chosen interval and measured bus load for diagnostics."""
+        return {
+            'mode': POLLING_MODE_AUTO,
+            'interval_seconds': round(self.interval, 1),
+            'target_utilization': self.target,
+            'utilization': (
+                round(self.utilization, 3) if self.utilization is not None else None
+            ),
+            'other_load': round(self.other_load, 3),
+            'zones': self.zones,
+            'zone_rtt_ms': (
+                round(self.zone_rtt * 1000, 1) if self.zone_rtt is not None else None
+            ),
+            'error_rate': round(self.error_rate, 3),
+        }
@@ -0,0 +1,617 @@
+"""Low-level RS232 exchanges not covered by the pyxantech controller API.
+
+pyxantech only exposes one request/one response line at a time, so exchanges
+that return several lines (e.g. unit-wide status inquiries) drive the
+controller's RS232 protocol directly while holding its lock, which keeps them
+serialized with every other command pyxantech sends.
+"""
+
+from __future__ import annotations
+
+import logging
+import asyncio
+import re
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+from pyxantech import ZoneStatus, get_device_config, get_protocol_config
+
+from .const import AMP_TYPE_DAX88, AMP_TYPE_MONOPRICE6, AMP_TYPE_XANTECH8
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pyxantech import AmpControlBase
+
+LOG = logging.getLogger(__name__)
+
+# seconds to wait for the next chunk of a multi-line response
+RESPONSE_TIMEOUT: Final = 1.0
+
+# unit-wide status inquiries; "?10" reports every zone on unit 1
+UNIT_STATUS_QUERIES: Final[dict[str, str]] = {
+    AMP_TYPE_MONOPRICE6: '?{unit}0',
+    AMP_TYPE_DAX88: '?{unit}0',
+}
+
+# pyxantech release whose RS232ControlProtocol internals (below) raw exchanges
+# and push updates rely on; keep in step with manifest.json
+PYXANTECH_VERSION: Final = '0.10.7'
+PROTOCOL_INTERNALS: Final = (
+    '_transport',
+    '_connected',
+    '_queue',
+    '_lock',
+    '_last_send',
+    '_throttle_requests',
+    'data_received',
+    'send',
+)
+
+# commands enabling unsolicited zone status reports (activity updates)
+PUSH_UPDATE_COMMANDS: Final[dict[str, str]] = {
+    AMP_TYPE_XANTECH8: '!ZA1+',
+}
+
+# characters of unparsed unsolicited data kept while waiting for a full frame
+PUSH_BUFFER_LIMIT: Final = 256
+
+# protocols echoing every set command back, e.g. "<11PR01" (zone 11, power on);
+# the pattern extracts zone and command code from commands and echoes alike
+PIPELINE_ECHOES: Final[dict[str, re.Pattern[str]]] = {
+    AMP_TYPE_MONOPRICE6: re.compile(r'<(\d\d)([A-Z]{2})\d\d'),
+}
+PIPELINE_ERROR: Final = re.compile(r'Command Error')
+
+# protocols accepting several '+' terminated commands in one frame
+# (e.g. "!11PR1+!11SS3+!11VO20+"), with the longest frame sent at once
+FRAME_LIMITS: Final[dict[str, int]] = {
+    AMP_TYPE_XANTECH8: 48,
+}
+
+# bytes of commands written ahead of their echoes, well within the small
+# receive buffer of the amp's RS232 controller
+PIPELINE_WINDOW: Final = 32
+
+# per-attribute status queries (e.g. "?11VO+" answered by "?11VO20+"), which
+# can be packed into frames like set commands
+ATTRIBUTE_QUERY_CODES: Final[dict[str, dict[str, str]]] = {
+    AMP_TYPE_XANTECH8: {
+        'power': 'PR',
+        'source': 'SS',
+        'volume': 'VO',
+        'mute': 'MU',
+        'bass': 'BS',
+        'treble': 'TR',
+        'balance': 'BA',
+    },
+}
+ATTRIBUTE_REPLY: Final = re.compile(r'\?(\d+)([A-Z]{2})(\d+)\+')
+
+# zone attributes with a pyxantech set_<attribute> command, in the order they
+# are applied (power first: some amps ignore changes to zones that are off)
+COMMAND_ATTRIBUTES: Final = (
+    'power',
+    'source',
+    'volume',
+    'mute',
+    'bass',
+    'treble',
+    'balance',
+)
+
+# attributes polled on every cycle, and the tone controls polled less often
+CORE_ATTRIBUTES: Final = ('power', 'source', 'volume', 'mute')
+TONE_ATTRIBUTES: Final = ('bass', 'treble', 'balance')
+
+
+def supports_unit_status(amp_type: str | None) -> bool:
+    """Return True if the amp type can report all zones of a unit at once."""
+    return amp_type in UNIT_STATUS_QUERIES
+
+
+def zone_unit(zone_id: int) -> int:
+    """Return the controller unit for a zone (first digit of 11..38 addressing)."""
+    return zone_id // 10
+
+
+def parse_zone_statuses(amp_type: str, response: str) -> dict[int, dict[str, Any]]:
+    """Parse every zone status frame contained in a response stream.
+
+    Args:
+        amp_type: Amplifier type used to look up the zone status pattern
+        response: Raw response text, possibly containing many frames
+
+    Returns:
+        Dictionary mapping zone_id to zone status dict
+    """
+    responses = get_protocol_config(amp_type, 'responses') or {}
+    pattern = responses.get('zone_status')
+    if not pattern:
+        return {}
+
+    statuses: dict[int, dict[str, Any]] = {}
+    for match in re.finditer(pattern, response):
+        status = ZoneStatus.from_dict(match.groupdict()).dict
+        statuses[status['zone']] = status
+    return statuses
+
+
+def amp_protocol(amp: AmpControlBase) -> Any | None:
+    """Return the RS232 protocol of a pyxantech controller.
+
+    Raw exchanges and push updates work below pyxantech's public API. This is
+    the one place that reaches for its protocol object, and it checks the
+    object still has every internal PROTOCOL_INTERNALS lists.
+
+    Returns:
+        The protocol, or None if the controller has none or the installed
+        pyxantech keeps its state elsewhere
+    """
+    protocol = getattr(amp, '_protocol', None)
+    if protocol is None or not all(
+        hasattr(protocol, name) for name in PROTOCOL_INTERNALS
+    ):
+        return None
+    return protocol
+
+
+def _required_protocol(amp: AmpControlBase) -> Any:
+    """Return the RS232 protocol of a controller, which must have one."""
+    if (protocol := amp_protocol(amp)) is None:
+        raise RuntimeError(
+            f'pyxantech protocol lacks one of {", ".join(PROTOCOL_INTERNALS)}; '
+            f'raw RS232 access needs pyxantech {PYXANTECH_VERSION}'
+        )
+    return protocol
+
+
+def amp_transport(amp: AmpControlBase) -> asyncio.BaseTransport | None:
+    """Return the serial or socket transport of a pyxantech controller.
+
+    Returns:
+        The transport, or None if the controller has none (or pyxantech no
+        longer keeps it where expected)
+    """
+    protocol = amp_protocol(amp)
+    return protocol._transport if protocol is not None else None
+
+
+def close_transport(amp: AmpControlBase) -> None:
+    """Close the transport of a pyxantech controller, if it has one."""
+    if (transport := amp_transport(amp)) is not None:
+        transport.close()
+
+
+async def _async_prepare_send(protocol: Any, timeout: float) -> Any:
+    """Wait for the link and drop stale data; the caller holds the lock.
+
+    Returns:
+        The serial port requests are written to
+
+    Raises:
+        TimeoutError: If the link did not come up within timeout
+    """
+    try:
+        await asyncio.wait_for(protocol._connected.wait(), timeout)
+    except TimeoutError:
+        raise TimeoutError(f'Amp not connected within {timeout}s') from None
+    await protocol._throttle_requests()
+
+    # drop any stale data before sending, as pyxantech does
+    serial_port = protocol._transport.serial
+    serial_port.reset_output_buffer()
+    serial_port.reset_input_buffer()
+    queue = protocol._queue
+    while not queue.empty():
+        queue.get_nowait()
+    return serial_port
+
+
+async def async_exchange(
+    amp: AmpControlBase,
+    request: bytes,
+    done: Callable[[str], bool],
+    timeout: float = RESPONSE_TIMEOUT,
+) -> str:
+    """Send a raw request and collect response data until done(text) is True.
+
+    Args:
+        amp: pyxantech async controller
+        request: Encoded request bytes
+        done: Callable returning True once the accumulated text is complete
+        timeout: Seconds to wait for each chunk of data
+
+    Returns:
+        Decoded response text (partial if the amp stopped responding)
+
+    Raises:
+        TimeoutError: If the link to the amp is down
+    """
+    protocol = _required_protocol(amp)
+    data = bytearray()
+
+    async with protocol._lock:
+        serial_port = await _async_prepare_send(protocol, timeout)
+        queue = protocol._queue
+
+        LOG.debug('Sending RS232 request %s', request)
+        protocol._last_send = time.time()
+        serial_port.write(request)
+
+        try:
+            while not done(data.decode('ascii', errors='ignore')):
+                data += await asyncio.wait_for(queue.get(), timeout)
+        except TimeoutError:
+            LOG.debug('Timeout waiting for response to %s: %s', request, bytes(data))
+
+    return data.decode('ascii', errors='ignore')
+
+
+async def async_unit_status(
+    amp: AmpControlBase,
+    amp_type: str,
+    unit: int,
+) -> dict[int, dict[str, Any]]:
+    """Query the status of every zone on a unit with a single inquiry.
+
+    Args:
+        amp: pyxantech async controller
+        amp_type: Amplifier type (must support unit status queries)
+        unit: Controller unit number (1-3)
+
+    Returns:
+        Dictionary mapping zone_id to zone status dict for zones that answered
+    """
+    request = format_command(amp_type, UNIT_STATUS_QUERIES[amp_type], unit=unit)
+    zones_per_unit = get_device_config(amp_type, 'num_zones', log_missing=False) or 6
+
+    def _all_zones_received(text: str) -> bool:
+        return len(parse_zone_statuses(amp_type, text)) >= zones_per_unit
+
+    response = await async_exchange(amp, request, _all_zones_received)
+    return parse_zone_statuses(amp_type, response)
+
+
+class PushUpdateListener:
+    """Parse zone status frames the amp sends without being asked.
+
+    Taps the data_received callback of the pyxantech RS232 protocol. All data
+    is parsed, including data arriving while a request holds the protocol
+    lock: the amp may push a frame for any zone mid-request, and dropping it
+    would lose the change. Replies to status queries parse to the zone's
+    actual state, which the coordinator ignores when it matches its cache.
+    """
+
+    def __init__(
+        self,
+        amp: AmpControlBase,
+        amp_type: str,
+        on_status: Callable[[dict[str, Any]], None],
+    ) -> None:
+        """Initialize the listener.
+
+        Args:
+            amp: pyxantech async controller
+            amp_type: Amplifier type (must support push updates)
+            on_status: Called with each parsed zone status dict
+        """
+        self._amp = amp
+        self._protocol: Any = None
+        self._amp_type = amp_type
+        self._on_status = on_status
+        responses = get_protocol_config(amp_type, 'responses') or {}
+        self._pattern = re.compile(responses.get('zone_status') or r'(?!)')
+        self._buffer = ''
+        self._original_data_received: Callable[[bytes], None] | None = None
+
+    def start(self) -> bool:
+        """Start parsing unsolicited data.
+
+        Returns:
+            False if the pyxantech protocol cannot be tapped, in which case an
+            error is logged and push updates stay off
+        """
+        if self._original_data_received is not None:
+            return True
+        if (protocol := amp_protocol(self._amp)) is None:
+            LOG.error(
+                'Push updates disabled: the pyxantech protocol lacks one of %s '
+                '(push updates are built against pyxantech %s)',
+                ', '.join(PROTOCOL_INTERNALS),
+                PYXANTECH_VERSION,
+            )
+            return False
+        self._protocol = protocol
+        self._original_data_received = self._protocol.data_received
+        self._protocol.data_received = self._data_received
+        return True
+
+    def stop(self) -> None:
+        """Stop parsing unsolicited data."""
+        if self._original_data_received is None:
+            return
+        self._protocol.data_received = self._original_data_received
+        self._original_data_received = None
+        self._buffer = ''
+
+    def _data_received(self, data: bytes) -> None:
+        """Pass data on to pyxantech and parse it for zone frames."""
+        assert self._original_data_received is not None
+        self._original_data_received(data)
+
+        self._buffer += data.decode('ascii', errors='ignore')
+        end = 0
+        for match in self._pattern.finditer(self._buffer):
+            end = match.end()
+            self._on_status(ZoneStatus.from_dict(match.groupdict()).dict)
+
+        # keep a possibly incomplete trailing frame for the next chunk
+        self._buffer = self._buffer[end:][-PUSH_BUFFER_LIMIT:]
+
+
+def supports_push_updates(amp_type: str | None) -> bool:
+    """Return True if the amp type can report zone changes unprompted."""
+    return amp_type in PUSH_UPDATE_COMMANDS
+
+
+async def async_enable_push_updates(amp: AmpControlBase, amp_type: str) -> None:
+    """Ask the amp to report zone changes as they happen."""
+    eol = get_protocol_config(amp_type, 'command_eol') or ''
+    request = f'{PUSH_UPDATE_COMMANDS[amp_type]}{eol}'.encode('ascii')
+    await _required_protocol(amp).send(request, wait_for_reply=False)
+
+
+def supports_pipelining(amp_type: str | None) -> bool:
+    """Return True if commands can be sent without waiting for each reply."""
+    return amp_type in PIPELINE_ECHOES
+
+
+def clamp_level(amp_type: str | None, attribute: str, value: Any) -> Any:
+    """Clamp a level attribute to the device limits, as pyxantech does.
+
+    Attributes without a device limit (and unknown amp types) are returned
+    unchanged.
+    """
+    if amp_type is None:
+        return value
+    maximum = get_device_config(amp_type, f'max_{attribute}', log_missing=False)
+    if maximum is None:
+        return value
+    return max(0, min(int(value), int(maximum)))
+
+
+def format_command(amp_type: str, template: str, **values: Any) -> bytes:
+    """Frame a command template with the protocol's separator and EOL.
+
+    Matches the framing pyxantech applies to its own commands.
+
+    Returns:
+        Encoded command bytes
+    """
+    separator = get_protocol_config(amp_type, 'command_separator') or ''
+    eol = get_protocol_config(amp_type, 'command_eol') or ''
+    return (template + separator + eol).format(**values).encode('ascii')
+
+
+def zone_command(amp_type: str, zone_id: int, attribute: str, value: Any) -> bytes:
+    """Build the set command for one zone attribute, as pyxantech would.
+
+    Args:
+        amp_type: Amplifier type
+        zone_id: Zone to change
+        attribute: One of COMMAND_ATTRIBUTES
+        value: New value (booleans for power and mute)
+
+    Returns:
+        Encoded command bytes
+    """
+    commands = get_protocol_config(amp_type, 'commands') or {}
+    if (template := commands.get(f'set_{attribute}')) is None:
+        raise ValueError(f'{amp_type} has no command to set {attribute}')
+    value = int(clamp_level(amp_type, attribute, value))
+    return format_command(amp_type, template, zone=zone_id, **{attribute: value})
+
+
+async def async_pipeline(
+    amp: AmpControlBase,
+    amp_type: str,
+    commands: list[bytes],
+    timeout: float = RESPONSE_TIMEOUT,
+) -> list[bytes]:
+    """Send set commands back to back and match their echoes.
+
+    Up to PIPELINE_WINDOW bytes of commands are in flight at once; each echo
+    is matched to the oldest outstanding command for the same zone and command
+    code, and an error reply fails the oldest outstanding command.
+
+    Args:
+        amp: pyxantech async controller
+        amp_type: Amplifier type (must support pipelining)
+        commands: Commands built with zone_command
+        timeout: Seconds to wait for each chunk of replies
+
+    Returns:
+        The commands the amp rejected
+
+    Raises:
+        PipelineTimeout: If the amp stopped echoing before all commands completed
+    """
+    echo = PIPELINE_ECHOES[amp_type]
+    protocol = _required_protocol(amp)
+    pending = list(commands)
+    outstanding: list[tuple[tuple[str, str] | None, bytes]] = []
+    rejected: list[bytes] = []
+    echoed: list[bytes] = []
+    text = ''
+
+    async with protocol._lock:
+        serial_port = await _async_prepare_send(protocol, timeout)
+        queue = protocol._queue
+
+        while pending or outstanding:
+            # fill the window; always allow one command so long ones still go
+            in_flight = sum(len(command) for _, command in outstanding)
+            while pending and (
+                not outstanding or in_flight + len(pending[0]) <= PIPELINE_WINDOW
+            ):
+                command = pending.pop(0)
+                match = echo.search(command.decode('ascii', errors='ignore'))
+                outstanding.append((match.groups() if match else None, command))
+                in_flight += len(command)
+                serial_port.write(command)
+            protocol._last_send = time.time()
+
+            try:
+                text += (await asyncio.wait_for(queue.get(), timeout)).decode(
+                    'ascii', errors='ignore'
+                )
+            except TimeoutError as err:
+                raise PipelineTimeout(
+                    f'No reply to {len(outstanding) + len(pending)} of '
+                    f'{len(commands)} pipelined commands',
+                    echoed,
+                ) from err
+
+            # consume complete echoes and errors in the order they arrived
+            end = 0
+            replies = sorted(
+                [*echo.finditer(text), *PIPELINE_ERROR.finditer(text)],
+                key=lambda reply: reply.start(),
+            )
+            for reply in replies:
+                end = reply.end()
+                if reply.re is PIPELINE_ERROR:
+                    if outstanding:
+                        rejected.append(outstanding.pop(0)[1])
+                    continue
+                for index, (key, command) in enumerate(outstanding):
+                    if key == reply.groups():
+                        echoed.append(command)
+                        del outstanding[index]
+                        break
+            text = text[end:]
+
+    if rejected:
+        LOG.debug('Amp rejected pipelined commands %s', rejected)
+    return rejected
+
+
+class PipelineTimeout(TimeoutError):
+    """The amp stopped echoing before all pipelined commands completed."""
+
+    def __init__(self, message: str, echoed: list[bytes]) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            echoed: Commands the amp echoed, and so applied, before it stopped
+        """
+        super().__init__(message)
+        self.echoed = echoed
+
+
+def supports_framing(amp_type: str | None) -> bool:
+    """Return True if several commands can be joined into one frame."""
+    return amp_type in FRAME_LIMITS
+
+
+def pack_frames(amp_type: str, commands: list[bytes]) -> list[list[bytes]]:
+    """Group commands into as few frames as the amp's frame limit allows.
+
+    Order is preserved; a command longer than the limit gets a frame alone.
+    """
+    limit = FRAME_LIMITS[amp_type]
+    frames: list[list[bytes]] = []
+    size = limit + 1
+    for command in commands:
+        if size + len(command) > limit:
+            frames.append([])
+            size = 0
+        frames[-1].append(command)
+        size += len(command)
+    return frames
+
+
+async def async_send_frame(
+    amp: AmpControlBase,
+    amp_type: str,
+    commands: list[bytes],
+    timeout: float = RESPONSE_TIMEOUT,
+) -> list[bytes]:
+    """Send several commands as one frame and match the replies in order.
+
+    The amp answers each command of the frame in turn ("OK" or "ERROR").
+
+    Returns:
+        The commands the amp rejected
+
+    Raises:
+        TimeoutError: If the amp did not answer the frame at all
+    """
+    eol = get_protocol_config(amp_type, 'response_eol') or '\r'
+
+    def _all_replies_received(text: str) -> bool:
+        return text.count(eol) >= len(commands)
+
+    response = await async_exchange(
+        amp, b''.join(commands), _all_replies_received, timeout
+    )
+    replies = [reply.strip() for reply in response.split(eol)][: len(commands)]
+    if not any(replies):
+        raise TimeoutError(f'No reply to frame of {len(commands)} commands')
+    if len(replies) < len(commands):
+        LOG.debug('Only %d of %d commands answered', len(replies), len(commands))
+    return [
+        command
+        for command, reply in zip(commands, replies, strict=False)
+        if 'ERROR' in reply
+    ]
+
+
+def supports_attribute_queries(amp_type: str | None) -> bool:
+    """Return True if single zone attributes can be queried in frames."""
+    return amp_type in ATTRIBUTE_QUERY_CODES and supports_framing(amp_type)
+
+
+def attribute_query_frames(
+    amp_type: str, zone_ids: list[int], attributes: tuple[str, ...]
+) -> list[list[bytes]]:
+    """Build the framed queries reading some attributes of many zones."""
+    codes = ATTRIBUTE_QUERY_CODES[amp_type]
+    queries = [
+        f'?{zone_id}{codes[attribute]}+'.encode('ascii')
+        for zone_id in zone_ids
+        for attribute in attributes
+    ]
+    return pack_frames(amp_type, queries)
+
+
+async def async_query_frame(
+    amp: AmpControlBase,
+    amp_type: str,
+    queries: list[bytes],
+    timeout: float = RESPONSE_TIMEOUT,
+) -> dict[int, dict[str, Any]]:
+    """Send a frame of attribute queries and parse the replies.
+
+    Returns:
+        Dictionary mapping zone_id to the attributes that were answered
+    """
+    attributes = {code: name for name, code in ATTRIBUTE_QUERY_CODES[amp_type].items()}
+
+    def _all_replies_received(text: str) -> bool:
+        return len(ATTRIBUTE_REPLY.findall(text)) >= len(queries)
+
+    response = await async_exchange(
+        amp, b''.join(queries), _all_replies_received, timeout
+    )
+    statuses: dict[int, dict[str, Any]] = {}
+    for zone, code, value in ATTRIBUTE_REPLY.findall(response):
+        if (attribute := attributes.get(code)) is None:
+            continue
+        # pyxantech reports power and mute as booleans
+        statuses.setdefault(int(zone), {})[attribute] = (
+            value == '1' if attribute in ('power', 'mute') else int(value)
+        )
+    return statuses
@@ -0,0 +1,146 @@
+"""Diagnostic sensors for Xantech Multi-Zone Amplifier transport statistics."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .bus import PRIORITY_COMMAND, PRIORITY_NAMES, PRIORITY_POLL
+from .const import DOMAIN
+from .coordinator import XantechCoordinator
+from .stats import TransportStats
+
+if TYPE_CHECKING:
+    from . import XantechConfigEntry
+
+LOG = logging.getLogger(__name__)
+
+# sensors only read in-memory statistics, so polling them costs no bus traffic
+PARALLEL_UPDATES = 0
+
+
+def _p95(stats: TransportStats, priority: int) -> float | None:
+    """Return the 95th percentile round-trip time of a priority class."""
+    histogram = stats.kinds.get(PRIORITY_NAMES[priority])
+    return histogram.percentile(95) if histogram is not None else None
+
+
+def _histogram_attributes(stats: TransportStats, priority: int) -> dict[str, Any]:
+    """Return the round-trip histogram of a priority class as attributes."""
+    histogram = stats.kinds.get(PRIORITY_NAMES[priority])
+    return histogram.as_dict() if histogram is not None else {}
+
+
+@dataclass(frozen=True, kw_only=True)
+class XantechSensorEntityDescription(SensorEntityDescription):
+    """Describes a transport statistics sensor."""
+
+    value_fn: Callable[[TransportStats], float | int | None]
+    attributes_fn: Callable[[TransportStats], dict[str, Any]] = lambda _: {}
+
+
+LATENCY_SENSOR_KWARGS: dict[str, Any] = {
+    'device_class': SensorDeviceClass.DURATION,
+    'state_class': SensorStateClass.MEASUREMENT,
+    'native_unit_of_measurement': UnitOfTime.MILLISECONDS,
+    'suggested_display_precision': 0,
+}
+
+SENSORS: tuple[XantechSensorEntityDescription, ...] = (
+    XantechSensorEntityDescription(
+        key='poll_duration',
+        translation_key='poll_duration',
+        value_fn=lambda stats: stats.poll_cycle.last_ms,
+        attributes_fn=lambda stats: stats.poll_cycle.as_dict(),
+        **LATENCY_SENSOR_KWARGS,
+    ),
+    XantechSensorEntityDescription(
+        key='poll_latency',
+        translation_key='poll_latency',
+        value_fn=lambda stats: _p95(stats, PRIORITY_POLL),
+        attributes_fn=lambda stats: _histogram_attributes(stats, PRIORITY_POLL),
+        **LATENCY_SENSOR_KWARGS,
+    ),
+    XantechSensorEntityDescription(
+        key='command_latency',
+        translation_key='command_latency',
+        value_fn=lambda stats: _p95(stats, PRIORITY_COMMAND),
+        attributes_fn=lambda stats: _histogram_attributes(stats, PRIORITY_COMMAND),
+        **LATENCY_SENSOR_KWARGS,
+    ),
+    XantechSensorEntityDescription(
+        key='timeouts',
+        translation_key='timeouts',
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.timeouts,
+    ),
+    XantechSensorEntityDescription(
+        key='errors',
+        translation_key='errors',
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.errors,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: XantechConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Xantech diagnostic sensors from a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    async_add_entities(
+        XantechTransportSensor(coordinator, description) for description in SENSORS
+    )
+
+
+class XantechTransportSensor(SensorEntity):
+    """Diagnostic sensor reporting amplifier bus latency and failures."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = True
+
+    entity_description: XantechSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: XantechCoordinator,
+        description: XantechSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._stats = coordinator.stats
+
+        self._attr_unique_id = (
+            f'{DOMAIN}_{coordinator.amp_name}_{description.key}'.lower().replace(
+                ' ', '_'
+            )
+        )
+
+        # the bus is shared by all units, so report it on the first one
+        self._attr_device_info = coordinator.device_info()
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current statistic."""
+        return self.entity_description.value_fn(self._stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return histogram details."""
+        return self.entity_description.attributes_fn(self._stats)
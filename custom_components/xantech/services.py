@@ -0,0 +1,276 @@
+"""Service handlers for Xantech Multi-Zone Amplifier."""
+
+from __future__ import annotations
+
+import logging
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import ATTR_NAME
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_entity_ids
+import voluptuous as vol
+
+from .const import (
+    ATTR_BALANCE,
+    ATTR_BASS,
+    ATTR_MUTE,
+    ATTR_POWER,
+    ATTR_SOURCE,
+    ATTR_TREBLE,
+    ATTR_VOLUME_LEVEL,
+    DOMAIN,
+    MAX_VOLUME,
+)
+from .coordinator import XantechCoordinator, plan_writes
+from .media_player import DATA_ZONE_INDEX
+from .protocol import clamp_level
+
+if TYPE_CHECKING:
+    from . import XantechConfigEntry
+
+LOG = logging.getLogger(__name__)
+
+BULK_SET_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional(ATTR_POWER): cv.boolean,
+        vol.Optional(ATTR_SOURCE): cv.string,
+        vol.Optional(ATTR_VOLUME_LEVEL): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=1)
+        ),
+        vol.Optional(ATTR_MUTE): cv.boolean,
+        vol.Optional(ATTR_BASS): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(ATTR_TREBLE): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(ATTR_BALANCE): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+ZONES_SCHEMA = cv.make_entity_service_schema({})
+SAVE_PRESET_SCHEMA = cv.make_entity_service_schema({vol.Required(ATTR_NAME): cv.string})
+PRESET_SCHEMA = vol.Schema({vol.Required(ATTR_NAME): cv.string})
+
+
+def _requested_state(call: ServiceCall) -> dict[str, Any]:
+    """Return the zone attributes a bulk_set call asks for (source by name)."""
+    state = {
+        attribute: call.data[attribute]
+        for attribute in (
+            ATTR_POWER,
+            ATTR_SOURCE,
+            ATTR_MUTE,
+            ATTR_BASS,
+            ATTR_TREBLE,
+            ATTR_BALANCE,
+        )
+        if attribute in call.data
+    }
+    if ATTR_VOLUME_LEVEL in call.data:
+        state['volume'] = int(call.data[ATTR_VOLUME_LEVEL] * MAX_VOLUME)
+    if not state:
+        raise ServiceValidationError('bulk_set needs at least one zone attribute')
+    return state
+
+
+async def _async_target_zones(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[tuple[str, XantechConfigEntry, int]]:
+    """Return the zone media players a service call targets.
+
+    Device and area targets also expand to the number and sensor entities of
+    this integration and to entities of other integrations; those are skipped.
+
+    Returns:
+        (entity_id, config entry, zone_id) of every targeted zone
+
+    Raises:
+        ServiceValidationError: If no Xantech zone that is set up is targeted
+    """
+    index = hass.data.get(DATA_ZONE_INDEX, {})
+    zones = [
+        (entity_id, *index[entity_id])
+        for entity_id in sorted(await async_extract_entity_ids(hass, call))
+        if entity_id in index
+    ]
+    if not zones:
+        raise ServiceValidationError(
+            f'{call.service} targets no Xantech zone that is set up'
+        )
+    return zones
+
+
+async def _async_apply_states(
+    plans: list[tuple[XantechCoordinator, dict[int, dict[str, Any]]]],
+) -> dict[str, int]:
+    """Diff desired zone states against the cache and write what differs.
+
+    The writes of each amp are sent as one batch; amps run concurrently.
+
+    Returns:
+        Counts of zones, requested and needed writes, and bus operations
+    """
+    # levels beyond the device limits are clamped before diffing, so the
+    # cache holds what the amp actually gets
+    batches = [
+        (
+            coordinator,
+            plan_writes(
+                coordinator.data or {},
+                {
+                    zone_id: {
+                        attribute: clamp_level(coordinator.amp_type, attribute, value)
+                        for attribute, value in state.items()
+                    }
+                    for zone_id, state in desired.items()
+                },
+            ),
+        )
+        for coordinator, desired in plans
+    ]
+    operations = sum(
+        await asyncio.gather(
+            *(coordinator.async_write_batch(writes) for coordinator, writes in batches)
+        )
+    )
+
+    zones = sum(len(desired) for _, desired in plans)
+    requested_writes = sum(
+        len(state) for _, desired in plans for state in desired.values()
+    )
+    writes = sum(len(writes) for _, writes in batches)
+    LOG.debug(
+        'Applied %d zones: %d of %d writes needed in %d bus operations',
+        zones,
+        writes,
+        requested_writes,
+        operations,
+    )
+    return {
+        'zones': zones,
+        'requested_writes': requested_writes,
+        'writes': writes,
+        'bus_operations': operations,
+        'saved_writes': requested_writes - writes,
+    }
+
+
+async def async_bulk_set(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Move many zones to one state with as few bus writes as possible.
+
+    The requested state is diffed against the cached state of every zone, so
+    attributes already at the requested value are not written, and the
+    remaining writes of each amp are sent as one batch.
+    """
+    requested = _requested_state(call)
+    plans: dict[str, tuple[XantechCoordinator, dict[int, dict[str, Any]]]] = {}
+    for _, entry, zone_id in await _async_target_zones(hass, call):
+        state = dict(requested)
+        if (source := state.pop(ATTR_SOURCE, None)) is not None:
+            source_ids = {
+                name: source_id
+                for source_id, name in entry.runtime_data.sources.items()
+            }
+            if source not in source_ids:
+                raise ServiceValidationError(f'Unknown source {source!r}')
+            state['source'] = source_ids[source]
+
+        coordinator = entry.runtime_data.coordinator
+        plans.setdefault(entry.entry_id, (coordinator, {}))[1][zone_id] = state
+
+    return await _async_apply_states(list(plans.values()))
+
+
+async def _async_cached_states(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, tuple[XantechConfigEntry, dict[int, dict[str, Any]]]]:
+    """Return the config entry and cached zone states by config entry ID.
+
+    Nothing is awaited once the targets are resolved, so all zones are read
+    from the same cache state.
+    """
+    targets = await _async_target_zones(hass, call)
+
+    zones: dict[str, tuple[XantechConfigEntry, dict[int, dict[str, Any]]]] = {}
+    for entity_id, entry, zone_id in targets:
+        state = entry.runtime_data.coordinator.snapshot_zones([zone_id])
+        if not state:
+            raise ServiceValidationError(f'The state of {entity_id} is not known yet')
+        zones.setdefault(entry.entry_id, (entry, {}))[1].update(state)
+    return zones
+
+
+async def async_snapshot(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Save the state of the targeted zones for a later restore.
+
+    Snapshots come from the coordinator cache without any bus I/O and are
+    kept across restarts; a zone's previous snapshot is replaced.
+    """
+    zones = await _async_cached_states(hass, call)
+    for entry, snapshots in zones.values():
+        entry.runtime_data.snapshots.async_save_snapshots(snapshots)
+    LOG.debug(
+        'Saved snapshots of %d zones',
+        sum(len(snapshots) for _, snapshots in zones.values()),
+    )
+
+
+async def async_restore(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Restore the targeted zones to their snapshots in one diffed batch.
+
+    Zones without a snapshot are skipped.
+    """
+    plans: dict[str, tuple[XantechCoordinator, dict[int, dict[str, Any]]]] = {}
+    for entity_id, entry, zone_id in await _async_target_zones(hass, call):
+        snapshot = entry.runtime_data.snapshots.snapshots.get(zone_id)
+        if snapshot is None:
+            LOG.warning('Restore called for %s, but no snapshot saved', entity_id)
+            continue
+        coordinator = entry.runtime_data.coordinator
+        plans.setdefault(entry.entry_id, (coordinator, {}))[1][zone_id] = snapshot
+    if not plans:
+        raise ServiceValidationError('No snapshot saved for the targeted zones')
+
+    return await _async_apply_states(list(plans.values()))
+
+
+async def async_save_preset(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Save the current state of the targeted zones as a named preset.
+
+    A preset may span several amps; saving replaces the preset everywhere,
+    including amps none of whose zones were targeted this time.
+    """
+    name = call.data[ATTR_NAME]
+    zones = await _async_cached_states(hass, call)
+
+    for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+        presets = entry.runtime_data.presets
+        if entry.entry_id in zones:
+            await presets.async_save_preset(name, zones[entry.entry_id][1])
+        else:
+            await presets.async_delete_preset(name)
+    LOG.debug('Saved preset %s', name)
+
+
+async def async_apply_preset(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Apply a preset, writing only what differs from the live state."""
+    name = call.data[ATTR_NAME]
+    plans = [
+        (entry.runtime_data.coordinator, preset)
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+        if (preset := entry.runtime_data.presets.presets.get(name)) is not None
+    ]
+    if not plans:
+        raise ServiceValidationError(f'Unknown preset {name!r}')
+    return await _async_apply_states(plans)
+
+
+async def async_delete_preset(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Delete a preset from every amp."""
+    name = call.data[ATTR_NAME]
+    deleted = [
+        await entry.runtime_data.presets.async_delete_preset(name)
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+    ]
+    if not any(deleted):
+        raise ServiceValidationError(f'Unknown preset {name!r}')
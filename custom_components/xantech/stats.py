@@ -0,0 +1,115 @@
+"""Transport latency statistics for Xantech Multi-Zone Amplifier."""
+
+from __future__ import annotations
+
+import logging
+import bisect
+from typing import Any, Final
+
+LOG = logging.getLogger(__name__)
+
+# histogram bucket upper bounds in milliseconds; slower samples go to overflow
+LATENCY_BUCKETS_MS: Final[tuple[float, ...]] = (
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of operation durations."""
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms: float | None = None
+
+    def record(self, duration: float) -> None:
+        """Record one duration given in seconds."""
+        ms = duration * 1000
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.last_ms = ms
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the bucket upper bound containing the given percentile.
+
+        Samples beyond the last bucket report the largest duration seen.
+        """
+        if not self.count:
+            return None
+        rank = self.count * percent / 100
+        seen = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS_MS, self.counts, strict=False):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics and sensor attributes."""
+        labels = [f'le_{bound:g}ms' for bound in LATENCY_BUCKETS_MS] + ['overflow']
+        avg = self.total_ms / self.count if self.count else 0.0
+        p95 = self.percentile(95)
+        return {
+            'count': self.count,
+            'avg_ms': round(avg, 1),
+            'p95_ms': round(p95, 1) if p95 is not None else None,
+            'max_ms': round(self.max_ms, 1),
+            'buckets': dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class TransportStats:
+    """Round-trip times, poll cycle durations and failure counts of one amp."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.operations: dict[str, LatencyHistogram] = {}
+        self.kinds: dict[str, LatencyHistogram] = {}
+        self.poll_cycle = LatencyHistogram()
+        self.timeouts = 0
+        self.errors = 0
+
+    def record(self, operation: str, kind: str, duration: float) -> None:
+        """Record the round-trip time of one amp operation.
+
+        Args:
+            operation: Operation name (e.g. zone_status, set_volume)
+            kind: Operation class the sample is also aggregated under
+            duration: Round-trip time in seconds
+        """
+        self.operations.setdefault(operation, LatencyHistogram()).record(duration)
+        self.kinds.setdefault(kind, LatencyHistogram()).record(duration)
+
+    def record_timeout(self) -> None:
+        """Count an operation the amp did not answer in time."""
+        self.timeouts += 1
+
+    def record_error(self) -> None:
+        """Count an operation that failed for any other reason."""
+        self.errors += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all statistics for diagnostics."""
+        return {
+            'poll_cycle': self.poll_cycle.as_dict(),
+            'kinds': {kind: hist.as_dict() for kind, hist in self.kinds.items()},
+            'operations': {
+                operation: hist.as_dict()
+                for operation, hist in sorted(self.operations.items())
+            },
+            'timeouts': self.timeouts,
+            'errors': self.errors,
+        }
@@ -0,0 +1,146 @@
+"""Persistent zone state, preset and snapshot storage for Xantech amplifiers."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+LOG = logging.getLogger(__name__)
+
+STORAGE_VERSION: Final = 1
+
+# seconds to batch zone changes before writing them to disk
+SAVE_DELAY: Final = 10
+
+# seconds before new snapshots are written to disk
+SNAPSHOT_SAVE_DELAY: Final = 1
+
+
+class ZoneStateStore:
+    """Save the last known zone states so setup does not wait on the amp."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for a config entry."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, f'{DOMAIN}.{entry_id}.zones'
+        )
+
+    async def async_load(self) -> dict[int, dict[str, Any]]:
+        """Return the cached zone states (empty if nothing was saved)."""
+        try:
+            stored = await self._store.async_load()
+        except Exception:
+            LOG.warning('Failed to load cached zone states', exc_info=True)
+            return {}
+        if not stored:
+            return {}
+        # JSON object keys are strings
+        return {int(zone_id): status for zone_id, status in stored.items()}
+
+    def async_save(self, zone_statuses: dict[int, dict[str, Any]]) -> None:
+        """Schedule the zone states to be written to disk."""
+        self._store.async_delay_save(
+            lambda: {str(zone_id): status for zone_id, status in zone_statuses.items()},
+            SAVE_DELAY,
+        )
+
+    async def async_remove(self) -> None:
+        """Delete the cached zone states."""
+        await self._store.async_remove()
+
+
+class PresetStore:
+    """Named multi-zone presets of one amp, saved in Home Assistant storage."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for a config entry."""
+        self._store: Store[dict[str, dict[str, dict[str, Any]]]] = Store(
+            hass, STORAGE_VERSION, f'{DOMAIN}.{entry_id}.presets'
+        )
+        self.presets: dict[str, dict[int, dict[str, Any]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the saved presets."""
+        try:
+            stored = await self._store.async_load()
+        except Exception:
+            LOG.warning('Failed to load presets', exc_info=True)
+            return
+        # JSON object keys are strings
+        self.presets = {
+            name: {int(zone_id): state for zone_id, state in zones.items()}
+            for name, zones in (stored or {}).items()
+        }
+
+    async def async_save_preset(
+        self, name: str, zones: dict[int, dict[str, Any]]
+    ) -> None:
+        """Save (or replace) a preset mapping zone_id to its zone state."""
+        self.presets[name] = zones
+        await self._async_save()
+
+    async def async_delete_preset(self, name: str) -> bool:
+        """Delete a preset, returning False if it did not exist."""
+        if self.presets.pop(name, None) is None:
+            return False
+        await self._async_save()
+        return True
+
+    async def _async_save(self) -> None:
+        await self._store.async_save(
+            {
+                name: {str(zone_id): state for zone_id, state in zones.items()}
+                for name, zones in self.presets.items()
+            }
+        )
+
+    async def async_remove(self) -> None:
+        """Delete all presets."""
+        await self._store.async_remove()
+
+
+class SnapshotStore:
+    """Zone snapshots of one amp, kept across Home Assistant restarts.
+
+    Snapshots are held in memory and written to disk with a short delay, so
+    taking one never waits on the disk; pending writes are flushed when Home
+    Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for a config entry."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, f'{DOMAIN}.{entry_id}.snapshots'
+        )
+        self.snapshots: dict[int, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the saved snapshots."""
+        try:
+            stored = await self._store.async_load()
+        except Exception:
+            LOG.warning('Failed to load zone snapshots', exc_info=True)
+            return
+        # JSON object keys are strings
+        self.snapshots = {
+            int(zone_id): state for zone_id, state in (stored or {}).items()
+        }
+
+    def async_save_snapshots(self, zones: dict[int, dict[str, Any]]) -> None:
+        """Replace the snapshots of the given zones and schedule a save."""
+        self.snapshots.update(zones)
+        self._store.async_delay_save(
+            lambda: {str(zone_id): state for zone_id, state in self.snapshots.items()},
+            SNAPSHOT_SAVE_DELAY,
+        )
+
+    async def async_remove(self) -> None:
+        """Delete all snapshots."""
+        await self._store.async_remove()
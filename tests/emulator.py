@@ -0,0 +1,385 @@
+"""TCP emulator of Xantech, Monoprice and Dayton Audio amplifiers.
+
+Serves the RS232 protocols pyxantech speaks over a local TCP socket, so the
+integration can be driven end to end through a ``socket://host:port`` URL
+without hardware. Zone state is kept between requests, and line speed,
+jitter, dropped responses and keypad changes can be simulated.
+
+Run standalone with::
+
+    python -m tests.emulator --amp-type xantech8 --port 4999
+"""
+
+from __future__ import annotations
+
+import logging
+import argparse
+import asyncio
+from collections import deque
+import contextlib
+import random
+import re
+from typing import Any
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_BAUD = 9600
+
+# 8 data bits plus start and stop bit per byte on the wire
+BITS_PER_BYTE = 10
+
+MONOPRICE_STYLE = ('monoprice6', 'dax88')
+SUPPORTED_AMP_TYPES = ('xantech8', *MONOPRICE_STYLE)
+
+ZONES_PER_UNIT = {'xantech8': 8, 'monoprice6': 6, 'dax88': 8}
+
+DEFAULT_BALANCE = {'xantech8': 32, 'monoprice6': 10, 'dax88': 10}
+
+# command codes for each zone attribute
+XANTECH_CODES = {
+    'PR': 'power',
+    'SS': 'source',
+    'VO': 'volume',
+    'MU': 'mute',
+    'TR': 'treble',
+    'BS': 'bass',
+    'BA': 'balance',
+}
+MONOPRICE_CODES = {
+    'PR': 'power',
+    'CH': 'source',
+    'VO': 'volume',
+    'MU': 'mute',
+    'TR': 'treble',
+    'BS': 'bass',
+    'BL': 'balance',
+}
+
+# xantech relative commands: code -> (attribute, step)
+XANTECH_STEPS = {
+    'VI': ('volume', 1),
+    'VD': ('volume', -1),
+    'BI': ('bass', 1),
+    'BD': ('bass', -1),
+    'TI': ('treble', 1),
+    'TD': ('treble', -1),
+    'BL': ('balance', 1),
+    'BR': ('balance', -1),
+}
+
+LIMITS = {
+    'volume': (0, 38),
+    'treble': (0, 14),
+    'bass': (0, 14),
+    'source': (1, 8),
+}
+
+XANTECH_ZONE_QUERY = re.compile(r'\?(\d+)ZD')
+XANTECH_ATTRIBUTE_QUERY = re.compile(r'\?(\d+)(PR|SS|VO|MU|TR|BS|BA)')
+XANTECH_SET = re.compile(r'!(\d+)(PR|SS|VO|MU|TR|BS|BA)(\d+)')
+XANTECH_TOGGLE = re.compile(r'!(\d+)(PT|MT)')
+XANTECH_STEP = re.compile(r'!(\d+)(VI|VD|BI|BD|TI|TD|BL|BR)')
+XANTECH_UPDATES = re.compile(r'!Z([AP])([01])')
+
+MONOPRICE_QUERY = re.compile(r'\?(\d)(\d)')
+MONOPRICE_SET = re.compile(r'<(\d\d)(PR|CH|VO|MU|TR|BS|BL)(\d\d)')
+
+
+class AmpEmulator:
+    """Stateful amplifier served over TCP."""
+
+    def __init__(
+        self,
+        amp_type: str = 'xantech8',
+        *,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        units: int = 1,
+        baud: int | None = DEFAULT_BAUD,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the emulator.
+
+        Args:
+            amp_type: xantech8, monoprice6 or dax88
+            host: Interface to listen on
+            port: TCP port to listen on (0 picks a free port)
+            units: Number of chained amplifier units (zones 11.., 21.., 31..)
+            baud: Simulated line speed; None or 0 answers instantly
+            jitter: Maximum extra random delay per response in seconds
+            drop_rate: Probability (0-1) that a response is never sent
+            seed: Seed for jitter and drops, for reproducible runs
+        """
+        if amp_type not in SUPPORTED_AMP_TYPES:
+            raise ValueError(f'Unsupported amp type {amp_type}')
+
+        self.amp_type = amp_type
+        self.host = host
+        self.port = port
+        self.byte_delay = BITS_PER_BYTE / baud if baud else 0.0
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self._random = random.Random(seed)
+
+        self.zones: dict[int, dict[str, Any]] = {
+            unit * 10 + zone: self._default_zone()
+            for unit in range(1, units + 1)
+            for zone in range(1, ZONES_PER_UNIT[amp_type] + 1)
+        }
+        self.activity_updates = False
+
+        self.request_count = 0
+        self.dropped_count = 0
+        self.command_log: deque[str] = deque(maxlen=1000)
+
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def url(self) -> str:
+        """Return the pyserial URL for connecting to this emulator."""
+        return f'socket://{self.host}:{self.port}'
+
+    @property
+    def terminator(self) -> str:
+        """Return the character ending each request."""
+        return '+' if self.amp_type == 'xantech8' else '\r'
+
+    def _default_zone(self) -> dict[str, Any]:
+        return {
+            'power': False,
+            'source': 1,
+            'volume': 20,
+            'mute': False,
+            'treble': 7,
+            'bass': 7,
+            'balance': DEFAULT_BALANCE[self.amp_type],
+        }
+
+    async def start(self) -> None:
+        """Start listening; the chosen port is stored in self.port."""
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        LOG.info('Emulating %s at %s', self.amp_type, self.url)
+
+    async def stop(self) -> None:
+        """Close all connections and stop listening."""
+        for writer in list(self._writers):
+            writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> AmpEmulator:
+        """Start the emulator as an async context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the emulator."""
+        await self.stop()
+
+    async def inject_keypad_change(self, zone_id: int, **changes: Any) -> None:
+        """Change a zone as if someone used its wall keypad.
+
+        With activity updates enabled (xantech8 "!ZA1"), the new zone status
+        is also sent to every connected client.
+        """
+        self.zones[zone_id].update(changes)
+        self.command_log.append(f'keypad {zone_id} {changes}')
+        if self.activity_updates:
+            frame = self._zone_frame(zone_id).encode('ascii')
+            for writer in list(self._writers):
+                writer.write(frame)
+                await writer.drain()
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._writers.add(writer)
+        buffer = ''
+        try:
+            while data := await reader.read(1024):
+                buffer += data.decode('ascii', errors='ignore')
+                *requests, buffer = buffer.split(self.terminator)
+                for request in requests:
+                    # tolerate the CR/LF some clients append
+                    if request := request.strip('\r\n'):
+                        await self._respond(writer, request)
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, request: str) -> None:
+        self.request_count += 1
+        self.command_log.append(request)
+        if self.amp_type == 'xantech8':
+            response = self._handle_xantech(request)
+        else:
+            response = self._handle_monoprice(request)
+
+        delay = (len(request) + 1 + len(response)) * self.byte_delay
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.drop_rate and self._random.random() < self.drop_rate:
+            self.dropped_count += 1
+            LOG.debug('Dropping response to %s', request)
+            return
+
+        writer.write(response.encode('ascii'))
+        await writer.drain()
+
+    def _zone(self, zone_id: int) -> dict[str, Any] | None:
+        # xantech single digit zones address the first unit
+        if self.amp_type == 'xantech8' and zone_id < 10:
+            zone_id += 10
+        return self.zones.get(zone_id)
+
+    def _set(self, zone: dict[str, Any], attribute: str, value: int) -> None:
+        if attribute in ('power', 'mute'):
+            zone[attribute] = bool(value)
+            return
+        low, high = LIMITS.get(attribute, (0, 63))
+        zone[attribute] = min(max(value, low), high)
+
+    def _zone_frame(self, zone_id: int) -> str:
+        """Return the zone status frame as the amp would send it."""
+        zone = self._zone(zone_id)
+        assert zone is not None
+        if self.amp_type == 'xantech8':
+            return (
+                f'#{zone_id}ZS PR{zone["power"]:d} SS{zone["source"]}'
+                f' VO{zone["volume"]} MU{zone["mute"]:d} TR{zone["treble"]}'
+                f' BS{zone["bass"]} BA{zone["balance"]} LS0 PS0+\r'
+            )
+        if self.amp_type == 'dax88':
+            return (
+                f'>{zone_id:02}00{zone["power"]:02d}{zone["mute"]:02d}00'
+                f'{zone["volume"]:02}{zone["treble"]:02}{zone["bass"]:02}'
+                f'{zone["balance"]:02}{zone["source"]:02}00\r\r\n'
+            )
+        return (
+            f'#>{zone_id:02}{zone["power"]:02d}{zone["source"]:02}'
+            f'{zone["mute"]:02d}0{zone["volume"]:02}{zone["treble"]:02}'
+            f'{zone["bass"]:02}{zone["balance"]:02}0000\r\r\n'
+        )
+
+    def _handle_xantech(self, request: str) -> str:
+        if match := XANTECH_ZONE_QUERY.fullmatch(request):
+            zone_id = int(match[1])
+            if self._zone(zone_id) is None:
+                return 'ERROR\r'
+            return self._zone_frame(zone_id)
+
+        if match := XANTECH_ATTRIBUTE_QUERY.fullmatch(request):
+            zone = self._zone(int(match[1]))
+            if zone is None:
+                return 'ERROR\r'
+            value = zone[XANTECH_CODES[match[2]]]
+            return f'?{match[1]}{match[2]}{int(value)}+\r'
+
+        if match := XANTECH_SET.fullmatch(request):
+            zone = self._zone(int(match[1]))
+            if zone is None:
+                return 'ERROR\r'
+            self._set(zone, XANTECH_CODES[match[2]], int(match[3]))
+            return 'OK\r'
+
+        if match := XANTECH_TOGGLE.fullmatch(request):
+            zone = self._zone(int(match[1]))
+            if zone is None:
+                return 'ERROR\r'
+            attribute = 'power' if match[2] == 'PT' else 'mute'
+            zone[attribute] = not zone[attribute]
+            return 'OK\r'
+
+        if match := XANTECH_STEP.fullmatch(request):
+            zone = self._zone(int(match[1]))
+            if zone is None:
+                return 'ERROR\r'
+            attribute, step = XANTECH_STEPS[match[2]]
+            self._set(zone, attribute, zone[attribute] + step)
+            return 'OK\r'
+
+        if request == '!AO':
+            for zone in self.zones.values():
+                zone['power'] = False
+            return 'OK\r'
+
+        if match := XANTECH_UPDATES.fullmatch(request):
+            if match[1] == 'A':
+                self.activity_updates = match[2] == '1'
+            return 'OK\r'
+
+        return 'ERROR\r'
+
+    def _handle_monoprice(self, request: str) -> str:
+        # pyxantech appends the '#' command separator for monoprice6
+        request = request.removesuffix('#')
+        if match := MONOPRICE_QUERY.fullmatch(request):
+            unit, zone = int(match[1]), int(match[2])
+            if zone == 0:
+                # unit inquiry: every zone on the unit
+                zone_ids = [z for z in self.zones if z // 10 == unit]
+            else:
+                zone_ids = [unit * 10 + zone] if unit * 10 + zone in self.zones else []
+            if not zone_ids:
+                return 'Command Error.\r\r\n#'
+            return ''.join(self._zone_frame(z) for z in zone_ids) + '#'
+
+        if match := MONOPRICE_SET.fullmatch(request):
+            zone = self.zones.get(int(match[1]))
+            if zone is None:
+                return 'Command Error.\r\r\n#'
+            self._set(zone, MONOPRICE_CODES[match[2]], int(match[3]))
+            # monoprice style amps echo commands back
+            return f'{request}\r\r\n#'
+
+        return 'Command Error.\r\r\n#'
+
+
+def main() -> None:
+    """Run an emulator until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--amp-type', choices=SUPPORTED_AMP_TYPES, default='xantech8')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=4999)
+    parser.add_argument('--units', type=int, default=1)
+    parser.add_argument('--baud', type=int, default=DEFAULT_BAUD)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--drop-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    async def _run() -> None:
+        emulator = AmpEmulator(
+            args.amp_type,
+            host=args.host,
+            port=args.port,
+            units=args.units,
+            baud=args.baud,
+            jitter=args.jitter,
+            drop_rate=args.drop_rate,
+            seed=args.seed,
+        )
+        async with emulator:
+            await asyncio.Event().wait()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_run())
+
+
+if __name__ == '__main__':
+    main()
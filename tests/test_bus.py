@@ -0,0 +1,113 @@
+"""Tests for the Xantech bus scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.xantech.bus import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    BusScheduler,
+)
+
+
+async def test_bus_runs_operation() -> None:
+    """Test an operation on an idle bus runs immediately."""
+    bus = BusScheduler('test_amp')
+
+    async def operation(value: int) -> int:
+        return value * 2
+
+    assert await bus.async_run(operation, 21) == 42
+    assert bus.queue_depth == 0
+    assert bus.wait_stats[PRIORITY_POLL].count == 1
+    assert bus.busy_time[PRIORITY_POLL] > 0
+    assert bus.busy_time[PRIORITY_COMMAND] == 0
+
+
+async def test_bus_commands_preempt_polls() -> None:
+    """Test queued commands run before queued poll queries."""
+    bus = BusScheduler('test_amp')
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def operation(name: str) -> None:
+        if name == 'poll 1':
+            await release.wait()
+        order.append(name)
+
+    tasks = [asyncio.create_task(bus.async_run(operation, 'poll 1'))]
+    await asyncio.sleep(0)
+    tasks += [
+        asyncio.create_task(bus.async_run(operation, name))
+        for name in ('poll 2', 'poll 3')
+    ]
+    tasks.append(
+        asyncio.create_task(
+            bus.async_run(operation, 'command', priority=PRIORITY_COMMAND)
+        )
+    )
+    await asyncio.sleep(0)
+    assert bus.queue_depth == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    # the command only waited for the query already on the wire
+    assert order == ['poll 1', 'command', 'poll 2', 'poll 3']
+    assert bus.as_dict()['wait']['command']['count'] == 1
+
+
+async def test_bus_cancelled_waiter_is_skipped() -> None:
+    """Test a cancelled waiter does not block the bus."""
+    bus = BusScheduler('test_amp')
+    release = asyncio.Event()
+
+    async def blocking() -> None:
+        await release.wait()
+
+    async def quick() -> str:
+        return 'done'
+
+    first = asyncio.create_task(bus.async_run(blocking))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(bus.async_run(quick))
+    waiting = asyncio.create_task(bus.async_run(quick))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    await first
+    assert await waiting == 'done'
+    assert cancelled.cancelled()
+    assert bus.queue_depth == 0
+
+
+async def test_bus_records_round_trip_times() -> None:
+    """Test operation latency and failures are recorded per operation."""
+    bus = BusScheduler('test_amp')
+
+    async def zone_status(zone_id: int) -> dict:
+        return {'zone': zone_id}
+
+    async def set_volume(zone_id: int, volume: int) -> None:
+        raise TimeoutError
+
+    async def set_power(zone_id: int, power: bool) -> None:
+        raise ValueError
+
+    await bus.async_run(zone_status, 11)
+    with pytest.raises(TimeoutError):
+        await bus.async_run(set_volume, 11, 20, priority=PRIORITY_COMMAND)
+    with pytest.raises(ValueError):
+        await bus.async_run(set_power, 11, True, priority=PRIORITY_COMMAND)
+
+    stats = bus.stats
+    assert stats.operations['zone_status'].count == 1
+    assert stats.operations['set_volume'].count == 1
+    assert stats.kinds['poll'].count == 1
+    assert stats.kinds['command'].count == 2
+    assert stats.timeouts == 1
+    assert stats.errors == 1
@@ -220,3 +220,18 @@ def test_options_flow_stores_config_entry_correctly() -> None:
     assert hasattr(flow, '_config_entry'), 'Flow must store entry in _config_entry'
     assert flow._config_entry is mock_entry
     assert flow._config_entry.data['port'] == '/dev/ttyUSB0'
+
+
+def test_default_zones_text_for_chained_units() -> None:
+    """Test default zones continue at 21 and 31 for daisy-chained units."""
+    from custom_components.xantech.config_flow import XantechConfigFlow
+
+    flow = XantechConfigFlow()
+
+    single = flow._get_default_zones_text('monoprice6')
+    assert single.splitlines()[-1] == '16: Dining Room'
+
+    chained = flow._get_default_zones_text('monoprice6', units=3)
+    zone_ids = [int(line.split(':')[0]) for line in chained.splitlines()]
+    assert zone_ids == [*range(11, 17), *range(21, 27), *range(31, 37)]
+    assert '21: Zone 21' in chained
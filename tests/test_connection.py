@@ -0,0 +1,78 @@
+"""Tests for Xantech connection supervision."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from serial import SerialException
+
+from custom_components.xantech.connection import (
+    ConnectionSupervisor,
+    is_transport_error,
+    transport_closed,
+)
+
+
+def test_is_transport_error() -> None:
+    """Test timeouts and I/O errors count as transport errors."""
+    assert is_transport_error(TimeoutError())
+    assert is_transport_error(SerialException('port closed'))
+    assert is_transport_error(ConnectionResetError())
+    assert not is_transport_error(ValueError())
+
+
+def test_transport_closed() -> None:
+    """Test closed or missing transports are detected."""
+    amp = MagicMock()
+    amp._protocol._transport.is_closing.return_value = False
+    assert not transport_closed(amp)
+
+    amp._protocol._transport.is_closing.return_value = True
+    assert transport_closed(amp)
+
+    amp._protocol._transport = None
+    assert transport_closed(amp)
+
+    # a controller without the expected internals counts as closed
+    assert transport_closed(MagicMock(spec=[]))
+
+
+def test_supervisor_backoff() -> None:
+    """Test the backoff doubles per failure and is capped."""
+    supervisor = ConnectionSupervisor('test_amp', min_backoff=5, max_backoff=60)
+
+    with patch('custom_components.xantech.connection.random.uniform', return_value=1):
+        delays = [supervisor.record_failure(TimeoutError()) for _ in range(6)]
+
+    assert delays == [5, 10, 20, 40, 60, 60]
+    assert not supervisor.online
+    assert supervisor.failures == 6
+
+
+def test_supervisor_jitter_stays_within_bounds() -> None:
+    """Test jittered delays stay within +/-20% and below the maximum."""
+    supervisor = ConnectionSupervisor('test_amp', min_backoff=10, max_backoff=40)
+
+    first = supervisor.record_failure(TimeoutError())
+    for _ in range(10):
+        last = supervisor.record_failure(TimeoutError())
+
+    assert 8 <= first <= 12
+    assert 32 <= last <= 40
+
+
+def test_supervisor_logs_transitions_only(caplog) -> None:
+    """Test only losing and restoring the connection is logged above debug."""
+    supervisor = ConnectionSupervisor('test_amp')
+    assert not supervisor.record_success()
+
+    for _ in range(5):
+        supervisor.record_failure(TimeoutError('no reply'))
+    assert supervisor.record_success()
+    assert supervisor.online
+    assert supervisor.failures == 0
+
+    messages = [r.message for r in caplog.records if r.levelname != 'DEBUG']
+    assert len(messages) == 2
+    assert 'Lost connection to test_amp (no reply)' in messages[0]
+    assert 'restored' in messages[1]
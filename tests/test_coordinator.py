@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from datetime import timedelta
+import time
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
 import pytest
+from serial import SerialException
 
-from custom_components.xantech.coordinator import XantechCoordinator
+from custom_components.xantech.const import DOMAIN
+from custom_components.xantech.coordinator import (
+    XantechCoordinator,
+    changed_attributes,
+    plan_writes,
+)
+from custom_components.xantech.polling import AdaptivePollInterval, AutoPollInterval
+from custom_components.xantech.protocol import PipelineTimeout
 
 
 @pytest.fixture
@@ -67,6 +79,481 @@ async def test_coordinator_update_partial_failure(
     assert 12 not in coordinator.data
 
 
+async def test_coordinator_update_unit_status(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test amps with unit status inquiries poll once per unit."""
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12, 13, 21],
+        scan_interval=30,
+        amp_type='monoprice6',
+    )
+    unit_statuses = {
+        1: {
+            11: {'zone': 11, 'power': True, 'volume': 10, 'mute': False, 'source': 1},
+            12: {'zone': 12, 'power': False, 'volume': 5, 'mute': False, 'source': 2},
+            # zone 14 is not configured and must be ignored
+            14: {'zone': 14, 'power': True, 'volume': 5, 'mute': False, 'source': 2},
+        },
+        2: {},
+    }
+
+    with patch(
+        'custom_components.xantech.coordinator.async_unit_status',
+        new_callable=AsyncMock,
+        side_effect=lambda amp, amp_type, unit: unit_statuses[unit],
+    ) as mock_unit_status:
+        await coordinator.async_refresh()
+
+    assert mock_unit_status.call_count == 2
+    assert coordinator.data[11]['volume'] == 10
+    assert coordinator.data[12]['source'] == 2
+    assert 14 not in coordinator.data
+
+    # zones missing from the unit responses fall back to per-zone queries
+    assert [call.args[0] for call in mock_amp.zone_status.call_args_list] == [13, 21]
+    assert coordinator.data[13]['volume'] == 20
+
+
+async def test_coordinator_unit_devices(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test zones of daisy-chained units are grouped into a device per unit."""
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12, 21, 31, 38],
+        amp_type='xantech8',
+    )
+    assert coordinator.units == [1, 2, 3]
+
+    # the first unit keeps the amp-wide device of single unit installations
+    assert coordinator.device_info(12)['identifiers'] == {(DOMAIN, 'test_amp')}
+    assert coordinator.device_info() == coordinator.device_info(11)
+    assert 'via_device' not in coordinator.device_info(11)
+
+    unit3 = coordinator.device_info(38)
+    assert unit3['identifiers'] == {(DOMAIN, 'test_amp_unit_3')}
+    assert unit3['via_device'] == (DOMAIN, 'test_amp')
+    assert coordinator.device_info(31) == unit3
+
+
+async def test_coordinator_adaptive_polling(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test adaptive polling backs off while idle and speeds up on change."""
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11],
+        scan_interval=30,
+        poll_policy=AdaptivePollInterval(
+            idle_interval=30, min_interval=5, max_interval=120, decay=2.0
+        ),
+    )
+    assert coordinator.update_interval.total_seconds() == 30
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    # zone is on and unchanged, so the interval stays at the idle interval
+    assert coordinator.update_interval.total_seconds() == 30
+
+    mock_amp.zone_status.return_value = {
+        'power': True,
+        'volume': 30,
+        'mute': False,
+        'source': 1,
+    }
+    await coordinator.async_refresh()
+    assert coordinator.update_interval.total_seconds() == 5
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval.total_seconds() == 10
+
+
+async def test_coordinator_push_updates(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test pushed zone changes update the cache and slow down polling."""
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11],
+        scan_interval=30,
+        amp_type='xantech8',
+        poll_policy=AdaptivePollInterval(idle_interval=30),
+    )
+    await coordinator.async_refresh()
+    listener = MagicMock()
+
+    with (
+        patch(
+            'custom_components.xantech.coordinator.PushUpdateListener',
+            return_value=listener,
+        ) as mock_listener_cls,
+        patch(
+            'custom_components.xantech.coordinator.async_enable_push_updates',
+            new_callable=AsyncMock,
+        ) as mock_enable,
+    ):
+        assert await coordinator.async_start_push_updates()
+
+    mock_enable.assert_awaited_once_with(mock_amp, 'xantech8')
+    listener.start.assert_called_once()
+    assert coordinator.push_active
+    assert coordinator.poll_policy is None
+    assert coordinator.update_interval.total_seconds() == 300
+
+    on_status = mock_listener_cls.call_args.args[2]
+    updates = MagicMock()
+    unsub = coordinator.async_add_listener(updates)
+    on_status({'zone': 11, 'power': True, 'volume': 33})
+    on_status({'zone': 11, 'power': True, 'volume': 33})
+    # zones that are not configured are ignored
+    on_status({'zone': 12, 'power': True, 'volume': 5})
+    unsub()
+
+    assert coordinator.data[11]['volume'] == 33
+    assert updates.call_count == 1
+    assert 12 not in coordinator.data
+
+    coordinator.async_stop_push_updates()
+    listener.stop.assert_called_once()
+    assert not coordinator.push_active
+
+
+async def test_coordinator_push_updates_unsupported(
+    coordinator: XantechCoordinator,
+) -> None:
+    """Test push updates fall back to polling for unsupported amps."""
+    assert not await coordinator.async_start_push_updates()
+    assert not coordinator.push_active
+    assert coordinator.update_interval.total_seconds() == 30
+
+
+async def test_coordinator_push_updates_without_protocol_internals(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test push updates stay off if the pyxantech protocol cannot be tapped."""
+    mock_amp._protocol = object()
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11],
+        amp_type='xantech8',
+    )
+
+    with patch(
+        'custom_components.xantech.coordinator.async_enable_push_updates',
+        new_callable=AsyncMock,
+    ) as mock_enable:
+        assert not await coordinator.async_start_push_updates()
+
+    mock_enable.assert_not_called()
+    assert not coordinator.push_active
+
+
+def test_changed_attributes() -> None:
+    """Test zone status diffing."""
+    previous = {
+        11: {'power': True, 'volume': 20},
+        12: {'power': False, 'volume': 5},
+        13: {'power': True, 'volume': 5},
+    }
+    current = {
+        11: {'power': True, 'volume': 21},
+        12: {'power': False, 'volume': 5},
+        14: {'power': True},
+    }
+
+    assert changed_attributes(previous, current) == {
+        11: {'volume'},
+        13: {'power', 'volume'},
+        14: {'power'},
+    }
+
+
+def test_plan_writes() -> None:
+    """Test writes are diffed and ordered power on, settings, power off."""
+    current = {
+        11: {'power': True, 'volume': 20, 'source': 1},
+        12: {'power': False, 'volume': 20, 'source': 1},
+    }
+    desired = {
+        11: {'power': False, 'volume': 20, 'source': 2},
+        12: {'power': True, 'volume': 25, 'source': 1, 'bass': 7},
+        13: {'mute': True},
+    }
+
+    assert plan_writes(current, desired) == [
+        (12, 'power', True),
+        (11, 'source', 2),
+        (12, 'volume', 25),
+        (13, 'mute', True),
+        (12, 'bass', 7),
+        (11, 'power', False),
+    ]
+    assert plan_writes(current, {11: {'power': True, 'volume': 20}}) == []
+
+
+async def test_coordinator_notifies_changed_zones_only(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test listeners are only called when their zone or attribute changed."""
+    await coordinator.async_refresh()
+
+    zone_11 = MagicMock()
+    zone_12 = MagicMock()
+    zone_11_volume = MagicMock()
+    zone_11_bass = MagicMock()
+    any_zone = MagicMock()
+    removed = MagicMock()
+    unsubs = [
+        coordinator.async_add_listener(zone_11, 11),
+        coordinator.async_add_listener(zone_12, 12),
+        coordinator.async_add_listener(zone_11_volume, (11, 'volume')),
+        coordinator.async_add_listener(zone_11_bass, (11, 'bass')),
+        coordinator.async_add_listener(any_zone),
+    ]
+    coordinator.async_add_listener(removed, 11)()
+
+    # unchanged poll notifies nobody
+    await coordinator.async_refresh()
+    assert zone_11.call_count == zone_12.call_count == 0
+
+    async def zone_status(zone_id: int) -> dict:
+        volume = 25 if zone_id == 11 else 20
+        return {'power': True, 'volume': volume, 'mute': False, 'source': 1}
+
+    mock_amp.zone_status.side_effect = zone_status
+    await coordinator.async_refresh()
+
+    assert zone_11.call_count == 1
+    assert zone_11_volume.call_count == 1
+    assert zone_12.call_count == 0
+    assert zone_11_bass.call_count == 0
+    assert any_zone.call_count == 1
+    removed.assert_not_called()
+
+    # availability changes notify every listener
+    with patch.object(
+        coordinator, '_async_update_data', side_effect=UpdateFailed('offline')
+    ):
+        await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert zone_12.call_count == 1
+    assert zone_11_bass.call_count == 1
+
+    for unsub in unsubs:
+        unsub()
+    assert not coordinator._context_listeners
+
+
+async def test_coordinator_restore_cached_data(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test cached zones are stale until a live read confirms them."""
+    store = MagicMock()
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12],
+        scan_interval=30,
+        store=store,
+    )
+    cached = {'power': True, 'volume': 20, 'mute': False, 'source': 1}
+    # zone 13 is no longer configured and is dropped
+    coordinator.async_restore_cached_data({11: cached, 12: cached, 13: cached})
+
+    assert coordinator.data == {11: cached, 12: cached}
+    assert coordinator.stale_zones == {11, 12}
+
+    zone_11 = MagicMock()
+    unsub = coordinator.async_add_listener(zone_11, 11)
+
+    async def zone_status(zone_id: int) -> dict:
+        if zone_id == 12:
+            raise Exception('Zone 12 failed')
+        return cached
+
+    mock_amp.zone_status.side_effect = zone_status
+    await coordinator.async_refresh()
+    unsub()
+
+    # zone 11 is unchanged but no longer stale, so its entities update;
+    # zone 12 keeps its cached state until it answers
+    assert coordinator.stale_zones == {12}
+    assert coordinator.data[12] == cached
+    assert zone_11.call_count == 1
+    store.async_save.assert_not_called()
+
+    coordinator._async_apply_zone_update(11, {'volume': 25})
+    store.async_save.assert_called_once_with(coordinator.data)
+
+
+async def test_coordinator_dead_link_aborts_cycle(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test a transport error on the first zone stops the cycle and backs off."""
+    mock_amp.zone_status.side_effect = TimeoutError
+
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert mock_amp.zone_status.call_count == 1
+    assert not coordinator.supervisor.online
+    assert 4 <= coordinator.update_interval.total_seconds() <= 6
+
+    # commands fail fast while the amp is unreachable
+    with pytest.raises(ConnectionError):
+        await coordinator.async_set_zone_power(11, True)
+    mock_amp.set_power.assert_not_called()
+
+    # each later attempt is a single heartbeat query
+    await coordinator.async_refresh()
+    assert mock_amp.zone_status.call_count == 2
+    assert coordinator.supervisor.failures == 2
+
+    mock_amp.zone_status.side_effect = None
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.supervisor.online
+    assert coordinator.update_interval.total_seconds() == 30
+    assert len(coordinator.data) == 3
+
+
+async def test_coordinator_later_zone_transport_error(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test a timeout after other zones answered only skips that zone."""
+
+    failed: list[int] = []
+
+    async def zone_status(zone_id: int) -> dict:
+        if zone_id == 12 and not failed:
+            failed.append(zone_id)
+            raise TimeoutError
+        return {'power': True, 'volume': 20, 'mute': False, 'source': 1}
+
+    mock_amp.zone_status.side_effect = zone_status
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.supervisor.online
+    assert sorted(coordinator.data) == [11, 13]
+
+
+async def test_coordinator_reconnects_closed_transport(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test the probe reopens a closed transport with a new controller."""
+    new_amp = MagicMock()
+    new_amp.zone_status = AsyncMock(
+        return_value={'power': False, 'volume': 5, 'mute': False, 'source': 2}
+    )
+    connect = AsyncMock(return_value=new_amp)
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11],
+        scan_interval=30,
+        connect=connect,
+    )
+    mock_amp.zone_status.side_effect = SerialException('device disconnected')
+    await coordinator.async_refresh()
+    assert not coordinator.supervisor.online
+
+    mock_amp._protocol._transport.is_closing.return_value = True
+    await coordinator.async_refresh()
+
+    connect.assert_awaited_once()
+    mock_amp._protocol._transport.close.assert_called_once()
+    assert coordinator.amp is new_amp
+    assert coordinator.supervisor.online
+    assert coordinator.supervisor.reconnects == 1
+    assert coordinator.data[11]['volume'] == 5
+
+
+async def test_coordinator_probe_falls_back_across_zones(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test the heartbeat moves on to the next zone when one stays silent."""
+    coordinator.supervisor.record_failure(TimeoutError())
+    status = {'power': True, 'volume': 20, 'mute': False, 'source': 1}
+    mock_amp.zone_status.side_effect = lambda zone_id: None if zone_id == 11 else status
+
+    await coordinator.async_refresh()
+
+    assert coordinator.supervisor.online
+    assert mock_amp.zone_status.call_args_list[:2] == [call(11), call(12)]
+    assert sorted(coordinator.data) == [12, 13]
+
+
+async def test_coordinator_probe_uses_unit_inquiry(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test the heartbeat of amps with unit inquiries is a unit inquiry."""
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12],
+        amp_type='monoprice6',
+    )
+    coordinator.supervisor.record_failure(TimeoutError())
+    status = {'power': True, 'volume': 20, 'mute': False, 'source': 1}
+
+    with patch(
+        'custom_components.xantech.coordinator.async_unit_status',
+        new_callable=AsyncMock,
+        return_value={11: status, 12: status},
+    ) as mock_unit_status:
+        await coordinator.async_refresh()
+
+    assert coordinator.supervisor.online
+    # heartbeat plus the poll itself
+    assert mock_unit_status.await_count == 2
+    mock_amp.zone_status.assert_not_called()
+
+
+async def test_coordinator_probe_without_zones(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test an amp without zones has nothing to probe."""
+    coordinator = XantechCoordinator(
+        hass=hass, amp=mock_amp, amp_name='test_amp', zone_ids=[]
+    )
+    coordinator.supervisor.record_failure(TimeoutError())
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    mock_amp.zone_status.assert_not_called()
+
+
 async def test_coordinator_set_zone_power(
     coordinator: XantechCoordinator,
     mock_amp: MagicMock,
@@ -107,27 +594,316 @@ async def test_coordinator_set_zone_source(
     mock_amp.set_source.assert_called_once_with(11, 2)
 
 
-async def test_coordinator_snapshot_zone(
+async def test_coordinator_write_through(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test successful commands update the cache without re-polling."""
+    await coordinator.async_refresh()
+    mock_amp.zone_status.reset_mock()
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    await coordinator.async_set_zone_volume(12, 33)
+    unsub()
+
+    mock_amp.zone_status.assert_not_called()
+    listener.assert_called_once()
+    assert coordinator.data[12]['volume'] == 33
+    assert coordinator.data[12]['power'] is True
+    assert coordinator.data[11]['volume'] == 20
+
+
+async def test_coordinator_write_through_confirm(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test confirm_writes reads back only the changed zone."""
+    await coordinator.async_refresh()
+    mock_amp.zone_status.reset_mock()
+    coordinator.confirm_writes = True
+    mock_amp.zone_status.return_value = {
+        'power': True,
+        'volume': 32,
+        'mute': False,
+        'source': 1,
+    }
+
+    await coordinator.async_set_zone_volume(12, 33)
+
+    mock_amp.zone_status.assert_called_once_with(12)
+    # amp reported a different value than requested, so the read back wins
+    assert coordinator.data[12]['volume'] == 32
+
+
+async def test_coordinator_coalesces_level_writes(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test only the newest volume is sent while a write is in flight."""
+    await coordinator.async_refresh()
+    release = asyncio.Event()
+
+    async def slow_set_volume(zone_id: int, volume: int) -> None:
+        await release.wait()
+
+    mock_amp.set_volume = AsyncMock(side_effect=slow_set_volume)
+
+    first = asyncio.create_task(coordinator.async_set_zone_volume(11, 21))
+    await asyncio.sleep(0)
+    others = [
+        asyncio.create_task(coordinator.async_set_zone_volume(11, volume))
+        for volume in (22, 23, 24)
+    ]
+    await asyncio.sleep(0)
+
+    # relative steps build on the pending target, not the polled value
+    assert coordinator.zone_target(11, 'volume') == 24
+
+    release.set()
+    await asyncio.gather(first, *others)
+
+    assert mock_amp.set_volume.call_args_list == [call(11, 21), call(11, 24)]
+    assert coordinator.data[11]['volume'] == 24
+    assert coordinator.zone_target(11, 'volume') == 24
+
+
+async def test_coordinator_coalesced_write_error(
     coordinator: XantechCoordinator,
     mock_amp: MagicMock,
 ) -> None:
-    """Test getting zone snapshot."""
-    snapshot = await coordinator.async_get_zone_snapshot(11)
+    """Test superseded callers see the error of the write they waited on."""
+    release = asyncio.Event()
+
+    async def failing_set_bass(zone_id: int, bass: int) -> None:
+        await release.wait()
+        raise Exception('Connection lost')
+
+    mock_amp.set_bass = AsyncMock(side_effect=failing_set_bass)
+
+    first = asyncio.create_task(coordinator.async_set_zone_bass(11, 8))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coordinator.async_set_zone_bass(11, 9))
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(first, second, return_exceptions=True)
+    assert all(isinstance(result, Exception) for result in results)
+    mock_amp.set_bass.assert_called_once_with(11, 8)
+
+
+async def test_coordinator_coalesced_write_cancelled(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test superseded callers are released when the writer is cancelled."""
+    never = asyncio.Event()
+
+    async def hanging_set_treble(zone_id: int, treble: int) -> None:
+        await never.wait()
 
-    mock_amp.zone_status.assert_called_with(11)
-    assert snapshot is not None
-    assert snapshot['power'] is True
+    mock_amp.set_treble = AsyncMock(side_effect=hanging_set_treble)
 
+    first = asyncio.create_task(coordinator.async_set_zone_treble(11, 8))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coordinator.async_set_zone_treble(11, 9))
+    await asyncio.sleep(0)
 
-async def test_coordinator_restore_zone(
+    first.cancel()
+    async with asyncio.timeout(1):
+        results = await asyncio.gather(first, second, return_exceptions=True)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert not coordinator._write_inflight
+
+    # the next write starts afresh
+    mock_amp.set_treble = AsyncMock()
+    await coordinator.async_set_zone_treble(11, 10)
+    mock_amp.set_treble.assert_awaited_once_with(11, 10)
+
+
+async def test_coordinator_snapshot_zones(
     coordinator: XantechCoordinator,
     mock_amp: MagicMock,
 ) -> None:
-    """Test restoring zone from snapshot."""
-    snapshot = {'power': True, 'volume': 30, 'mute': False, 'source': 2}
-    await coordinator.async_restore_zone(snapshot)
+    """Test snapshots come from the cache without querying the amp."""
+    await coordinator.async_refresh()
+    mock_amp.reset_mock()
+    coordinator.data[11] = {**coordinator.data[11], 'bass': 7}
+
+    snapshot = coordinator.snapshot_zones([11, 12, 99])
+
+    assert snapshot == {
+        11: {'power': True, 'source': 1, 'volume': 20, 'mute': False, 'bass': 7},
+        12: {'power': True, 'source': 1, 'volume': 20, 'mute': False},
+    }
+    assert not mock_amp.mock_calls
 
-    mock_amp.restore_zone.assert_called_once_with(snapshot)
+
+async def test_coordinator_apply_changes_sequential(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test amps without echoes get one command after another, power first."""
+    await coordinator.async_refresh()
+
+    await coordinator.async_apply_changes(
+        {11: {'volume': 12, 'power': False}, 12: {'source': 3}}
+    )
+
+    mock_amp.set_power.assert_awaited_once_with(11, False)
+    mock_amp.set_volume.assert_awaited_once_with(11, 12)
+    mock_amp.set_source.assert_awaited_once_with(12, 3)
+    assert coordinator.data[11]['power'] is False
+    assert coordinator.data[11]['volume'] == 12
+    assert coordinator.data[12]['source'] == 3
+
+
+async def test_coordinator_apply_changes_pipelined(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test echoing amps get all commands in one pipelined bus operation."""
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12],
+        amp_type='monoprice6',
+    )
+    await coordinator.async_refresh()
+
+    with patch(
+        'custom_components.xantech.coordinator.async_pipeline',
+        new_callable=AsyncMock,
+        return_value=[b'<12CH03#\r'],
+    ) as mock_pipeline:
+        await coordinator.async_apply_changes(
+            {11: {'power': True, 'volume': 15}, 12: {'source': 3, 'volume': 9}}
+        )
+
+    mock_pipeline.assert_awaited_once()
+    assert mock_pipeline.await_args.args[2] == [
+        b'<11PR01#\r',
+        b'<11VO15#\r',
+        b'<12CH03#\r',
+        b'<12VO09#\r',
+    ]
+    mock_amp.set_volume.assert_not_called()
+    assert coordinator.data[11]['volume'] == 15
+    assert coordinator.data[12]['volume'] == 9
+    # the rejected source change is not cached
+    assert coordinator.data[12]['source'] == 1
+
+
+async def test_coordinator_write_batch_framed(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test xantech8 batches become frames confirmed by one read-back."""
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12],
+        amp_type='xantech8',
+        confirm_writes=True,
+    )
+    await coordinator.async_refresh()
+    mock_amp.zone_status.reset_mock()
+
+    with patch(
+        'custom_components.xantech.coordinator.async_send_frame',
+        new_callable=AsyncMock,
+        return_value=[],
+    ) as mock_frame:
+        await coordinator.async_write_batch(
+            [(11, 'power', True), (11, 'source', 3), (12, 'volume', 20)]
+        )
+
+    mock_frame.assert_awaited_once()
+    assert mock_frame.await_args.args[2] == [b'!11PR1+', b'!11SS3+', b'!12VO20+']
+    mock_amp.set_power.assert_not_called()
+    assert [c.args[0] for c in mock_amp.zone_status.call_args_list] == [11, 12]
+    assert coordinator.stats.operations['confirm_zones'].count == 1
+
+
+async def test_coordinator_write_batch_failure_keeps_accepted_writes(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test writes accepted before a failure are applied to the cache."""
+    await coordinator.async_refresh()
+    mock_amp.set_source.side_effect = TimeoutError
+
+    with pytest.raises(TimeoutError):
+        await coordinator.async_write_batch(
+            [(11, 'power', False), (12, 'source', 3), (13, 'volume', 5)]
+        )
+
+    assert coordinator.data[11]['power'] is False
+    assert coordinator.data[12]['source'] == 1
+    assert coordinator.data[13]['volume'] == 20
+
+
+async def test_coordinator_write_batch_framed_failure(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test frames the amp accepted stay cached when a later frame fails."""
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12],
+        amp_type='xantech8',
+    )
+    await coordinator.async_refresh()
+    # five commands per zone take two frames
+    attributes = ('source', 'volume', 'bass', 'treble', 'balance')
+    writes = [(11, attribute, 3) for attribute in attributes]
+    writes += [(12, attribute, 4) for attribute in attributes]
+
+    with (
+        patch(
+            'custom_components.xantech.coordinator.async_send_frame',
+            new_callable=AsyncMock,
+            side_effect=[[], TimeoutError],
+        ),
+        pytest.raises(TimeoutError),
+    ):
+        await coordinator.async_write_batch(writes)
+
+    assert coordinator.data[11]['balance'] == 3
+    assert coordinator.data[12].get('balance') != 4
+
+
+async def test_coordinator_write_batch_pipeline_timeout(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test pipelined writes echoed before a timeout are cached."""
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12],
+        amp_type='monoprice6',
+    )
+    await coordinator.async_refresh()
+
+    with (
+        patch(
+            'custom_components.xantech.coordinator.async_pipeline',
+            new_callable=AsyncMock,
+            side_effect=PipelineTimeout('No reply', [b'<11VO15#\r']),
+        ),
+        pytest.raises(TimeoutError),
+    ):
+        await coordinator.async_write_batch([(11, 'volume', 15), (12, 'volume', 9)])
+
+    assert coordinator.data[11]['volume'] == 15
+    assert coordinator.data[12]['volume'] == 20
 
 
 async def test_coordinator_set_power_error_handling(
@@ -139,3 +915,377 @@ async def test_coordinator_set_power_error_handling(
 
     with pytest.raises(Exception, match='Connection lost'):
         await coordinator.async_set_zone_power(11, True)
+
+
+async def test_coordinator_tiered_polling(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test only core attributes are queried between tone polls."""
+    mock_amp.zone_status.side_effect = lambda zone_id: {
+        'power': True,
+        'source': 1,
+        'volume': 20,
+        'mute': False,
+        'bass': 7,
+        'treble': 7,
+        'balance': 32,
+    }
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12],
+        amp_type='xantech8',
+        tone_interval=300,
+    )
+    await coordinator.async_refresh()
+    assert mock_amp.zone_status.await_count == 2
+
+    core = {'power': True, 'source': 2, 'volume': 5, 'mute': False}
+    with patch(
+        'custom_components.xantech.coordinator.async_query_frame',
+        new_callable=AsyncMock,
+        return_value={11: core, 12: core},
+    ) as mock_query:
+        await coordinator.async_refresh()
+
+        # both zones' core queries fit in one frame
+        mock_query.assert_awaited_once()
+        assert len(mock_query.await_args.args[2]) == 8
+        assert mock_amp.zone_status.await_count == 2
+        assert coordinator.data[11] == {**core, 'bass': 7, 'treble': 7, 'balance': 32}
+
+        # the tone poll reads every zone in full again
+        coordinator._next_tone_poll = 0
+        await coordinator.async_refresh()
+        assert mock_query.await_count == 1
+        assert mock_amp.zone_status.await_count == 4
+
+
+async def test_coordinator_without_tone_polling(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test tone controls are dropped when audio controls are disabled."""
+    mock_amp.zone_status.return_value = {
+        'power': True,
+        'source': 1,
+        'volume': 20,
+        'mute': False,
+        'bass': 7,
+        'treble': 7,
+    }
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11],
+        amp_type='xantech8',
+        poll_tones=False,
+    )
+    core = {'power': True, 'source': 2, 'volume': 5, 'mute': False}
+    with patch(
+        'custom_components.xantech.coordinator.async_query_frame',
+        new_callable=AsyncMock,
+        return_value={11: core},
+    ) as mock_query:
+        await coordinator.async_refresh()
+
+    # even the first poll reads only the core attributes
+    mock_query.assert_awaited_once()
+    mock_amp.zone_status.assert_not_called()
+    assert coordinator.data == {11: core}
+
+    # amps without attribute queries read full status but keep no tones
+    coordinator.amp_type = None
+    await coordinator.async_refresh()
+    assert coordinator.data == {
+        11: {'power': True, 'source': 1, 'volume': 20, 'mute': False}
+    }
+
+
+async def test_coordinator_skips_zones_that_are_off(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test zones that are off are only read every off_interval."""
+    mock_amp.zone_status.side_effect = lambda zone_id: {
+        'zone': zone_id,
+        'power': zone_id == 11,
+        'source': 1,
+        'volume': 20,
+        'mute': False,
+    }
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12],
+        off_interval=120,
+    )
+    await coordinator.async_refresh()
+    mock_amp.zone_status.reset_mock()
+
+    await coordinator.async_refresh()
+    mock_amp.zone_status.assert_awaited_once_with(11)
+    assert coordinator.idle_zones(time.monotonic()) == {12}
+    assert coordinator.data[12]['power'] is False
+
+    # keypad activity pushed by the amp promotes the zone straight away
+    coordinator._async_handle_push_status({'zone': 12, 'power': False, 'source': 3})
+    assert coordinator.idle_zones(time.monotonic()) == set()
+    mock_amp.zone_status.reset_mock()
+    await coordinator.async_refresh()
+    assert mock_amp.zone_status.await_count == 2
+
+
+async def test_coordinator_checks_power_of_zones_that_are_off(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test xantech8 zones that are off get a power-only query when due."""
+    mock_amp.zone_status.side_effect = lambda zone_id: {
+        'power': zone_id == 11,
+        'source': 1,
+        'volume': 20,
+        'mute': False,
+    }
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12],
+        amp_type='xantech8',
+        poll_tones=False,
+    )
+    core = {'power': True, 'source': 1, 'volume': 25, 'mute': False}
+    with patch(
+        'custom_components.xantech.coordinator.async_query_frame',
+        new_callable=AsyncMock,
+        side_effect=[
+            {11: core, 12: {**core, 'power': False}},
+            {11: core},
+            {12: {'power': True}},
+            {11: core, 12: core},
+        ],
+    ) as mock_query:
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+        assert mock_query.await_args.args[2] == [
+            b'?11PR+',
+            b'?11SS+',
+            b'?11VO+',
+            b'?11MU+',
+        ]
+
+        # the power check finds the zone on, so it is read like the others
+        coordinator._off_checks[12] = 0
+        await coordinator.async_refresh()
+
+    assert [args.args[2][0] for args in mock_query.await_args_list[2:]] == [
+        b'?12PR+',
+        b'?11PR+',
+    ]
+    assert coordinator.data[12] == core
+    assert coordinator.idle_zones(time.monotonic()) == set()
+
+
+async def test_coordinator_polls_only_zones_with_listeners(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test zones whose entities are all disabled or removed are not polled."""
+    await coordinator.async_refresh()
+    assert mock_amp.zone_status.await_count == 3
+
+    unsub_player = coordinator.async_add_listener(MagicMock(), 11)
+    unsub_bass = coordinator.async_add_listener(MagicMock(), (12, 'bass'))
+    # listeners without a zone context do not pull in other zones
+    unsub_other = coordinator.async_add_listener(MagicMock())
+    assert coordinator.polled_zones == [11, 12]
+
+    mock_amp.zone_status.reset_mock()
+    await coordinator.async_refresh()
+    assert [args.args for args in mock_amp.zone_status.await_args_list] == [
+        (11,),
+        (12,),
+    ]
+    # the unpolled zone keeps its cached state
+    assert 13 in coordinator.data
+
+    # disabling the last entity of zone 12 takes effect on the next cycle
+    unsub_bass()
+    mock_amp.zone_status.reset_mock()
+    await coordinator.async_refresh()
+    mock_amp.zone_status.assert_awaited_once_with(11)
+
+    unsub_player()
+    unsub_other()
+    assert coordinator.polled_zones == [11, 12, 13]
+
+
+async def test_coordinator_round_robin_within_poll_budget(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test cycles stop at their deadline and resume with the next zone."""
+    # a budget this short is spent by the first zone of every cycle
+    coordinator.poll_budget = 1e-9
+    assert coordinator.staleness_bound == 5 * 30 + 1e-9
+
+    polled: list[list[int]] = []
+    for _ in range(4):
+        mock_amp.zone_status.reset_mock()
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        polled.append([args.args[0] for args in mock_amp.zone_status.await_args_list])
+
+    assert polled == [[11], [12], [13], [11]]
+    assert coordinator.round_cycles == 3
+    # zones not reached yet keep their cached state meanwhile
+    assert set(coordinator.data) == {11, 12, 13}
+    assert coordinator.max_staleness(time.monotonic()) is not None
+
+    # with room in the budget the next cycle finishes the pass
+    coordinator.poll_budget = 60
+    mock_amp.zone_status.reset_mock()
+    await coordinator.async_refresh()
+    assert [args.args[0] for args in mock_amp.zone_status.await_args_list] == [12, 13]
+    assert coordinator.round_cycles == 2
+
+
+async def test_coordinator_round_robin_publishes_partial_results(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test zones read before the link failed are kept for the next cycle."""
+    await coordinator.async_refresh()
+    coordinator.poll_budget = 60
+    status = dict(await mock_amp.zone_status(11))
+
+    failed: list[int] = []
+
+    async def zone_status(zone_id: int) -> dict:
+        if zone_id == 12 and not failed:
+            failed.append(zone_id)
+            raise TimeoutError
+        return {**status, 'volume': 30}
+
+    mock_amp.zone_status = AsyncMock(side_effect=zone_status)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data[11]['volume'] == 30
+    assert coordinator.data[13]['volume'] == 20
+
+    # the next cycle starts with the zone that failed
+    mock_amp.zone_status.reset_mock()
+    await coordinator.async_refresh()
+    assert [args.args[0] for args in mock_amp.zone_status.await_args_list] == [12, 13]
+
+
+async def test_coordinator_auto_polling(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test auto polling sizes the interval from the measured zone reads."""
+
+    async def zone_status(zone_id: int) -> dict | None:
+        await asyncio.sleep(0.01)
+        if zone_id == 13:
+            return None
+        return {'power': True, 'volume': 20, 'mute': False, 'source': 1}
+
+    mock_amp.zone_status = AsyncMock(side_effect=zone_status)
+    policy = AutoPollInterval(
+        initial_interval=30, min_interval=0.01, max_interval=300, target=0.25
+    )
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12, 13],
+        poll_policy=policy,
+    )
+
+    await coordinator.async_refresh()
+
+    assert policy.zones == 3
+    assert policy.error_rate == pytest.approx(1 / 3)
+    assert policy.zone_rtt is not None
+    assert policy.zone_rtt >= 0.01
+    # three reads at a quarter of the bus, stretched for the failing zone
+    assert policy.interval == pytest.approx(policy.zone_rtt * 3 / 0.25 * 2)
+    assert coordinator.update_interval == timedelta(seconds=policy.interval)
+
+
+async def test_coordinator_status_of_another_zone(
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+) -> None:
+    """Test a frame pushed for another zone is not stored as the reply."""
+    await coordinator.async_refresh()
+    status = dict(await mock_amp.zone_status(11))
+
+    async def zone_status(zone_id: int) -> dict:
+        if zone_id == 12:
+            # the amp pushed a keypad change on zone 13 just before the reply
+            return {**status, 'zone': 13, 'volume': 35}
+        return {**status, 'zone': zone_id}
+
+    mock_amp.zone_status = AsyncMock(side_effect=zone_status)
+    with patch.object(
+        coordinator,
+        '_async_handle_push_status',
+        wraps=coordinator._async_handle_push_status,
+    ) as handle_push:
+        await coordinator.async_refresh()
+
+    # the frame went to its own zone; zone 12 keeps its last known state
+    handle_push.assert_called_once_with({**status, 'zone': 13, 'volume': 35})
+    assert coordinator.data[12]['volume'] == 20
+    assert coordinator.data[13]['zone'] == 13
+
+
+async def test_coordinator_auto_polling_idle_zones_on_unit(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+) -> None:
+    """Test zones a unit inquiry reports unasked do not count as failures."""
+    zone_ids = [11, 12, 13, 14, 15, 16]
+    policy = AutoPollInterval(
+        initial_interval=30, min_interval=0, max_interval=300, target=0.25
+    )
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=zone_ids,
+        amp_type='monoprice6',
+        poll_policy=policy,
+    )
+    unit_status = {
+        zone_id: {
+            'zone': zone_id,
+            'power': zone_id == 11,
+            'volume': 10,
+            'mute': False,
+            'source': 1,
+        }
+        for zone_id in zone_ids
+    }
+
+    with patch(
+        'custom_components.xantech.coordinator.async_unit_status',
+        new_callable=AsyncMock,
+        return_value=unit_status,
+    ):
+        await coordinator.async_refresh()
+        # only zone 11 is on; the rest wait for their power check
+        assert coordinator.idle_zones(time.monotonic()) == set(zone_ids[1:])
+        await coordinator.async_refresh()
+
+    assert policy.zones == 6
+    assert policy.error_rate == 0
+    assert policy.interval == pytest.approx(policy.zone_rtt * 6 / 0.25)
@@ -69,6 +69,8 @@ async def test_diagnostics_output(
     assert 'zone_names' in result
     assert 'source_names' in result
     assert 'zone_statuses' in result
+    assert 'bus' in result
+    assert 'transport' in result
 
     # check config entry data
     assert result['config_entry']['entry_id'] == 'test_entry_id'
@@ -76,8 +78,18 @@ async def test_diagnostics_output(
 
     # check coordinator info
     assert result['coordinator']['zone_ids'] == [11, 12]
+    assert result['coordinator']['units'] == [1]
     assert result['coordinator']['update_interval_seconds'] == 30
 
+    # check bus scheduler statistics
+    assert result['bus']['queue_depth'] == 0
+    assert 'orchestrator' in result
+    assert 'snapshot_zones' in result
+
+    # check transport statistics
+    assert result['transport']['timeouts'] == 0
+    assert result['transport']['poll_cycle']['count'] == 0
+
     # check zone statuses
     assert '11' in result['zone_statuses']
     assert result['zone_statuses']['11']['power'] is True
@@ -0,0 +1,178 @@
+"""End-to-end tests of pyxantech and the integration against the emulator."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pyxantech import async_get_amp_controller
+
+from custom_components.xantech.protocol import (
+    CORE_ATTRIBUTES,
+    PushUpdateListener,
+    async_enable_push_updates,
+    async_pipeline,
+    async_query_frame,
+    async_send_frame,
+    async_unit_status,
+    attribute_query_frames,
+    pack_frames,
+    zone_command,
+)
+
+from .emulator import AmpEmulator
+
+# the emulator listens on a local TCP socket
+pytestmark = pytest.mark.usefixtures('socket_enabled')
+
+
+@pytest.mark.parametrize('amp_type', ['xantech8', 'monoprice6', 'dax88'])
+async def test_emulator_zone_round_trip(amp_type: str) -> None:
+    """Test pyxantech reads and changes zone state on every emulated protocol."""
+    async with AmpEmulator(amp_type, baud=None) as emulator:
+        amp = await async_get_amp_controller(
+            amp_type, emulator.url, asyncio.get_running_loop()
+        )
+
+        status = await amp.zone_status(12)
+        assert status['zone'] == 12
+        assert status['power'] is False
+        assert status['volume'] == 20
+
+        await amp.set_power(12, True)
+        await amp.set_volume(12, 31)
+        await amp.set_source(12, 3)
+        await amp.set_mute(12, True)
+
+        assert emulator.zones[12]['volume'] == 31
+        status = await amp.zone_status(12)
+        assert status['power'] is True
+        assert status['volume'] == 31
+        assert status['source'] == 3
+        assert status['mute'] is True
+
+
+@pytest.mark.parametrize('amp_type', ['monoprice6', 'dax88'])
+async def test_emulator_unit_status(amp_type: str) -> None:
+    """Test a unit inquiry returns every zone on the unit in one exchange."""
+    async with AmpEmulator(amp_type, baud=None) as emulator:
+        amp = await async_get_amp_controller(
+            amp_type, emulator.url, asyncio.get_running_loop()
+        )
+        emulator.zones[13]['volume'] = 5
+
+        statuses = await async_unit_status(amp, amp_type, 1)
+
+        assert sorted(statuses) == sorted(emulator.zones)
+        assert statuses[13]['volume'] == 5
+        assert emulator.request_count == 1
+
+
+async def test_emulator_framed_writes() -> None:
+    """Test xantech8 applies every command of a multi-command frame."""
+    async with AmpEmulator('xantech8', baud=None) as emulator:
+        amp = await async_get_amp_controller(
+            'xantech8', emulator.url, asyncio.get_running_loop()
+        )
+        commands = [
+            zone_command('xantech8', 11, 'power', True),
+            zone_command('xantech8', 11, 'source', 3),
+            zone_command('xantech8', 11, 'volume', 20),
+            zone_command('xantech8', 19, 'volume', 20),
+        ]
+
+        frames = pack_frames('xantech8', commands)
+        assert len(frames) == 1
+        rejected = await async_send_frame(amp, 'xantech8', frames[0])
+
+        assert rejected == [commands[3]]
+        assert emulator.request_count == 4
+        assert emulator.zones[11]['power'] is True
+        assert emulator.zones[11]['source'] == 3
+        assert emulator.zones[11]['volume'] == 20
+
+
+async def test_emulator_attribute_queries() -> None:
+    """Test xantech8 answers every attribute query of a frame."""
+    async with AmpEmulator('xantech8', baud=None) as emulator:
+        amp = await async_get_amp_controller(
+            'xantech8', emulator.url, asyncio.get_running_loop()
+        )
+        emulator.zones[12].update(power=True, source=4, volume=9)
+
+        statuses: dict[int, dict[str, object]] = {}
+        for frame in attribute_query_frames('xantech8', [11, 12], CORE_ATTRIBUTES):
+            statuses.update(await async_query_frame(amp, 'xantech8', frame))
+
+        assert statuses == {
+            11: {'power': False, 'source': 1, 'volume': 20, 'mute': False},
+            12: {'power': True, 'source': 4, 'volume': 9, 'mute': False},
+        }
+        assert emulator.request_count == 8
+
+
+async def test_emulator_pipelined_writes() -> None:
+    """Test monoprice6 echoes pipelined commands and applies them all."""
+    async with AmpEmulator('monoprice6', units=2, baud=None) as emulator:
+        amp = await async_get_amp_controller(
+            'monoprice6', emulator.url, asyncio.get_running_loop()
+        )
+        commands = [
+            zone_command('monoprice6', zone_id, 'volume', 12)
+            for zone_id in sorted(emulator.zones)
+        ]
+
+        assert await async_pipeline(amp, 'monoprice6', commands) == []
+        assert all(zone['volume'] == 12 for zone in emulator.zones.values())
+
+
+async def test_emulator_keypad_push() -> None:
+    """Test keypad changes are pushed once activity updates are enabled."""
+    async with AmpEmulator('xantech8', baud=None) as emulator:
+        amp = await async_get_amp_controller(
+            'xantech8', emulator.url, asyncio.get_running_loop()
+        )
+        received = asyncio.Queue()
+        listener = PushUpdateListener(amp, 'xantech8', received.put_nowait)
+        listener.start()
+
+        await async_enable_push_updates(amp, 'xantech8')
+        await asyncio.sleep(0.05)
+        assert emulator.activity_updates
+
+        await emulator.inject_keypad_change(11, power=True, volume=12)
+        status = await asyncio.wait_for(received.get(), 1)
+
+        assert status['zone'] == 11
+        assert status['power'] is True
+        assert status['volume'] == 12
+        listener.stop()
+
+
+async def test_emulator_drops_responses() -> None:
+    """Test dropped responses surface as missing replies."""
+    async with AmpEmulator('monoprice6', baud=None, drop_rate=1.0, seed=1) as emulator:
+        amp = await async_get_amp_controller(
+            'monoprice6', emulator.url, asyncio.get_running_loop()
+        )
+        amp._protocol._timeout = 0.1
+
+        with pytest.raises(TimeoutError):
+            await amp.zone_status(11)
+        assert emulator.dropped_count == 1
+
+
+async def test_emulator_baud_delay() -> None:
+    """Test responses are paced by the simulated line speed."""
+    emulator = AmpEmulator('xantech8', baud=1200)
+    assert emulator.byte_delay == pytest.approx(10 / 1200)
+    async with emulator:
+        amp = await async_get_amp_controller(
+            'xantech8', emulator.url, asyncio.get_running_loop()
+        )
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await amp.zone_status(11)
+
+        # ~50 bytes at 120 bytes per second
+        assert loop.time() - started > 0.3
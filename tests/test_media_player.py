@@ -228,40 +228,3 @@ async def test_zone_player_volume_down(
         await zone_player.async_volume_down()
         # current volume is 20, so should set to 19
         mock_volume.assert_called_once_with(11, 19)
-
-
-async def test_zone_player_snapshot_and_restore(
-    zone_player: ZoneMediaPlayer,
-    coordinator: XantechCoordinator,
-) -> None:
-    """Test snapshot and restore functionality."""
-    snapshot_data = {'power': True, 'volume': 25, 'mute': False, 'source': 1}
-
-    with patch.object(
-        coordinator,
-        'async_get_zone_snapshot',
-        new_callable=AsyncMock,
-        return_value=snapshot_data,
-    ) as mock_snapshot:
-        await zone_player.async_snapshot()
-        mock_snapshot.assert_called_once_with(11)
-
-    with patch.object(
-        coordinator, 'async_restore_zone', new_callable=AsyncMock
-    ) as mock_restore:
-        await zone_player.async_restore()
-        mock_restore.assert_called_once_with(snapshot_data)
-
-
-async def test_zone_player_restore_without_snapshot(
-    zone_player: ZoneMediaPlayer,
-    coordinator: XantechCoordinator,
-) -> None:
-    """Test restore when no snapshot exists."""
-    with patch.object(
-        coordinator, 'async_restore_zone', new_callable=AsyncMock
-    ) as mock_restore:
-        # no snapshot saved
-        zone_player._status_snapshot = None
-        await zone_player.async_restore()
-        mock_restore.assert_not_called()
@@ -0,0 +1,184 @@
+"""Tests for the Xantech multi-amp poll orchestrator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.xantech.bus import BusScheduler
+from custom_components.xantech.coordinator import XantechCoordinator
+from custom_components.xantech.orchestrator import (
+    IOBudget,
+    PollOrchestrator,
+    async_get_orchestrator,
+)
+
+
+def _coordinator(
+    hass: HomeAssistant,
+    name: str,
+    orchestrator: PollOrchestrator,
+    zone_ids: list[int] | None = None,
+) -> XantechCoordinator:
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=MagicMock(),
+        amp_name=name,
+        zone_ids=zone_ids or [11, 12],
+        scan_interval=30,
+        orchestrator=orchestrator,
+    )
+    orchestrator.async_register(coordinator)
+    return coordinator
+
+
+async def test_io_budget_caps_operations_across_buses() -> None:
+    """Test separate buses run in parallel but within the global budget."""
+    budget = IOBudget(limit=2)
+    buses = [BusScheduler(f'amp_{i}', budget=budget) for i in range(4)]
+    release = asyncio.Event()
+    running: list[int] = []
+
+    async def operation(index: int) -> int:
+        running.append(index)
+        await release.wait()
+        return index
+
+    tasks = [
+        asyncio.create_task(bus.async_run(operation, i)) for i, bus in enumerate(buses)
+    ]
+    await asyncio.sleep(0)
+
+    assert running == [0, 1]
+    assert budget.in_flight == 2
+
+    release.set()
+    assert await asyncio.gather(*tasks) == [0, 1, 2, 3]
+    assert budget.as_dict() == {
+        'limit': 2,
+        'in_flight': 0,
+        'peak_in_flight': 2,
+        'operations': 4,
+        'waits': 2,
+    }
+
+
+async def test_orchestrator_staggers_coordinators(hass: HomeAssistant) -> None:
+    """Test registered amps get evenly spaced poll slots."""
+    orchestrator = PollOrchestrator()
+    amps = [_coordinator(hass, f'amp_{i}', orchestrator) for i in range(3)]
+
+    assert [orchestrator.phase(amp, 30) for amp in amps] == [0, 10, 20]
+
+    # each amp polls in its own slot, never more than half an interval early
+    now = 1000.0
+    polls = [orchestrator.next_poll(amp, now, 30) for amp in amps]
+    assert polls == [1020.0, 1030.0, 1040.0]
+    assert all(now + 15 <= poll < now + 45 for poll in polls)
+
+
+async def test_orchestrator_unregister_respaces_slots(hass: HomeAssistant) -> None:
+    """Test removing an amp spreads the remaining ones over the interval."""
+    orchestrator = PollOrchestrator()
+    first = _coordinator(hass, 'amp_1', orchestrator)
+    second = MagicMock()
+    unregister = orchestrator.async_register(second)
+    assert orchestrator.phase(first, 30) == 0
+    assert orchestrator.phase(second, 30) == 15
+
+    unregister()
+    unregister()
+
+    assert orchestrator.coordinators == [first]
+    assert orchestrator.phase(second, 30) == 0
+
+
+async def test_coordinator_polls_in_its_slot(hass: HomeAssistant) -> None:
+    """Test the coordinator timer is moved onto its orchestrator slot."""
+    orchestrator = PollOrchestrator()
+    _coordinator(hass, 'amp_1', orchestrator)
+    coordinator = _coordinator(hass, 'amp_2', orchestrator)
+
+    with patch(
+        'custom_components.xantech.coordinator.async_call_at',
+        return_value=MagicMock(),
+    ) as call_at:
+        coordinator._schedule_refresh()
+    expected = orchestrator.next_poll(coordinator, hass.loop.time(), 30)
+
+    call_at.assert_called_once()
+    assert call_at.call_args.args[2] == pytest.approx(expected, abs=0.1)
+
+    # the pending slot is cancelled on shutdown
+    await coordinator.async_shutdown()
+    call_at.return_value.assert_called_once()
+
+
+async def test_coordinator_slot_triggers_poll(hass: HomeAssistant) -> None:
+    """Test a poll runs when the coordinator's slot comes up."""
+    orchestrator = PollOrchestrator()
+    coordinator = _coordinator(hass, 'amp_1', orchestrator)
+    coordinator.amp.zone_status = AsyncMock(return_value={'power': False})
+
+    coordinator._schedule_refresh()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=45))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.amp.zone_status.await_count == 2
+    await coordinator.async_shutdown()
+
+
+async def test_orchestrator_load_report(hass: HomeAssistant) -> None:
+    """Test aggregate load across amps is reported."""
+    orchestrator = PollOrchestrator(io_budget=3)
+    first = _coordinator(hass, 'amp_1', orchestrator)
+    _coordinator(hass, 'amp_2', orchestrator, zone_ids=[11, 12, 13, 21])
+    first.stats.poll_cycle.record(1.5)
+
+    report = orchestrator.as_dict()
+
+    assert report['amps'] == 2
+    assert report['zones'] == 6
+    assert report['polls_per_minute'] == 4
+    assert report['duty_cycle'] == 0.05
+    assert report['slots'] == {'amp_1': 0, 'amp_2': 15}
+    assert report['io_budget']['limit'] == 3
+
+
+async def test_orchestrator_is_shared(hass: HomeAssistant) -> None:
+    """Test all config entries share one orchestrator."""
+    assert async_get_orchestrator(hass) is async_get_orchestrator(hass)
+
+
+async def test_unload_cancels_pending_slot(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    config_entry: Any,
+    mock_amp: MagicMock,
+) -> None:
+    """Test unloading the config entry cancels the next orchestrated poll."""
+    with patch(
+        'custom_components.xantech.async_get_amp_controller',
+        new_callable=AsyncMock,
+        return_value=mock_amp,
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator = config_entry.runtime_data.coordinator
+    assert coordinator._unsub_slot is not None
+    polls = mock_amp.zone_status.await_count
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert coordinator._unsub_slot is None
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=5))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert mock_amp.zone_status.await_count == polls
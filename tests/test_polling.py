@@ -0,0 +1,94 @@
+"""Tests for Xantech polling interval policies."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.xantech.polling import AdaptivePollInterval, AutoPollInterval
+
+
+@pytest.fixture
+def policy() -> AdaptivePollInterval:
+    """Create an adaptive policy with easy to follow numbers."""
+    return AdaptivePollInterval(
+        idle_interval=30, min_interval=5, max_interval=120, decay=2.0
+    )
+
+
+def test_adaptive_starts_at_idle_interval(policy: AdaptivePollInterval) -> None:
+    """Test the policy starts at the normal interval."""
+    assert policy.interval == 30
+
+
+def test_adaptive_activity_shortens_interval(policy: AdaptivePollInterval) -> None:
+    """Test commands and changes drop to the minimum interval."""
+    assert policy.mark_activity() == 5
+    assert policy.next_interval(changed=True, any_zone_on=False) == 5
+
+
+def test_adaptive_decays_to_idle_while_zones_on(
+    policy: AdaptivePollInterval,
+) -> None:
+    """Test quiet polls back off up to the normal interval while zones are on."""
+    policy.mark_activity()
+    intervals = [policy.next_interval(False, True) for _ in range(4)]
+    assert intervals == [10, 20, 30, 30]
+
+
+def test_adaptive_decays_to_max_when_all_off(policy: AdaptivePollInterval) -> None:
+    """Test quiet polls back off to the maximum once every zone is off."""
+    policy.mark_activity()
+    intervals = [policy.next_interval(False, False) for _ in range(6)]
+    assert intervals == [10, 20, 40, 80, 120, 120]
+
+    # a zone turning on caps the interval back at the normal interval
+    assert policy.next_interval(False, True) == 30
+
+
+@pytest.fixture
+def auto() -> AutoPollInterval:
+    """Create an auto policy aiming for a quarter of the bus time."""
+    return AutoPollInterval(
+        initial_interval=30, min_interval=2, max_interval=120, target=0.25
+    )
+
+
+def test_auto_keeps_initial_interval_until_measured(auto: AutoPollInterval) -> None:
+    """Test the configured interval is used before any cycle was measured."""
+    assert auto.next_interval(changed=True, any_zone_on=True) == 30
+    assert auto.mark_activity() == 30
+
+
+def test_auto_interval_follows_zones_and_rtt(auto: AutoPollInterval) -> None:
+    """Test the interval keeps polling under the target utilization."""
+    # 8 zones at 0.25s each keep the bus busy for 2s per cycle
+    auto.record_cycle(zones=8, failures=0, poll_time=2.0, now=100, bus_time=2.0)
+    assert auto.next_interval(False, True) == 8
+
+    # polls every 8s measure the bus busy a quarter of the time
+    auto.record_cycle(zones=8, failures=0, poll_time=2.0, now=108, bus_time=4.0)
+    assert auto.utilization == 0.25
+
+    # more zones lengthen the interval straight away
+    auto.record_cycle(zones=16, failures=0, poll_time=4.0, now=116, bus_time=8.0)
+    assert auto.next_interval(False, True) == 16
+
+    # activity does not shorten it below what the link sustains
+    assert auto.mark_activity() == 16
+
+
+def test_auto_backs_off_on_errors_and_commands(auto: AutoPollInterval) -> None:
+    """Test failing reads and command traffic stretch the interval."""
+    auto.record_cycle(zones=4, failures=0, poll_time=1.0, now=100, bus_time=1.0)
+    assert auto.next_interval(False, True) == 4
+
+    # commands kept the bus busy besides polling; timeouts slowed the reads
+    auto.record_cycle(zones=4, failures=4, poll_time=8.0, now=104, bus_time=9.5)
+    assert auto.other_load > 0
+    assert auto.error_rate > 0
+    assert auto.next_interval(False, True) > 4 * (auto.zone_rtt or 0) / 0.25
+
+    # the interval stays within the configured bounds
+    auto.record_cycle(zones=4, failures=4, poll_time=60.0, now=200, bus_time=69.5)
+    assert auto.next_interval(False, True) == 120
+    assert auto.as_dict()['interval_seconds'] == 120
@@ -0,0 +1,414 @@
+"""Tests for Xantech low-level protocol helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from importlib.metadata import version
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from pyxantech.protocol import RS232ControlProtocol
+
+from custom_components.xantech.protocol import (
+    CORE_ATTRIBUTES,
+    PIPELINE_WINDOW,
+    PYXANTECH_VERSION,
+    PipelineTimeout,
+    PushUpdateListener,
+    amp_protocol,
+    async_exchange,
+    async_pipeline,
+    async_query_frame,
+    async_send_frame,
+    async_unit_status,
+    attribute_query_frames,
+    clamp_level,
+    close_transport,
+    format_command,
+    pack_frames,
+    parse_zone_statuses,
+    supports_attribute_queries,
+    supports_framing,
+    supports_pipelining,
+    supports_push_updates,
+    supports_unit_status,
+    zone_command,
+    zone_unit,
+)
+
+MANIFEST = 'custom_components/xantech/manifest.json'
+
+MONOPRICE_UNIT_RESPONSE = (
+    '?10\r\r\n'
+    '#>110101000200707100000\r\r\n'
+    '#>120003010150707100000\r\r\n'
+    '#>130001000100707100000\r\r\n'
+    '#>140001000100707100000\r\r\n'
+    '#>150001000100707100000\r\r\n'
+    '#>160001000100707100000\r\r\n'
+    '#'
+)
+
+
+class FakeProtocol:
+    """Minimal stand-in for the pyxantech RS232 protocol."""
+
+    def __init__(self, responses: dict[bytes, list[str]]) -> None:
+        """Initialize with canned responses keyed by request bytes."""
+        self._lock = asyncio.Lock()
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._connected = asyncio.Event()
+        self._connected.set()
+        self._last_send = 0.0
+        self._responses = responses
+        self.requests: list[bytes] = []
+        self._transport = MagicMock()
+        self._transport.serial.write.side_effect = self._write
+
+    def data_received(self, data: bytes) -> None:
+        """Queue received data like pyxantech does."""
+        self._queue.put_nowait(data)
+
+    async def _throttle_requests(self) -> None:
+        """Skip throttling in tests."""
+
+    async def send(self, request: bytes, wait_for_reply: bool = True) -> str:
+        """Record requests sent through pyxantech's own API."""
+        self.requests.append(request)
+        return ''
+
+    def _write(self, request: bytes) -> None:
+        self.requests.append(request)
+        for chunk in self._responses.get(request, []):
+            self._queue.put_nowait(chunk.encode('ascii'))
+
+
+@pytest.fixture
+def fake_amp() -> MagicMock:
+    """Create an amp whose protocol returns a monoprice unit status stream."""
+    amp = MagicMock()
+    # split across chunks like a real serial port would deliver it
+    amp._protocol = FakeProtocol(
+        {
+            b'?10#\r': [
+                MONOPRICE_UNIT_RESPONSE[:40],
+                MONOPRICE_UNIT_RESPONSE[40:],
+            ]
+        }
+    )
+    return amp
+
+
+def test_supports_unit_status() -> None:
+    """Test only Monoprice style protocols use unit status inquiries."""
+    assert supports_unit_status('monoprice6')
+    assert supports_unit_status('dax88')
+    assert not supports_unit_status('xantech8')
+    assert not supports_unit_status(None)
+
+
+def test_zone_unit() -> None:
+    """Test zone to unit mapping."""
+    assert zone_unit(11) == 1
+    assert zone_unit(26) == 2
+    assert zone_unit(38) == 3
+
+
+def test_parse_zone_statuses_multiple_frames() -> None:
+    """Test every zone frame in a stream is parsed."""
+    statuses = parse_zone_statuses('monoprice6', MONOPRICE_UNIT_RESPONSE)
+
+    assert sorted(statuses) == [11, 12, 13, 14, 15, 16]
+    assert statuses[11]['power'] is True
+    assert statuses[11]['volume'] == 20
+    assert statuses[12]['power'] is False
+    assert statuses[12]['source'] == 3
+    assert statuses[12]['mute'] is True
+
+
+async def test_async_unit_status(fake_amp: MagicMock) -> None:
+    """Test a single inquiry returns every zone on the unit."""
+    statuses = await async_unit_status(fake_amp, 'monoprice6', 1)
+
+    assert fake_amp._protocol.requests == [b'?10#\r']
+    assert len(statuses) == 6
+    assert statuses[12]['volume'] == 15
+
+
+async def test_async_unit_status_partial_response(fake_amp: MagicMock) -> None:
+    """Test zones missing from a truncated response are simply omitted."""
+    fake_amp._protocol._responses[b'?10#\r'] = [MONOPRICE_UNIT_RESPONSE[:40]]
+
+    statuses = await async_unit_status(fake_amp, 'monoprice6', 1)
+
+    assert list(statuses) == [11]
+
+
+async def test_async_exchange_dead_link(fake_amp: MagicMock) -> None:
+    """Test a link that never comes up surfaces as a timeout."""
+    fake_amp._protocol._connected.clear()
+
+    with pytest.raises(TimeoutError):
+        await async_exchange(fake_amp, b'?10#\r', lambda text: True, 0.01)
+    assert fake_amp._protocol.requests == []
+
+
+def test_format_command() -> None:
+    """Test commands are framed like pyxantech frames them."""
+    assert format_command('monoprice6', '?{unit}0', unit=2) == b'?20#\r'
+    assert format_command('dax88', '?{unit}0', unit=1) == b'?10\r'
+    assert format_command('xantech8', '!{zone}PR1', zone=11) == b'!11PR1+'
+
+
+async def test_pyxantech_protocol_internals() -> None:
+    """Test the pinned pyxantech release still has the internals relied on."""
+    manifest = json.loads(
+        (Path(__file__).parents[1] / MANIFEST).read_text(encoding='utf-8')
+    )
+    assert f'pyxantech=={PYXANTECH_VERSION}' in manifest['requirements']
+    assert version('pyxantech') == PYXANTECH_VERSION
+
+    amp = MagicMock()
+    amp._protocol = RS232ControlProtocol(
+        '/dev/ttyUSB0', {}, {}, {}, asyncio.get_running_loop()
+    )
+    assert amp_protocol(amp) is amp._protocol
+
+
+async def test_push_update_listener_unsupported_protocol(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test push updates stay off, loudly, if pyxantech internals moved."""
+    amp = MagicMock()
+    amp._protocol = SimpleNamespace(data_received=MagicMock())
+    listener = PushUpdateListener(amp, 'xantech8', MagicMock())
+
+    assert not listener.start()
+    assert 'Push updates disabled' in caplog.text
+    assert amp_protocol(amp) is None
+    with pytest.raises(RuntimeError):
+        await async_exchange(amp, b'?11ZD+', lambda text: True)
+
+
+def test_supports_push_updates() -> None:
+    """Test only amps with activity reporting support push updates."""
+    assert supports_push_updates('xantech8')
+    assert not supports_push_updates('monoprice6')
+    assert not supports_push_updates(None)
+
+
+async def test_push_update_listener() -> None:
+    """Test unsolicited frames are parsed, even when split across chunks."""
+    amp = MagicMock()
+    amp._protocol = FakeProtocol({})
+    statuses: list[dict] = []
+    listener = PushUpdateListener(amp, 'xantech8', statuses.append)
+    listener.start()
+
+    amp._protocol.data_received(b'#1ZS PR1 SS2 VO20 MU0 TR7 BS7 B')
+    assert statuses == []
+    amp._protocol.data_received(
+        b'A32 LS0 PS0+\r#2ZS PR0 SS1 VO0 MU1 TR7 BS7 BA32 LS0 PS0+'
+    )
+
+    assert [status['zone'] for status in statuses] == [1, 2]
+    assert statuses[0]['power'] is True
+    assert statuses[0]['volume'] == 20
+    assert statuses[1]['mute'] is True
+    # data is still delivered to pyxantech
+    assert amp._protocol._queue.qsize() == 2
+
+    # frames pushed while a request is pending are not lost
+    async with amp._protocol._lock:
+        amp._protocol.data_received(b'#3ZS PR1 SS2 VO20 MU0 TR7 BS7 B')
+        amp._protocol.data_received(b'A32 LS0 PS0+\r')
+    assert [status['zone'] for status in statuses] == [1, 2, 3]
+
+    listener.stop()
+    amp._protocol.data_received(b'#4ZS PR1 SS2 VO20 MU0 TR7 BS7 BA32 LS0 PS0+')
+    assert len(statuses) == 3
+
+
+def _echo(command: bytes) -> list[str]:
+    """Return the monoprice echo of a set command."""
+    return [command.decode('ascii').removesuffix('#\r') + '\r\r\n#']
+
+
+def test_zone_command() -> None:
+    """Test set commands match the ones pyxantech sends."""
+    assert zone_command('monoprice6', 11, 'power', True) == b'<11PR01#\r'
+    assert zone_command('monoprice6', 21, 'volume', 20) == b'<21VO20#\r'
+    assert zone_command('xantech8', 12, 'mute', False) == b'!12MU0+'
+    with pytest.raises(ValueError):
+        zone_command('monoprice6', 11, 'loudness', 1)
+
+
+def test_close_transport() -> None:
+    """Test the transport is closed, and missing internals are skipped."""
+    amp = MagicMock()
+    close_transport(amp)
+    amp._protocol._transport.close.assert_called_once()
+
+    # pyxantech internals moved: nothing to close, and no AttributeError
+    close_transport(MagicMock(spec=[]))
+
+
+def test_supports_pipelining() -> None:
+    """Test only protocols echoing zone-tagged replies are pipelined."""
+    assert supports_pipelining('monoprice6')
+    assert not supports_pipelining('xantech8')
+    assert not supports_pipelining(None)
+
+
+async def test_async_pipeline() -> None:
+    """Test a multi-zone scene is sent in one exchange and fully echoed."""
+    commands = [
+        zone_command('monoprice6', zone_id, attribute, value)
+        for zone_id in range(11, 17)
+        for attribute, value in (('power', True), ('source', 2), ('volume', 15))
+    ]
+    amp = MagicMock()
+    amp._protocol = FakeProtocol({command: _echo(command) for command in commands})
+
+    assert await async_pipeline(amp, 'monoprice6', commands) == []
+    assert amp._protocol.requests == commands
+
+
+async def test_async_pipeline_matches_out_of_order_echoes() -> None:
+    """Test echoes are matched by zone and command code, not position."""
+    power = zone_command('monoprice6', 11, 'power', True)
+    volume = zone_command('monoprice6', 12, 'volume', 10)
+    amp = MagicMock()
+    # both echoes arrive together, in reverse order, after the second write
+    amp._protocol = FakeProtocol({volume: [*_echo(volume), *_echo(power)]})
+
+    assert await async_pipeline(amp, 'monoprice6', [power, volume]) == []
+
+
+async def test_async_pipeline_rejected_command() -> None:
+    """Test an error reply fails the oldest outstanding command."""
+    good = zone_command('monoprice6', 11, 'power', True)
+    bad = zone_command('monoprice6', 19, 'power', True)
+    amp = MagicMock()
+    amp._protocol = FakeProtocol({good: _echo(good), bad: ['Command Error.\r\r\n#']})
+
+    assert await async_pipeline(amp, 'monoprice6', [good, bad]) == [bad]
+
+
+async def test_async_pipeline_window_and_timeout() -> None:
+    """Test writes stop at the window and a silent amp times out."""
+    commands = [zone_command('monoprice6', 11, 'volume', v) for v in range(10)]
+    amp = MagicMock()
+    amp._protocol = FakeProtocol({})
+
+    with pytest.raises(TimeoutError):
+        await async_pipeline(amp, 'monoprice6', commands, timeout=0.01)
+
+    written = amp._protocol.requests
+    assert 0 < len(written) < len(commands)
+    assert sum(len(command) for command in written) <= PIPELINE_WINDOW
+
+
+async def test_async_pipeline_timeout_reports_echoed() -> None:
+    """Test commands echoed before the amp went silent are reported."""
+    power = zone_command('monoprice6', 11, 'power', True)
+    volume = zone_command('monoprice6', 11, 'volume', 20)
+    amp = MagicMock()
+    amp._protocol = FakeProtocol({power: _echo(power)})
+
+    with pytest.raises(PipelineTimeout) as err:
+        await async_pipeline(amp, 'monoprice6', [power, volume], timeout=0.01)
+
+    assert err.value.echoed == [power]
+
+
+def test_pack_frames() -> None:
+    """Test commands are packed into frames within the xantech8 limit."""
+    assert supports_framing('xantech8')
+    assert not supports_framing('monoprice6')
+
+    # a seven command restore fits in two frames
+    commands = [
+        zone_command('xantech8', 11, attribute, value)
+        for attribute, value in (
+            ('power', True),
+            ('source', 3),
+            ('volume', 20),
+            ('mute', False),
+            ('bass', 7),
+            ('treble', 7),
+            ('balance', 10),
+        )
+    ]
+    frames = pack_frames('xantech8', commands)
+
+    assert len(frames) == 2
+    assert [command for frame in frames for command in frame] == commands
+    assert all(sum(map(len, frame)) <= 48 for frame in frames)
+    assert pack_frames('xantech8', []) == []
+
+
+async def test_async_send_frame() -> None:
+    """Test one frame is written and replies are matched in order."""
+    commands = [b'!11PR1+', b'!11SS3+', b'!19VO20+']
+    amp = MagicMock()
+    amp._protocol = FakeProtocol({b''.join(commands): ['OK\rOK\r', 'ERROR\r']})
+
+    assert await async_send_frame(amp, 'xantech8', commands) == [b'!19VO20+']
+    assert amp._protocol.requests == [b'!11PR1+!11SS3+!19VO20+']
+
+
+async def test_async_send_frame_timeout() -> None:
+    """Test a frame nobody answers raises a timeout."""
+    amp = MagicMock()
+    amp._protocol = FakeProtocol({})
+
+    with pytest.raises(TimeoutError):
+        await async_send_frame(amp, 'xantech8', [b'!11PR1+'], timeout=0.01)
+
+
+def test_attribute_query_frames() -> None:
+    """Test core attribute queries of many zones are packed into frames."""
+    assert supports_attribute_queries('xantech8')
+    assert not supports_attribute_queries('monoprice6')
+
+    frames = attribute_query_frames('xantech8', [11, 12, 13], CORE_ATTRIBUTES)
+
+    assert frames[0] == [
+        b'?11PR+',
+        b'?11SS+',
+        b'?11VO+',
+        b'?11MU+',
+        b'?12PR+',
+        b'?12SS+',
+        b'?12VO+',
+        b'?12MU+',
+    ]
+    assert sum(map(len, frames), 0) == 12
+    assert len(frames) == 2
+
+
+async def test_async_query_frame() -> None:
+    """Test attribute replies are parsed into typed zone attributes."""
+    queries = [b'?11PR+', b'?11VO+', b'?12MU+']
+    amp = MagicMock()
+    amp._protocol = FakeProtocol(
+        {b''.join(queries): ['?11PR1+\r?11VO', '07+\r?12MU0+\r']}
+    )
+
+    assert await async_query_frame(amp, 'xantech8', queries) == {
+        11: {'power': True, 'volume': 7},
+        12: {'mute': False},
+    }
+
+
+def test_clamp_level() -> None:
+    """Test levels are clamped to the limits of the amp type."""
+    assert clamp_level('monoprice6', 'balance', 50) == 20
+    assert clamp_level('xantech8', 'balance', 50) == 50
+    assert clamp_level('xantech8', 'volume', -3) == 0
+    assert clamp_level('xantech8', 'power', True) is True
+    assert clamp_level(None, 'balance', 99) == 99
@@ -0,0 +1,397 @@
+"""Tests for Xantech services."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    MockEntityPlatform,
+)
+
+from custom_components.xantech.const import (
+    DOMAIN,
+    SERVICE_APPLY_PRESET,
+    SERVICE_BULK_SET,
+    SERVICE_DELETE_PRESET,
+    SERVICE_RESTORE,
+    SERVICE_SAVE_PRESET,
+    SERVICE_SNAPSHOT,
+)
+from custom_components.xantech.coordinator import XantechCoordinator
+from custom_components.xantech.media_player import DATA_ZONE_INDEX, ZoneMediaPlayer
+from custom_components.xantech.services import (
+    BULK_SET_SCHEMA,
+    PRESET_SCHEMA,
+    SAVE_PRESET_SCHEMA,
+    ZONES_SCHEMA,
+    async_apply_preset,
+    async_bulk_set,
+    async_delete_preset,
+    async_restore,
+    async_save_preset,
+    async_snapshot,
+)
+from custom_components.xantech.storage import PresetStore, SnapshotStore
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant, mock_amp: MagicMock) -> XantechCoordinator:
+    """Create a coordinator with cached state for three zones."""
+    coordinator = XantechCoordinator(
+        hass=hass,
+        amp=mock_amp,
+        amp_name='test_amp',
+        zone_ids=[11, 12, 13],
+    )
+    coordinator.data = {
+        11: {'power': True, 'volume': 19, 'mute': False, 'source': 1},
+        12: {'power': False, 'volume': 10, 'mute': False, 'source': 2},
+        13: {'power': True, 'volume': 19, 'mute': False, 'source': 2},
+    }
+    return coordinator
+
+
+@pytest.fixture
+async def zone_platform(hass: HomeAssistant) -> AsyncGenerator[MockEntityPlatform]:
+    """Return the media player platform the zone entities are added to."""
+    platform = MockEntityPlatform(hass, domain='media_player', platform_name=DOMAIN)
+    yield platform
+    await platform.async_reset()
+
+
+@pytest.fixture
+async def zone_entities(
+    hass: HomeAssistant,
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+    zone_platform: MockEntityPlatform,
+) -> list[str]:
+    """Add the zone media players of a loaded config entry."""
+    entry = MockConfigEntry(domain=DOMAIN, entry_id='test_entry_id')
+    entry.add_to_hass(hass)
+    entry.mock_state(hass, ConfigEntryState.LOADED)
+    entry.runtime_data = MagicMock(
+        coordinator=coordinator,
+        amp=mock_amp,
+        sources={1: 'Sonos', 2: 'TV'},
+        presets=PresetStore(hass, entry.entry_id),
+        snapshots=SnapshotStore(hass, entry.entry_id),
+    )
+
+    entities = [
+        ZoneMediaPlayer(coordinator, entry, zone_id, f'Zone {zone_id}', {})
+        for zone_id in coordinator.zone_ids
+    ]
+    await zone_platform.async_add_entities(entities)
+    return [entity.entity_id for entity in entities]
+
+
+@pytest.fixture
+def zone_device(hass: HomeAssistant, zone_entities: list[str]) -> str:
+    """Put two zones on one device, with a tone number and a foreign entity."""
+    entry = hass.config_entries.async_get_entry('test_entry_id')
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, 'test_unit_1')}
+    )
+    registry = er.async_get(hass)
+    for entity_id in zone_entities[:2]:
+        registry.async_update_entity(entity_id, device_id=device.id)
+    registry.async_get_or_create(
+        'number', DOMAIN, 'zone_11_bass', config_entry=entry, device_id=device.id
+    )
+    registry.async_get_or_create('light', 'other', 'lamp', device_id=device.id)
+    return device.id
+
+
+def _call(hass: HomeAssistant, **data: Any) -> ServiceCall:
+    return ServiceCall(
+        hass, DOMAIN, SERVICE_BULK_SET, BULK_SET_SCHEMA(data), return_response=True
+    )
+
+
+async def test_bulk_set_skips_unchanged_attributes(
+    hass: HomeAssistant,
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+    zone_entities: list[str],
+) -> None:
+    """Test only attributes differing from the cached state are written."""
+    response = await async_bulk_set(
+        hass,
+        _call(
+            hass,
+            **{ATTR_ENTITY_ID: zone_entities},
+            power=True,
+            source='TV',
+            volume_level=0.5,
+        ),
+    )
+
+    # zone 11 needs the source, zone 12 power and volume, zone 13 nothing
+    mock_amp.set_power.assert_awaited_once_with(12, True)
+    mock_amp.set_source.assert_awaited_once_with(11, 2)
+    assert mock_amp.set_volume.await_count == 1
+    mock_amp.set_volume.assert_awaited_with(12, 19)
+    assert response == {
+        'zones': 3,
+        'requested_writes': 9,
+        'writes': 3,
+        'bus_operations': 3,
+        'saved_writes': 6,
+    }
+    assert coordinator.data[12] == {
+        'power': True,
+        'volume': 19,
+        'mute': False,
+        'source': 2,
+    }
+
+
+async def test_bulk_set_powers_on_first(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+    zone_entities: list[str],
+) -> None:
+    """Test zones are powered on before other attributes are written."""
+    await async_bulk_set(
+        hass, _call(hass, **{ATTR_ENTITY_ID: zone_entities}, power=True, mute=True)
+    )
+
+    assert [(name, args) for name, args, _ in mock_amp.mock_calls] == [
+        ('set_power', (12, True)),
+        ('set_mute', (11, True)),
+        ('set_mute', (12, True)),
+        ('set_mute', (13, True)),
+    ]
+
+
+async def test_bulk_set_validation(
+    hass: HomeAssistant,
+    zone_entities: list[str],
+) -> None:
+    """Test invalid requests are rejected before anything is written."""
+    with pytest.raises(ServiceValidationError):
+        await async_bulk_set(hass, _call(hass, **{ATTR_ENTITY_ID: zone_entities}))
+
+    with pytest.raises(ServiceValidationError):
+        await async_bulk_set(
+            hass,
+            _call(hass, **{ATTR_ENTITY_ID: zone_entities}, source='Turntable'),
+        )
+
+    with pytest.raises(ServiceValidationError):
+        await async_bulk_set(
+            hass, _call(hass, **{ATTR_ENTITY_ID: ['media_player.other']}, power=True)
+        )
+
+
+async def test_presets(
+    hass: HomeAssistant,
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+    zone_entities: list[str],
+) -> None:
+    """Test a saved preset is re-applied with only the differing writes."""
+    await async_save_preset(
+        hass,
+        ServiceCall(
+            hass,
+            DOMAIN,
+            SERVICE_SAVE_PRESET,
+            SAVE_PRESET_SCHEMA({ATTR_ENTITY_ID: zone_entities[:2], 'name': 'dinner'}),
+        ),
+    )
+    apply_call = ServiceCall(
+        hass,
+        DOMAIN,
+        SERVICE_APPLY_PRESET,
+        PRESET_SCHEMA({'name': 'dinner'}),
+        return_response=True,
+    )
+
+    # the preset is still active: nothing goes on the bus
+    response = await async_apply_preset(hass, apply_call)
+    assert response['requested_writes'] == 8
+    assert response['writes'] == 0
+    assert response['bus_operations'] == 0
+    assert not mock_amp.mock_calls
+
+    # one zone drifted: only its changes are sent
+    coordinator.data = {**coordinator.data, 12: {**coordinator.data[12]}}
+    coordinator.data[12].update(power=True, volume=30)
+    response = await async_apply_preset(hass, apply_call)
+
+    assert response['writes'] == 2
+    assert [(name, args) for name, args, _ in mock_amp.mock_calls] == [
+        ('set_volume', (12, 10)),
+        ('set_power', (12, False)),
+    ]
+
+    delete_call = ServiceCall(
+        hass, DOMAIN, SERVICE_DELETE_PRESET, PRESET_SCHEMA({'name': 'dinner'})
+    )
+    await async_delete_preset(hass, delete_call)
+    with pytest.raises(ServiceValidationError):
+        await async_apply_preset(hass, apply_call)
+    with pytest.raises(ServiceValidationError):
+        await async_delete_preset(hass, delete_call)
+
+
+async def test_snapshot_and_restore(
+    hass: HomeAssistant,
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+    zone_entities: list[str],
+) -> None:
+    """Test snapshots come from the cache and restore only what changed."""
+    snapshot_call = ServiceCall(
+        hass, DOMAIN, SERVICE_SNAPSHOT, ZONES_SCHEMA({ATTR_ENTITY_ID: zone_entities})
+    )
+    await async_snapshot(hass, snapshot_call)
+    assert not mock_amp.mock_calls
+
+    # an announcement takes over every zone
+    await async_bulk_set(
+        hass,
+        _call(hass, **{ATTR_ENTITY_ID: zone_entities}, power=True, source='Sonos'),
+    )
+    mock_amp.reset_mock()
+
+    response = await async_restore(
+        hass,
+        ServiceCall(
+            hass,
+            DOMAIN,
+            SERVICE_RESTORE,
+            ZONES_SCHEMA({ATTR_ENTITY_ID: zone_entities}),
+            return_response=True,
+        ),
+    )
+
+    assert [(name, args) for name, args, _ in mock_amp.mock_calls] == [
+        ('set_source', (12, 2)),
+        ('set_source', (13, 2)),
+        ('set_power', (12, False)),
+    ]
+    assert response['zones'] == 3
+    assert response['writes'] == 3
+    assert coordinator.data[12]['power'] is False
+
+
+async def test_restore_without_snapshot(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+    zone_entities: list[str],
+) -> None:
+    """Test restoring zones that were never snapshotted is rejected."""
+    with pytest.raises(ServiceValidationError):
+        await async_restore(
+            hass,
+            ServiceCall(
+                hass,
+                DOMAIN,
+                SERVICE_RESTORE,
+                ZONES_SCHEMA({ATTR_ENTITY_ID: zone_entities}),
+            ),
+        )
+    assert not mock_amp.mock_calls
+
+
+async def test_zone_index_follows_entities(
+    hass: HomeAssistant,
+    zone_platform: MockEntityPlatform,
+    zone_entities: list[str],
+) -> None:
+    """Test zones are resolved through the entity_id index while added."""
+    index = hass.data[DATA_ZONE_INDEX]
+    assert [index[entity_id][1] for entity_id in zone_entities] == [11, 12, 13]
+
+    await zone_platform.async_remove_entity(zone_entities[0])
+
+    assert zone_entities[0] not in index
+    with pytest.raises(ServiceValidationError):
+        await async_bulk_set(
+            hass, _call(hass, **{ATTR_ENTITY_ID: zone_entities[0]}, power=True)
+        )
+
+
+async def test_bulk_set_device_target(
+    hass: HomeAssistant,
+    mock_amp: MagicMock,
+    zone_device: str,
+) -> None:
+    """Test a device target sets its zones and skips its other entities."""
+    response = await async_bulk_set(
+        hass, _call(hass, device_id=zone_device, source='TV')
+    )
+
+    mock_amp.set_source.assert_awaited_once_with(11, 2)
+    assert response['zones'] == 2
+
+
+async def test_snapshot_and_restore_device_target(
+    hass: HomeAssistant,
+    coordinator: XantechCoordinator,
+    mock_amp: MagicMock,
+    zone_device: str,
+) -> None:
+    """Test snapshot and restore accept a device with non-zone entities."""
+    await async_snapshot(
+        hass,
+        ServiceCall(
+            hass, DOMAIN, SERVICE_SNAPSHOT, ZONES_SCHEMA({'device_id': zone_device})
+        ),
+    )
+    coordinator.data = {**coordinator.data, 12: {**coordinator.data[12], 'volume': 30}}
+
+    response = await async_restore(
+        hass,
+        ServiceCall(
+            hass,
+            DOMAIN,
+            SERVICE_RESTORE,
+            ZONES_SCHEMA({'device_id': zone_device}),
+            return_response=True,
+        ),
+    )
+
+    assert response['zones'] == 2
+    mock_amp.set_volume.assert_awaited_once_with(12, 10)
+
+
+async def test_bulk_set_clamps_levels(
+    hass: HomeAssistant,
+    coordinator: XantechCoordinator,
+    zone_entities: list[str],
+) -> None:
+    """Test levels beyond the device limit are cached as the amp applies them."""
+    coordinator.amp_type = 'xantech8'
+    call = _call(hass, **{ATTR_ENTITY_ID: zone_entities[0]}, bass=7, balance=80)
+
+    with patch(
+        'custom_components.xantech.coordinator.async_send_frame',
+        new_callable=AsyncMock,
+        return_value=[],
+    ) as mock_frame:
+        response = await async_bulk_set(hass, call)
+        assert mock_frame.await_args.args[2] == [b'!11BS07+', b'!11BA63+']
+        assert coordinator.data[11]['balance'] == 63
+        # two writes in one frame: the diff saved nothing
+        assert response['writes'] == 2
+        assert response['bus_operations'] == 1
+        assert response['saved_writes'] == 0
+
+        # asking again for the same out of range value writes nothing
+        response = await async_bulk_set(hass, call)
+        assert response['writes'] == 0
+        assert response['saved_writes'] == 2
+        assert mock_frame.await_count == 1
@@ -0,0 +1,49 @@
+"""Tests for Xantech transport statistics."""
+
+from __future__ import annotations
+
+from custom_components.xantech.stats import LatencyHistogram, TransportStats
+
+
+def test_latency_histogram_buckets() -> None:
+    """Test samples land in fixed buckets by upper bound."""
+    histogram = LatencyHistogram()
+    for seconds in (0.005, 0.010, 0.040, 0.040, 7.5):
+        histogram.record(seconds)
+
+    result = histogram.as_dict()
+    assert result['count'] == 5
+    assert result['buckets']['le_10ms'] == 2
+    assert result['buckets']['le_50ms'] == 2
+    assert result['buckets']['overflow'] == 1
+    assert result['max_ms'] == 7500.0
+    assert histogram.last_ms == 7500.0
+
+
+def test_latency_histogram_percentile() -> None:
+    """Test percentiles report the bucket bound holding the rank."""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(95) is None
+
+    for _ in range(19):
+        histogram.record(0.020)
+    assert histogram.percentile(50) == 20.0
+    histogram.record(0.300)
+
+    assert histogram.percentile(50) == 25
+    assert histogram.percentile(95) == 25
+    assert histogram.percentile(100) == 300.0
+
+
+def test_transport_stats() -> None:
+    """Test samples are aggregated per operation and per kind."""
+    stats = TransportStats()
+    stats.record('zone_status', 'poll', 0.05)
+    stats.record('unit_status', 'poll', 0.2)
+    stats.record_timeout()
+
+    result = stats.as_dict()
+    assert list(result['operations']) == ['unit_status', 'zone_status']
+    assert result['kinds']['poll']['count'] == 2
+    assert result['timeouts'] == 1
+    assert result['errors'] == 0
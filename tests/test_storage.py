@@ -0,0 +1,95 @@
+"""Tests for the Xantech zone state cache."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.xantech.storage import (
+    SAVE_DELAY,
+    SNAPSHOT_SAVE_DELAY,
+    PresetStore,
+    SnapshotStore,
+    ZoneStateStore,
+)
+
+
+async def test_zone_state_store_round_trip(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test zone states survive a save and load with integer zone ids."""
+    store = ZoneStateStore(hass, 'entry_1')
+    assert await store.async_load() == {}
+
+    store.async_save({11: {'power': True, 'volume': 20}})
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+
+    assert hass_storage['xantech.entry_1.zones']['data'] == {
+        '11': {'power': True, 'volume': 20}
+    }
+    assert await ZoneStateStore(hass, 'entry_1').async_load() == {
+        11: {'power': True, 'volume': 20}
+    }
+
+    await store.async_remove()
+    assert 'xantech.entry_1.zones' not in hass_storage
+
+
+async def test_preset_store_round_trip(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test presets are saved immediately and loaded with integer zone ids."""
+    store = PresetStore(hass, 'entry_1')
+    await store.async_load()
+    assert store.presets == {}
+
+    await store.async_save_preset('party', {11: {'power': True, 'volume': 30}})
+    assert hass_storage['xantech.entry_1.presets']['data'] == {
+        'party': {'11': {'power': True, 'volume': 30}}
+    }
+
+    loaded = PresetStore(hass, 'entry_1')
+    await loaded.async_load()
+    assert loaded.presets == {'party': {11: {'power': True, 'volume': 30}}}
+
+    assert await loaded.async_delete_preset('party')
+    assert not await loaded.async_delete_preset('party')
+    assert hass_storage['xantech.entry_1.presets']['data'] == {}
+
+
+async def test_snapshot_store_round_trip(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test snapshots replace per zone and survive a save and load."""
+    store = SnapshotStore(hass, 'entry_1')
+    await store.async_load()
+    assert store.snapshots == {}
+
+    store.async_save_snapshots({11: {'power': True}, 12: {'power': False}})
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    store.async_save_snapshots({12: {'power': True, 'volume': 5}})
+    assert store.snapshots == {11: {'power': True}, 12: {'power': True, 'volume': 5}}
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=2 * SNAPSHOT_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert hass_storage['xantech.entry_1.snapshots']['data'] == {
+        '11': {'power': True},
+        '12': {'power': True, 'volume': 5},
+    }
+
+    loaded = SnapshotStore(hass, 'entry_1')
+    await loaded.async_load()
+    assert loaded.snapshots == store.snapshots
+
+    await store.async_remove()
+    assert 'xantech.entry_1.snapshots' not in hass_storage